@@ -0,0 +1,51 @@
+"""Micro-benchmark of `BaseSchema.get_artifact` against generating the artifact
+dataclass on every call.
+
+    python -m benchmarks.bench_artifact
+"""
+
+# External imports
+from dataclasses import dataclass, fields, make_dataclass
+
+# Local imports
+from ror.schemas import ArtifactSchema, BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.utils._const import FIELD_PERSISTANCE
+
+from .common import per_call, report
+
+
+@dataclass
+class BenchSchema(BaseSchema):
+    A: str = field_persistance()
+    B: str = field_perishable()
+    C: int = field_perishable()
+    D: list = field_persistance()
+
+
+def _uncached_artifact(schema: BaseSchema) -> ArtifactSchema:
+    _fields = [
+        (v.name, v.type) for v in fields(schema) if not v.metadata[FIELD_PERSISTANCE]
+    ]
+    _values = {name: getattr(schema, name) for name, _ in _fields}
+
+    return make_dataclass("Artifact", fields=_fields, bases=(ArtifactSchema,))(
+        **_values, source_schema=schema.__class__
+    )
+
+
+def main() -> None:
+    schema = BenchSchema(A="A", B="B", C=1, D=[])
+
+    uncached = per_call(lambda: _uncached_artifact(schema), number=200)
+    cached = per_call(schema.get_artifact, number=2000)
+
+    report(
+        "get_artifact",
+        [("make_dataclass per call", uncached), ("cached artifact class", cached)],
+    )
+    print(f"  speedup: {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
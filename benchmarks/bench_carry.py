@@ -0,0 +1,74 @@
+"""Per-call cost of building the output schema of a stage from its input schema
+and a few computed fields, spreading `get_carry` into a new dictionary against
+the generated constructor of `carry_to`, on wide schemas.
+
+    python -m benchmarks.bench_carry
+"""
+
+# External imports
+from dataclasses import make_dataclass
+
+# Local imports
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+
+from .common import per_call, report
+
+
+def make_schemas(n_fields: int) -> tuple:
+    """Builds an input schema with `n_fields` fields, alternating persistant and
+    perishable fields, and an output schema with its persistant fields and two
+    computed fields.
+    """
+    source = make_dataclass(
+        f"Source{n_fields}",
+        fields=[
+            (
+                f"f{i}",
+                int,
+                field_persistance() if i % 2 == 0 else field_perishable(),
+            )
+            for i in range(n_fields)
+        ],
+        bases=(BaseSchema,),
+    )
+    target = make_dataclass(
+        f"Target{n_fields}",
+        fields=[(f"f{i}", int, field_persistance()) for i in range(0, n_fields, 2)]
+        + [("y", int, field_persistance()), ("z", int, field_persistance())],
+        bases=(BaseSchema,),
+    )
+
+    return source, target
+
+
+def main() -> None:
+    for n_fields in (4, 32, 128, 512):
+        source, target = make_schemas(n_fields)
+        schema = source(**{f"f{i}": i for i in range(n_fields)})
+        number = max(100, 40000 // n_fields)
+
+        report(
+            f"{n_fields} fields",
+            [
+                (
+                    "target(**{**get_carry(), ...})",
+                    per_call(
+                        lambda: target(**{**schema.get_carry(), "y": 1, "z": 2}),
+                        number,
+                    ),
+                ),
+                (
+                    "carry_to(target, ...)",
+                    per_call(lambda: schema.carry_to(target, y=1, z=2), number),
+                ),
+                (
+                    "carry_to(target, ...) overriding f0",
+                    per_call(lambda: schema.carry_to(target, f0=0, y=1, z=2), number),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
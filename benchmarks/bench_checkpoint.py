@@ -0,0 +1,71 @@
+"""Latency of `BaseController.start` for a pipeline with a 8 MB output per stage,
+without checkpoints, with checkpoints written in the foreground and with the
+default background writes of the `DiskCheckpointStore`.
+
+    python -m benchmarks.bench_checkpoint
+"""
+
+# External imports
+import tempfile
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.checkpoints import DiskCheckpointStore
+from ror.controlers import BaseController
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_persistance
+from ror.stages import IForwardStage, IInitStage, ITerminalStage
+from ror.stores import NullArtifactStore
+
+from .common import per_call, report
+
+PAYLOAD = bytes(8 * 2**20)
+
+
+@dataclass
+class BenchSchema(BaseSchema):
+    X: bytes = field_persistance()
+
+
+class TerminalStage(ITerminalStage[BenchSchema, BenchSchema]):
+    def get_output(self) -> BenchSchema:
+        return self.input
+
+
+class ForwardStage(IForwardStage[BenchSchema, BenchSchema, TerminalStage]):
+    def get_output(self) -> Tuple[TerminalStage, BenchSchema]:
+        return TerminalStage(), BenchSchema(X=self.input.X)
+
+
+class InitStage(IInitStage[BenchSchema, BenchSchema, ForwardStage]):
+    def get_output(self) -> Tuple[ForwardStage, BenchSchema]:
+        return ForwardStage(), BenchSchema(X=self.input.X)
+
+
+def main() -> None:
+    data = BenchSchema(X=PAYLOAD)
+    rows = []
+
+    with tempfile.TemporaryDirectory() as root:
+        for label, store in (
+            ("no checkpoints", None),
+            ("foreground writes", DiskCheckpointStore(root, background=False)),
+            ("background writes", DiskCheckpointStore(root)),
+        ):
+            controller = BaseController(
+                data,
+                InitStage,
+                artifact_store=NullArtifactStore(),
+                checkpoint_store=store,
+            )
+            rows.append((label, per_call(controller.start, number=20)))
+
+            if store is not None:
+                store.flush()
+
+    report("start (3 stages, 8 MB per output)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Startup cost of `import ror.controlers`, as measured by `python -X importtime`
+in fresh interpreters, against a regression budget. Also checks that the heavy
+optional dependencies are not imported until they are used.
+
+    python -m benchmarks.bench_import [--budget MS] [--runs N]
+
+Exits with a non-zero status if the median import time is over the budget, or if
+one of the lazily imported modules is imported, such that it can gate CI.
+"""
+
+# External imports
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Budget of the cumulative import time of `ror.controlers` in milliseconds. It was
+# about 95ms when the budget was set, down from 170ms with rich, asyncio and
+# multiprocessing imported eagerly, pass `--budget` on slower machines
+DEFAULT_BUDGET = 130.0
+
+# Modules which are only imported when used, e.g. rich by `discover` and `report`
+LAZY_MODULES = ("rich", "asyncio", "concurrent.futures", "multiprocessing")
+
+STATEMENT = "import ror.controlers"
+
+
+def import_times(statement: str = STATEMENT) -> Dict[str, Tuple[int, int]]:
+    """Runs a statement in a fresh interpreter with `-X importtime`.
+
+    Parameters
+    ----------
+    statement : str, optional
+        Statement to run, by default `import ror.controlers`
+
+    Returns
+    -------
+    Dict[str, Tuple[int, int]]
+        Self and cumulative import time in microseconds, keyed by module name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Header line
+
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return times
+
+
+def lazy_imported(statement: str = STATEMENT) -> List[str]:
+    """Returns the lazily imported modules which a statement imports anyway."""
+    check = (
+        f"{statement}; import sys; "
+        f"print(*[m for m in {LAZY_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+
+    return result.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET)
+    parser.add_argument("--runs", type=int, default=9)
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    median = statistics.median(times["ror.controlers"][1] for times in runs) / 1e3
+
+    # Heaviest modules by self time in the median run
+    last = runs[len(runs) // 2]
+    heaviest = sorted(last.items(), key=lambda item: item[1][0], reverse=True)[:10]
+
+    print(f"{STATEMENT}: {median:.1f} ms median over {args.runs} runs")
+    for name, (self_us, cumulative_us) in heaviest:
+        print(
+            f"  {name:<45} {self_us / 1e3:>7.2f} ms self {cumulative_us / 1e3:>8.2f} ms"
+        )
+
+    failures = []
+    if median > args.budget:
+        failures.append(f"{median:.1f} ms is over the budget of {args.budget:.1f} ms")
+
+    imported = lazy_imported()
+    if imported:
+        failures.append(f"lazily imported modules were imported: {imported}")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
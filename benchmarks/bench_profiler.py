@@ -0,0 +1,66 @@
+"""Micro-benchmark of the overhead of the `TimingProfiler` per stage, over a
+pipeline of no-op stages run without artifacts.
+
+    python -m benchmarks.bench_profiler
+"""
+
+# External imports
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.controlers import BaseController
+from ror.profilers import TimingProfiler
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_persistance
+from ror.stages import IForwardStage, IInitStage, ITerminalStage
+from ror.stores import NullArtifactStore
+
+from .common import per_call, report
+
+
+@dataclass
+class BenchSchema(BaseSchema):
+    A: int = field_persistance()
+
+
+class TerminalStage(ITerminalStage[BenchSchema, BenchSchema]):
+    def get_output(self) -> BenchSchema:
+        return self.input
+
+
+class ForwardStage(IForwardStage[BenchSchema, BenchSchema, TerminalStage]):
+    def get_output(self) -> Tuple[TerminalStage, BenchSchema]:
+        return TerminalStage(), self.input
+
+
+class InitStage(IInitStage[BenchSchema, BenchSchema, ForwardStage]):
+    def get_output(self) -> Tuple[ForwardStage, BenchSchema]:
+        return ForwardStage(), self.input
+
+
+def main() -> None:
+    data = BenchSchema(A=1)
+    store = NullArtifactStore()
+
+    disabled = BaseController(data, InitStage, artifact_store=store)
+    wall = BaseController(
+        data, InitStage, artifact_store=store, profiler=TimingProfiler(cpu=False)
+    )
+    wall_cpu = BaseController(
+        data, InitStage, artifact_store=store, profiler=TimingProfiler()
+    )
+
+    plain = per_call(disabled.start, number=5000)
+    rows = [
+        ("TimingProfiler(cpu=False)", per_call(wall.start, number=5000)),
+        ("TimingProfiler()", per_call(wall_cpu.start, number=5000)),
+    ]
+
+    report("start (3 stages)", [("no profiler", plain)] + rows)
+    for label, seconds in rows:
+        print(f"  overhead per stage, {label}: {(seconds - plain) / 3 * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Per-call cost of the schema carry and artifact methods when recomputing the
+field layout on every call against the precomputed `SchemaLayout`.
+
+    python -m benchmarks.bench_schema_layout
+"""
+
+# External imports
+from dataclasses import fields, make_dataclass
+
+# Local imports
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.utils._const import FIELD_PERSISTANCE
+
+from .common import per_call, report
+
+
+def make_schema(n_fields: int) -> type:
+    """Builds a schema class with `n_fields` fields, alternating persistant and
+    perishable fields.
+    """
+    return make_dataclass(
+        f"Schema{n_fields}",
+        fields=[
+            (
+                f"f{i}",
+                int,
+                field_persistance() if i % 2 == 0 else field_perishable(),
+            )
+            for i in range(n_fields)
+        ],
+        bases=(BaseSchema,),
+    )
+
+
+def _carry_before(schema: BaseSchema) -> dict:
+    _perishables = [v.name for v in fields(schema) if not v.metadata[FIELD_PERSISTANCE]]
+    _temp = schema.__dict__.copy()
+    for name in _perishables:
+        _temp.pop(name)
+
+    return _temp
+
+
+def _artifact_before(schema: BaseSchema) -> object:
+    _perishables = [v.name for v in fields(schema) if not v.metadata[FIELD_PERSISTANCE]]
+    _base_fields = [v.name for v in fields(schema)]
+    _types = {v.name: v.type for v in fields(schema)}
+    _fields = [(n, t) for n, t in _types.items() if n in _perishables]
+
+    _temp = schema.__dict__.copy()
+    for name in set(_base_fields) - set(_perishables):
+        _temp.pop(name)
+
+    return schema._layout.artifact_class(**_temp, source_schema=schema.__class__)
+
+
+def _validate_before(schema: BaseSchema, retire: set) -> None:
+    _fields = set(v.name for v in fields(schema))
+    if len(retire.intersection(_fields)) != len(retire):
+        raise Exception(retire - _fields)
+
+
+def main() -> None:
+    for n_fields in (5, 50, 500):
+        schema_class = make_schema(n_fields)
+        schema = schema_class(**{f"f{i}": i for i in range(n_fields)})
+        retire = {f"f{i}" for i in range(0, n_fields, 2)}
+        number = max(100, 20000 // n_fields)
+
+        report(
+            f"{n_fields} fields",
+            [
+                ("get_carry (before)", per_call(lambda: _carry_before(schema), number)),
+                ("get_carry (layout)", per_call(schema.get_carry, number)),
+                (
+                    "get_artifact (before)",
+                    per_call(lambda: _artifact_before(schema), number),
+                ),
+                ("get_artifact (layout)", per_call(schema.get_artifact, number)),
+                (
+                    "_validate_retire (before)",
+                    per_call(lambda: _validate_before(schema, retire), number),
+                ),
+                (
+                    "_validate_retire (layout)",
+                    per_call(lambda: schema._validate_retire(retire), number),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
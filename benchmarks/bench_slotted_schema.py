@@ -0,0 +1,87 @@
+"""Bytes per record of dict-backed against slotted schemas, measured with
+`tracemalloc` over many small records held at once, e.g. in flight through a
+stream or a batch, along with the per-call cost of `get_carry`.
+
+    python -m benchmarks.bench_slotted_schema
+"""
+
+# External imports
+import gc
+import tracemalloc
+from dataclasses import make_dataclass
+
+# Local imports
+from ror.schemas import BaseSchema, slotted_schema
+from ror.schemas.fields import field_perishable, field_persistance
+
+from .common import per_call, report
+
+N_RECORDS = 100_000
+
+
+def make_schema(n_fields: int, slotted: bool) -> type:
+    """Builds a schema class with `n_fields` int fields, alternating persistant and
+    perishable fields, optionally slotted.
+    """
+    schema = make_dataclass(
+        f"{'Slotted' if slotted else 'Dict'}{n_fields}",
+        fields=[
+            (
+                f"f{i}",
+                int,
+                field_persistance() if i % 2 == 0 else field_perishable(),
+            )
+            for i in range(n_fields)
+        ],
+        bases=(BaseSchema,),
+    )
+
+    return slotted_schema(schema) if slotted else schema
+
+
+def bytes_per_record(schema: type, n_fields: int) -> float:
+    """Measures the bytes allocated per record for `N_RECORDS` records."""
+    # Small ints are cached, the values themselves are not part of the measure
+    values = {f"f{i}": i for i in range(n_fields)}
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    records = [schema(**values) for _ in range(N_RECORDS)]
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The list holding the records is not part of their size
+    return (after - before) / len(records) - 8
+
+
+def main() -> None:
+    print(f"bytes per record ({N_RECORDS} records)")
+
+    for n_fields in (2, 4, 8, 16):
+        dict_backed = bytes_per_record(make_schema(n_fields, False), n_fields)
+        slotted = bytes_per_record(make_schema(n_fields, True), n_fields)
+
+        print(
+            f"  {n_fields:>2} fields    dict {dict_backed:>8.1f}    "
+            f"slotted {slotted:>8.1f}    saved {1 - slotted / dict_backed:>6.1%}"
+        )
+
+    for n_fields in (4, 16):
+        values = {f"f{i}": i for i in range(n_fields)}
+        dict_record = make_schema(n_fields, False)(**values)
+        slotted_record = make_schema(n_fields, True)(**values)
+
+        report(
+            f"get_carry ({n_fields} fields)",
+            [
+                ("dict", per_call(dict_record.get_carry, 20000)),
+                ("slotted", per_call(slotted_record.get_carry, 20000)),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# External imports
+import timeit
+from typing import Callable, Iterable, Tuple
+
+
+def per_call(fn: Callable[[], object], number: int = 1000, repeat: int = 5) -> float:
+    """Measures the best per-call time of a callable over several repeats.
+
+    Parameters
+    ----------
+    fn : Callable[[], object]
+        Zero-argument callable to measure.
+    number : int, optional
+        Calls per repeat, by default 1000
+    repeat : int, optional
+        Number of repeats, the fastest is kept, by default 5
+
+    Returns
+    -------
+    float
+        Seconds per call.
+    """
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def report(title: str, rows: Iterable[Tuple[str, float]]) -> None:
+    """Prints a simple table of per-call timings in microseconds.
+
+    Parameters
+    ----------
+    title : str
+        Title printed above the rows.
+    rows : Iterable[Tuple[str, float]]
+        Pairs of row label and seconds per call.
+    """
+    print(title)
+    for label, seconds in rows:
+        print(f"  {label:<40} {seconds * 1e6:>10.2f} us/call")
@@ -0,0 +1,479 @@
+"""Benchmark suite of the hot paths, writing machine-readable results which can be
+compared against a stored baseline to catch performance regressions.
+
+    python -m benchmarks.suite [--output results.json] [--baseline FILE]
+                               [--tolerance 0.25] [--groups schema,controller]
+                               [--quick] [--save-baseline]
+
+Groups:
+    schema      `get_carry` / `get_artifact` across field counts and payload sizes
+    controller  `BaseController.start` overhead for pipelines of 1 to 100 stages
+    artifacts   memory growth of the artifact store over many runs
+    scaling     batch sizes of `start_batch` and worker counts of a process pool
+
+The results file maps every measurement name to its value and unit. With a
+baseline, measurements slower (or larger) than the baseline by more than the
+tolerance are reported as regressions and the exit status is non-zero. Times and
+throughputs are normalised by a calibration workload measured in the same run,
+which absorbs a machine being uniformly slower, but baselines remain best compared
+on the machine they were saved on, `--save-baseline` overwrites the stored one.
+"""
+
+# External imports
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import types
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Local imports
+from ror.controlers import BaseController
+from ror.controlers.common import ProcessStagePool
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import (
+    IBatchStage,
+    IForwardStage,
+    IInitStage,
+    IProcessStage,
+    ITerminalStage,
+)
+from ror.stores import MemoryArtifactStore, NullArtifactStore
+
+from .bench_schema_layout import make_schema
+from .common import per_call
+
+# Baseline stored next to the suite
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+class Measurement(NamedTuple):
+    """One measurement of the suite, where lower values are better unless
+    `higher_is_better` is set, e.g. for throughputs.
+    """
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+"""================================ SCHEMAS ================================"""
+
+
+def bench_schema(quick: bool) -> List[Measurement]:
+    """`get_carry` and `get_artifact` across field counts, and across payload
+    sizes which should not matter as the values are never copied.
+    """
+    results = []
+
+    for n_fields in (4, 32, 256):
+        schema = make_schema(n_fields)(**{f"f{i}": i for i in range(n_fields)})
+        number = max(50, (2000 if quick else 20000) // n_fields)
+
+        for method in ("get_carry", "get_artifact"):
+            seconds = per_call(getattr(schema, method), number)
+            results.append(
+                Measurement(f"schema.{method}[fields={n_fields}]", seconds * 1e6, "us")
+            )
+
+    for payload in (0, 1024, 1024**2):
+        schema = make_schema(8)(**{f"f{i}": bytes(payload) for i in range(8)})
+
+        for method in ("get_carry", "get_artifact"):
+            seconds = per_call(getattr(schema, method), 2000 if quick else 20000)
+            results.append(
+                Measurement(f"schema.{method}[payload={payload}]", seconds * 1e6, "us")
+            )
+
+    return results
+
+
+"""============================== CONTROLLER ==============================="""
+
+
+@dataclass
+class BenchSchema(BaseSchema):
+    A: int = field_persistance()
+    B: bytes = field_perishable()
+
+
+def _get_output(next_stage: Optional[type]) -> Callable:
+    if next_stage is None:
+        return lambda self: self.input
+
+    return lambda self: (next_stage(), self.input)
+
+
+def make_pipeline(n_stages: int) -> type:
+    """Generates a chain of `n_stages` no-op stages and returns its init stage,
+    which is its own terminal stage when there is a single stage.
+    """
+    next_stage = None
+
+    for i in reversed(range(n_stages)):
+        if next_stage is None:
+            base = ITerminalStage[BenchSchema, BenchSchema]
+        elif i == 0:
+            base = IInitStage[BenchSchema, BenchSchema, next_stage]
+        else:
+            base = IForwardStage[BenchSchema, BenchSchema, next_stage]
+
+        namespace = {"get_output": _get_output(next_stage), "__module__": __name__}
+        next_stage = types.new_class(
+            f"Stage{n_stages}_{i}", (base,), exec_body=lambda ns: ns.update(namespace)
+        )
+
+    return next_stage
+
+
+def bench_controller(quick: bool) -> List[Measurement]:
+    """Overhead of `BaseController.start` over chains of no-op stages, without
+    artifacts and with a bounded artifact store.
+    """
+    results = []
+    data = BenchSchema(A=1, B=b"")
+
+    for n_stages in (1, 2, 10, 100):
+        init_stage = make_pipeline(n_stages)
+        number = max(20, (500 if quick else 5000) // n_stages)
+
+        for label, store in (
+            ("null", NullArtifactStore()),
+            ("memory", MemoryArtifactStore(max_runs=100)),
+        ):
+            controller = BaseController(data, init_stage, artifact_store=store)
+            seconds = per_call(controller.start, number)
+
+            results.append(
+                Measurement(
+                    f"controller.start[stages={n_stages},store={label}]",
+                    seconds * 1e6,
+                    "us",
+                )
+            )
+            results.append(
+                Measurement(
+                    f"controller.start_per_stage[stages={n_stages},store={label}]",
+                    seconds / n_stages * 1e6,
+                    "us",
+                )
+            )
+
+    return results
+
+
+"""=============================== ARTIFACTS ==============================="""
+
+
+def _traced_growth(controller: BaseController, runs: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    for _ in range(runs):
+        controller.start()
+
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return after - before
+
+
+def bench_artifacts(quick: bool) -> List[Measurement]:
+    """Bytes retained per run by the artifact store of a 10 stage pipeline with a
+    1KiB perishable payload, unbounded and bounded to the last 100 runs.
+    """
+    results = []
+    runs = 500 if quick else 2000
+    init_stage = make_pipeline(10)
+
+    for label, store in (
+        ("unbounded", MemoryArtifactStore()),
+        ("max_runs=100", MemoryArtifactStore(max_runs=100)),
+        ("null", NullArtifactStore()),
+    ):
+        data = BenchSchema(A=1, B=bytes(1024))
+        controller = BaseController(data, init_stage, artifact_store=store)
+        controller.start()  # Warm up the plan and the generated classes
+
+        growth = _traced_growth(controller, runs)
+        results.append(
+            Measurement(f"artifacts.bytes_per_run[{label}]", growth / runs, "bytes")
+        )
+
+    return results
+
+
+"""================================ SCALING ================================"""
+
+
+# Iterations of the CPU-bound stage, about a millisecond of pure Python
+WORK = 20_000
+
+
+class CpuTerminalStage(ITerminalStage[BenchSchema, BenchSchema]):
+    def get_output(self) -> BenchSchema:
+        return self.input
+
+
+class CpuStage(
+    IForwardStage[BenchSchema, BenchSchema, CpuTerminalStage], IProcessStage
+):
+    def compute(self) -> None:
+        self._output = BenchSchema(A=sum(range(WORK)) + self.input.A, B=b"")
+
+    def get_output(self) -> Tuple[CpuTerminalStage, BenchSchema]:
+        return CpuTerminalStage(), self._output
+
+
+class CpuInitStage(IInitStage[BenchSchema, BenchSchema, CpuStage]):
+    def get_output(self) -> Tuple[CpuStage, BenchSchema]:
+        return CpuStage(), self.input
+
+
+class BatchTerminalStage(ITerminalStage[BenchSchema, BenchSchema], IBatchStage):
+    def compute_batch(self) -> None:
+        self._outputs = [BenchSchema(A=input.A + 1, B=b"") for input in self.inputs]
+
+    def get_batch_output(self) -> List[BenchSchema]:
+        return self._outputs
+
+
+class BatchInitStage(IInitStage[BenchSchema, BenchSchema, BatchTerminalStage]):
+    def get_output(self) -> Tuple[BatchTerminalStage, BenchSchema]:
+        return BatchTerminalStage(), self.input
+
+
+def _throughput(fn: Callable[[], object], records: int, repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    return records / best
+
+
+def _worker_counts() -> List[int]:
+    cpus = os.cpu_count() or 1
+
+    return sorted({2**i for i in range(cpus.bit_length()) if 2**i <= cpus} | {cpus})
+
+
+def bench_scaling(quick: bool) -> List[Measurement]:
+    """Throughput of `start_batch` across batch sizes, and of a CPU-bound stage in
+    a process pool across worker counts up to the number of cores.
+    """
+    results = []
+    repeat = 3 if quick else 5
+    store = NullArtifactStore()
+
+    for batch_size in (1, 16, 256):
+        inputs = [BenchSchema(A=i, B=b"") for i in range(batch_size)]
+        controller = BaseController(None, BatchInitStage, artifact_store=store)
+        number = max(1, 2048 // batch_size)
+
+        def run_batches() -> None:
+            for _ in range(number):
+                controller.start_batch(inputs)
+
+        results.append(
+            Measurement(
+                f"scaling.start_batch[batch={batch_size}]",
+                _throughput(run_batches, batch_size * number, repeat),
+                "records/s",
+                higher_is_better=True,
+            )
+        )
+
+    inputs = [BenchSchema(A=i, B=b"") for i in range(64 if quick else 256)]
+    for workers in _worker_counts():
+        with ProcessStagePool(max_workers=workers) as pool:
+            controller = BaseController(
+                None, CpuInitStage, artifact_store=store, process_pool=pool
+            )
+            controller.map(inputs[:workers])  # Start the workers
+
+            results.append(
+                Measurement(
+                    f"scaling.process_pool[workers={workers}]",
+                    _throughput(lambda: controller.map(inputs), len(inputs), repeat),
+                    "records/s",
+                    higher_is_better=True,
+                )
+            )
+
+    return results
+
+
+"""================================ RUNNER ================================="""
+
+
+GROUPS: Dict[str, Callable[[bool], List[Measurement]]] = {
+    "schema": bench_schema,
+    "controller": bench_controller,
+    "artifacts": bench_artifacts,
+    "scaling": bench_scaling,
+}
+
+
+def _reference() -> int:
+    total = 0
+    for i in range(1000):
+        total += i * i
+
+    return total
+
+
+def calibrate() -> float:
+    """Measures a fixed pure Python workload in microseconds, by which the times
+    are normalised when comparing against a baseline, such that a machine which is
+    uniformly slower or busier than when the baseline was measured is not taken
+    for a regression.
+    """
+    return per_call(_reference, number=2000, repeat=7) * 1e6
+
+
+def run(groups: List[str], quick: bool = False) -> dict:
+    """Runs groups of the suite.
+
+    Parameters
+    ----------
+    groups : List[str]
+        Names of the groups to run, see `GROUPS`.
+    quick : bool, optional
+        Whether to run fewer iterations, by default False
+
+    Returns
+    -------
+    dict
+        Results with the machine they were measured on, and every measurement
+        keyed by name.
+    """
+    measurements = {}
+
+    for group in groups:
+        for measurement in GROUPS[group](quick):
+            measurements[measurement.name] = {
+                "value": measurement.value,
+                "unit": measurement.unit,
+                "higher_is_better": measurement.higher_is_better,
+            }
+
+    return {
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "calibration": calibrate(),
+        },
+        "quick": quick,
+        "measurements": measurements,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Compares results against a baseline, only for the measurements in both.
+
+    Parameters
+    ----------
+    results : dict
+        Results of `run`.
+    baseline : dict
+        Results of a previous run.
+    tolerance : float
+        Relative slowdown tolerated, e.g. 0.25 for 25%.
+
+    Returns
+    -------
+    List[str]
+        Names of the measurements which regressed.
+    """
+    regressions = []
+    measurements = results["measurements"]
+
+    # Speed of this machine relative to the one of the baseline
+    speed = results["machine"]["calibration"] / baseline["machine"]["calibration"]
+    print(f"machine speed relative to the baseline: {1 / speed:.2f}x")
+
+    print(f"{'measurement':<60} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, before in baseline["measurements"].items():
+        after = measurements.get(name)
+        if after is None or not before["value"] or not after["value"]:
+            continue
+
+        # Ratio above 1 is worse, whichever direction is better, where the times
+        # and throughputs are normalised by the speed of the machine
+        ratio = after["value"] / before["value"]
+        if before["higher_is_better"]:
+            ratio = 1 / ratio
+        if before["unit"] != "bytes":
+            ratio /= speed
+
+        flag = "  REGRESSION" if ratio > 1 + tolerance else ""
+        print(
+            f"{name:<60} {before['value']:>12.2f} {after['value']:>12.2f}"
+            f" {ratio - 1:>+8.1%}{flag}"
+        )
+
+        if flag:
+            regressions.append(name)
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--groups", default=",".join(GROUPS))
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    groups = [group for group in args.groups.split(",") if group]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups {sorted(unknown)}, expected {list(GROUPS)}")
+
+    results = run(groups, quick=args.quick)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"wrote {len(results['measurements'])} measurements to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"saved the baseline to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, nothing to compare against")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    if baseline["quick"] != results["quick"]:
+        print("the baseline was not measured with the same --quick setting")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regressions over {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
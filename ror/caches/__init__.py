@@ -0,0 +1,3 @@
+from .common import IMemoCache, MemoEntry, MemoKey
+from .disk_memo_cache import DiskMemoCache
+from .memory_memo_cache import MemoryMemoCache
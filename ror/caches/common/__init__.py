@@ -0,0 +1 @@
+from .i_memo_cache import IMemoCache, MemoEntry, MemoKey, stage_path
@@ -0,0 +1,95 @@
+# External imports
+from typing import NamedTuple, Optional
+
+
+class MemoKey(NamedTuple):
+    """Key of a memoized stage result.
+
+    Attributes
+    ----------
+    stage : str
+        Import path of the stage class.
+    version : str
+        Fingerprint of the stage version.
+    input : str
+        Fingerprint of the input field values.
+    """
+
+    stage: str
+    version: str
+    input: str
+
+
+class MemoEntry(NamedTuple):
+    """Memoized result of a stage for one input.
+
+    Attributes
+    ----------
+    next_stage : object
+        Next stage instance decided by the stage, None for terminal stages.
+    output : object
+        Output dataclass of the stage.
+    """
+
+    next_stage: object
+    output: object
+
+
+class IMemoCache:
+    """Interface for the caches of memoized stage results used by the controllers
+    for the stages extending `IMemoizedStage`.
+
+    Examples
+    --------
+    >>> from ror.caches import MemoryMemoCache
+
+    >>> cache = MemoryMemoCache(max_entries=10_000)
+    >>> controller = BaseController(data, InitStage, memo_cache=cache)
+    >>> cache.invalidate(PreprocessStage)
+    """
+
+    def get(self, key: MemoKey) -> Optional[MemoEntry]:
+        """Returns the cached result for some key.
+
+        Parameters
+        ----------
+        key : MemoKey
+            Key of the stage result.
+
+        Returns
+        -------
+        Optional[MemoEntry]
+            The cached result, None on a miss.
+        """
+        raise NotImplementedError
+
+    def put(self, key: MemoKey, entry: MemoEntry) -> None:
+        """Caches the result for some key.
+
+        Parameters
+        ----------
+        key : MemoKey
+            Key of the stage result.
+        entry : MemoEntry
+            Result to cache.
+        """
+        raise NotImplementedError
+
+    def invalidate(self, stage: Optional[type] = None) -> None:
+        """Drops the cached results of a stage class, of all versions, or all the
+        cached results if no stage is given.
+
+        Parameters
+        ----------
+        stage : Optional[type], optional
+            Stage class to drop the results of, by default None
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+def stage_path(stage: type) -> str:
+    """Import path of a stage class used in the memo keys."""
+    return f"{stage.__module__}.{stage.__qualname__}"
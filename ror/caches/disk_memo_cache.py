@@ -0,0 +1,69 @@
+# External imports
+import os
+import pickle
+import shutil
+from typing import Optional
+
+# Local imports
+from .common import IMemoCache, MemoEntry, MemoKey, stage_path
+
+
+class DiskMemoCache(IMemoCache):
+    """Cache of memoized stage results pickled to local disk, under a directory per
+    stage class and version, which persists across processes and runs. The
+    results have to be picklable.
+
+    Examples
+    --------
+    >>> from ror.caches import DiskMemoCache
+    >>> controller = BaseController(data, InitStage, memo_cache=DiskMemoCache("/tmp/ror-memo"))
+    """
+
+    def __init__(self, root: str):
+        """Instantiates the cache.
+
+        Parameters
+        ----------
+        root : str
+            Directory to write the results to.
+        """
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: MemoKey) -> str:
+        return os.path.join(self.root, key.stage, key.version, key.input + ".pkl")
+
+    def get(self, key: MemoKey) -> Optional[MemoEntry]:
+        try:
+            with open(self._path(key), "rb") as f:
+                return MemoEntry(*pickle.load(f))
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: MemoKey, entry: MemoEntry) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        import tempfile
+
+        # Written to a temporary file first such that readers never see partial data
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(tuple(entry), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    def invalidate(self, stage: Optional[type] = None) -> None:
+        if stage is None:
+            for entry in os.scandir(self.root):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            return
+
+        shutil.rmtree(os.path.join(self.root, stage_path(stage)), ignore_errors=True)
+
+    def __len__(self) -> int:
+        return sum(
+            1
+            for _, _, files in os.walk(self.root)
+            for name in files
+            if name.endswith(".pkl")
+        )
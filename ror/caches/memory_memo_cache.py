@@ -0,0 +1,63 @@
+# External imports
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+# Local imports
+from .common import IMemoCache, MemoEntry, MemoKey, stage_path
+
+
+class MemoryMemoCache(IMemoCache):
+    """In-memory cache of memoized stage results, evicting the least recently used
+    results over `max_entries`. The cached outputs are shared with the runs which
+    hit them, so stages should not mutate their inputs in place.
+
+    Examples
+    --------
+    >>> from ror.caches import MemoryMemoCache
+    >>> controller = BaseController(data, InitStage, memo_cache=MemoryMemoCache(1024))
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """Instantiates the cache.
+
+        Parameters
+        ----------
+        max_entries : Optional[int], optional
+            Maximum number of results to keep, by default None
+        """
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[MemoKey, MemoEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: MemoKey) -> Optional[MemoEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def put(self, key: MemoKey, entry: MemoEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ):
+                self._entries.popitem(last=False)
+
+    def invalidate(self, stage: Optional[type] = None) -> None:
+        with self._lock:
+            if stage is None:
+                self._entries.clear()
+                return
+
+            path = stage_path(stage)
+            for key in [k for k in self._entries if k.stage == path]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,3 @@
+from .common import Checkpoint, ICheckpointStore
+from .disk_checkpoint_store import DiskCheckpointStore
+from .memory_checkpoint_store import MemoryCheckpointStore
@@ -0,0 +1 @@
+from .i_checkpoint_store import Checkpoint, ICheckpointStore
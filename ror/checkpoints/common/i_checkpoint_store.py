@@ -0,0 +1,97 @@
+# External imports
+from typing import List, NamedTuple, Optional
+
+
+class Checkpoint(NamedTuple):
+    """Checkpoint of a run after its last completed stage.
+
+    Attributes
+    ----------
+    stage : str
+        Name of the last completed stage.
+    next_stage : object
+        Next stage instance returned by the stage, None once the terminal stage
+        is completed.
+    output : object
+        Output dataclass of the stage, the input of the next stage or the output
+        of the run for the terminal stage.
+    """
+
+    stage: str
+    next_stage: object
+    output: object
+
+
+class ICheckpointStore:
+    """Interface for the stores of the checkpoints written by the controllers after
+    each stage of a run started with `start`, keyed by the `run_id` of the run. Only
+    the latest checkpoint of a run is kept, from which `resume` restarts the run.
+
+    Examples
+    --------
+    >>> from ror.checkpoints import DiskCheckpointStore
+
+    >>> store = DiskCheckpointStore("/tmp/ror-checkpoints")
+    >>> controller = BaseController(data, InitStage, checkpoint_store=store)
+    >>> output, run_id = controller.start(run_id="2024-01-01")
+    >>> output, run_id = controller.resume("2024-01-01") # After a crash
+    """
+
+    def put(self, run_id: str, checkpoint: Checkpoint) -> None:
+        """Stores the checkpoint of a run, replacing its previous checkpoint.
+
+        Parameters
+        ----------
+        run_id : str
+            Run id of the run.
+        checkpoint : Checkpoint
+            Checkpoint after the last completed stage.
+        """
+        raise NotImplementedError
+
+    def get(self, run_id: str) -> Optional[Checkpoint]:
+        """Returns the latest checkpoint of a run.
+
+        Parameters
+        ----------
+        run_id : str
+            Run id of the run.
+
+        Returns
+        -------
+        Optional[Checkpoint]
+            The latest checkpoint, None if the run has none.
+        """
+        raise NotImplementedError
+
+    def evict(self, run_id: str) -> None:
+        """Drops the checkpoint of a run.
+
+        Parameters
+        ----------
+        run_id : str
+            Run id of the run.
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Waits for the checkpoints being written, for stores writing them in the
+        background.
+        """
+        pass
+
+    def run_ids(self) -> List[str]:
+        """Returns the run ids which have a checkpoint.
+
+        Returns
+        -------
+        List[str]
+            Run ids of the checkpointed runs.
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return len(self.run_ids())
+
+    def __contains__(self, run_id: str) -> bool:
+        return self.get(run_id) is not None
@@ -0,0 +1,213 @@
+# External imports
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# Local imports
+from ror.utils.paths import check_run_id
+
+from .common import Checkpoint, ICheckpointStore
+
+_SUFFIX = ".ckpt"
+
+
+class DiskCheckpointStore(ICheckpointStore):
+    """Store pickling the checkpoint of each run to a file on local disk, such that a
+    run can be resumed by another process after a crash. The next stage instances
+    and the outputs of the stages have to be picklable.
+
+    The checkpoints are pickled by `put`, such that a later stage mutating its input
+    in place does not change the checkpoint, and by default written by a background
+    thread, so that the stages are not waiting on the disk. A run only needs its
+    latest checkpoint, so when the writes fall behind the older checkpoints of a
+    run are skipped. Errors of the background writes are raised by the next `put`
+    or `flush`.
+
+    The checkpoints of the completed runs, only kept for `resume` to return their
+    output, are bounded by `max_completed`, counting the runs completed through the
+    store since it was instantiated. Older files are left in `root`.
+
+    Examples
+    --------
+    >>> from ror.checkpoints import DiskCheckpointStore
+
+    >>> store = DiskCheckpointStore("/tmp/ror-checkpoints")
+    >>> controller = BaseController(data, InitStage, checkpoint_store=store)
+    >>> output, run_id = controller.start(run_id="2024-01-01")
+    """
+
+    def __init__(
+        self, root: str, background: bool = True, max_completed: Optional[int] = 1024
+    ):
+        """Instantiates the store, checkpoints already present in `root` are kept.
+
+        Parameters
+        ----------
+        root : str
+            Directory to write a checkpoint file per run to.
+        background : bool, optional
+            Whether the checkpoints are written by a background thread, by default
+            True. Otherwise `put` returns once the checkpoint is on disk.
+        max_completed : Optional[int], optional
+            Number of completed runs whose checkpoint is kept, the oldest are deleted
+            first, by default 1024. None keeps them all.
+        """
+        if max_completed is not None and max_completed < 0:
+            raise ValueError("The number of completed runs can not be negative!")
+
+        self.root = os.path.abspath(root)
+        self.background = background
+        self.max_completed = max_completed
+
+        # Pickled checkpoints waiting to be written, only the latest one per run,
+        # None for the checkpoints waiting to be deleted
+        self._pending: Dict[str, Optional[bytes]] = {}
+        self._completed: "OrderedDict[str, None]" = OrderedDict()
+        self._writing = 0
+        self._error: Optional[BaseException] = None
+        self._writer: Optional[threading.Thread] = None
+        self._condition = threading.Condition()
+
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, run_id: str) -> str:
+        return os.path.join(self.root, run_id + _SUFFIX)
+
+    def _write(self, run_id: str, data: Optional[bytes]) -> None:
+        path = self._path(run_id)
+
+        if data is None:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return
+
+        # Written to a temporary file first such that a crash never leaves partial data
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _evicted(self, run_id: str, checkpoint: Checkpoint) -> List[str]:
+        """Tracks the completed runs, returning the oldest ones over the bound.
+        Called holding the condition.
+        """
+        completed = self._completed
+        completed.pop(run_id, None)
+
+        if checkpoint.next_stage is None:
+            completed[run_id] = None
+
+        evicted = []
+        while self.max_completed is not None and len(completed) > self.max_completed:
+            evicted.append(completed.popitem(last=False)[0])
+
+        return evicted
+
+    def _write_pending(self) -> None:
+        """Loop of the writer thread, which exits once nothing is left to write such
+        that the interpreter can exit.
+        """
+        condition = self._condition
+
+        while True:
+            with condition:
+                if not self._pending:
+                    self._writer = None
+                    condition.notify_all()
+                    return
+
+                run_id = next(iter(self._pending))
+                data = self._pending.pop(run_id)
+                self._writing += 1
+
+            try:
+                self._write(run_id, data)
+            except BaseException as exception:
+                with condition:
+                    self._error = self._error or exception
+            finally:
+                with condition:
+                    self._writing -= 1
+                    condition.notify_all()
+
+    def _raise_error(self) -> None:
+        # Called holding the condition
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def put(self, run_id: str, checkpoint: Checkpoint) -> None:
+        check_run_id(run_id)
+        data = pickle.dumps(tuple(checkpoint), protocol=pickle.HIGHEST_PROTOCOL)
+
+        if not self.background:
+            with self._condition:
+                evicted = self._evicted(run_id, checkpoint)
+
+            self._write(run_id, data)
+            for evicted_id in evicted:
+                self._write(evicted_id, None)
+            return
+
+        with self._condition:
+            self._raise_error()
+            self._pending[run_id] = data
+
+            for evicted_id in self._evicted(run_id, checkpoint):
+                self._pending[evicted_id] = None
+
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_pending, name="ror-checkpoints"
+                )
+                self._writer.start()
+
+    def flush(self) -> None:
+        with self._condition:
+            while self._pending or self._writing:
+                self._condition.wait()
+
+            self._raise_error()
+
+    def get(self, run_id: str) -> Optional[Checkpoint]:
+        with self._condition:
+            pending = run_id in self._pending
+            data = self._pending.get(run_id)
+
+        if pending:
+            return None if data is None else Checkpoint(*pickle.loads(data))
+
+        # Waits for a write of the run which may be in progress
+        self.flush()
+
+        try:
+            with open(self._path(run_id), "rb") as f:
+                return Checkpoint(*pickle.load(f))
+        except FileNotFoundError:
+            return None
+
+    def evict(self, run_id: str) -> None:
+        with self._condition:
+            self._pending.pop(run_id, None)
+            self._completed.pop(run_id, None)
+
+        self.flush()
+
+        try:
+            os.remove(self._path(run_id))
+        except FileNotFoundError:
+            pass
+
+    def run_ids(self) -> List[str]:
+        self.flush()
+
+        return [
+            entry.name[: -len(_SUFFIX)]
+            for entry in os.scandir(self.root)
+            if entry.name.endswith(_SUFFIX)
+        ]
@@ -0,0 +1,74 @@
+# External imports
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# Local imports
+from .common import Checkpoint, ICheckpointStore
+
+
+class MemoryCheckpointStore(ICheckpointStore):
+    """In-memory store of the checkpoints of the runs, which survives the failure of
+    a run but not of the process, e.g. to retry a run from the stage which raised.
+
+    The checkpoints are pickled when they are put, such that a later stage mutating
+    its input in place does not change the checkpoint it is resumed from. The
+    checkpoints of the completed runs, only kept for `resume` to return their
+    output, are bounded by `max_completed`.
+
+    Examples
+    --------
+    >>> from ror.checkpoints import MemoryCheckpointStore
+    >>> controller = BaseController(data, InitStage, checkpoint_store=MemoryCheckpointStore())
+    """
+
+    def __init__(self, max_completed: Optional[int] = 1024):
+        """Instantiates the store without any checkpoints.
+
+        Parameters
+        ----------
+        max_completed : Optional[int], optional
+            Number of completed runs whose checkpoint is kept, the oldest are evicted
+            first, by default 1024. None keeps them all.
+        """
+        if max_completed is not None and max_completed < 0:
+            raise ValueError("The number of completed runs can not be negative!")
+
+        self.max_completed = max_completed
+
+        self._checkpoints: Dict[str, bytes] = {}
+        self._completed: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, run_id: str, checkpoint: Checkpoint) -> None:
+        data = pickle.dumps(tuple(checkpoint), protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            self._checkpoints[run_id] = data
+            self._completed.pop(run_id, None)
+
+            if checkpoint.next_stage is None:
+                self._completed[run_id] = None
+
+                while (
+                    self.max_completed is not None
+                    and len(self._completed) > self.max_completed
+                ):
+                    oldest, _ = self._completed.popitem(last=False)
+                    del self._checkpoints[oldest]
+
+    def get(self, run_id: str) -> Optional[Checkpoint]:
+        with self._lock:
+            data = self._checkpoints.get(run_id)
+
+        return None if data is None else Checkpoint(*pickle.loads(data))
+
+    def evict(self, run_id: str) -> None:
+        with self._lock:
+            self._checkpoints.pop(run_id, None)
+            self._completed.pop(run_id, None)
+
+    def run_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._checkpoints)
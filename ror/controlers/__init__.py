@@ -1 +1,22 @@
 from .common import BaseController
+from .dag_controller import DagController
+from .distributed_controller import DistributedController
+from .threaded_controller import ThreadedController
+
+__all__ = [
+    "AsyncController",
+    "BaseController",
+    "DagController",
+    "DistributedController",
+    "ThreadedController",
+]
+
+
+def __getattr__(name: str) -> object:
+    # The asyncio controller is imported on first use, as asyncio is slow to import
+    if name == "AsyncController":
+        from .async_controller import AsyncController
+
+        return AsyncController
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
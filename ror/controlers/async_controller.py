@@ -0,0 +1,347 @@
+# External imports
+import asyncio
+import contextvars
+import copy
+import time
+import uuid
+from collections import deque
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# Local imports
+from ror.caches.common import MemoEntry
+from ror.profilers.common import (
+    PHASE_COMPUTE,
+    PHASE_GET_OUTPUT,
+    PHASE_SET_INPUT,
+    IStageProfiler,
+    current_run_ids,
+)
+from ror.schemas import BaseSchema
+from ror.stages import IInitStage, ITerminalStage
+from ror.stages.common import IAsyncStage, IBaseStage
+from ror.utils.fingerprint import fingerprint
+from ror.utils.sizeof import deep_sizeof
+
+from .common import BaseController, PlanStep
+
+
+class AsyncController(BaseController):
+    """Controller running many pipeline instances concurrently on one asyncio event
+    loop. The `compute` coroutine of stages extending `IAsyncStage` (e.g.
+    `IAsyncForwardStage`) is awaited on the loop, while the synchronous stages are
+    offloaded to a thread executor, such that I/O-heavy pipelines reach a high
+    concurrency without a thread per run.
+
+    Examples
+    --------
+    >>> from ror.controlers import AsyncController
+
+    >>> controller = AsyncController(None, InitStage, concurrency=256)
+    >>> outputs = await controller.map(inputs)
+    >>> async for output, run_id in controller.stream(inputs): ...
+    """
+
+    def __init__(
+        self,
+        init_data: BaseSchema,
+        init_stage: IInitStage,
+        concurrency: int = 64,
+        executor: Optional["concurrent.futures.Executor"] = None,
+        **kwargs,
+    ):
+        """Instantiates the controller with a pipeline input and an init stage.
+
+        Parameters
+        ----------
+        init_data : BaseSchema
+            Input dataclass for the InitStage, used by `start`.
+        init_stage : IInitStage
+            Reference to the InitStage class (reference and not instance).
+        concurrency : int, optional
+            Maximum number of pipeline instances running at once, by default 64
+        executor : Optional[concurrent.futures.Executor], optional
+            Executor for the synchronous stages, by default the loop's default
+        **kwargs
+            Options of the `BaseController`, e.g. `artifact_store`.
+        """
+        super().__init__(init_data, init_stage, **kwargs)
+
+        if concurrency < 1:
+            raise ValueError("The concurrency needs to be positive!", concurrency)
+
+        self.concurrency = concurrency
+        self.executor = executor
+
+    def _check_stages(self, steps: Iterable) -> None:
+        # Async stages are awaited on the loop, the sync ones run on the executor
+        pass
+
+    async def _capture(self, run_id: str, step: PlanStep, schema: BaseSchema) -> None:
+        if self.artifact_store.blocking:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                self.executor, self._capture_artifact, run_id, step, schema
+            )
+        else:
+            self._capture_artifact(run_id, step, schema)
+
+    async def _compute_stage(
+        self, stage: IBaseStage, input: BaseSchema, parent: Optional[str] = None
+    ) -> Tuple[Optional[IBaseStage], BaseSchema]:
+        if isinstance(stage, IAsyncStage):
+            return await self._compute_async_stage(stage, input, parent)
+
+        parents = None if parent is None else [parent]
+
+        # The executor threads see the run ids of the task
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        (next_stage,), (output,) = await loop.run_in_executor(
+            self.executor, context.run, self._compute_group, stage, [input], parents
+        )
+
+        return next_stage, output
+
+    async def _compute_async_stage(
+        self, stage: IAsyncStage, input: BaseSchema, parent: Optional[str] = None
+    ) -> Tuple[Optional[IBaseStage], BaseSchema]:
+        memo_cache = self.memo_cache
+        memoized = self._memoized(stage)
+
+        if memoized:
+            key = self._memo_key(stage, input, parent)
+            entry = memo_cache.get(key)
+            if entry is not None:
+                return copy.copy(entry.next_stage), entry.output
+
+        memory_profiler = self.memory_profiler
+        if memory_profiler is not None:
+            state = memory_profiler.before(stage.__class__, [input])
+
+        profiler = self.profiler
+        if profiler is None:
+            stage.set_input(input)
+            await stage.compute()
+            result = stage.get_output()
+        else:
+            result = await self._profiled_compute(stage, input, profiler)
+
+        if isinstance(stage, ITerminalStage):
+            next_stage, output = None, result
+        else:
+            next_stage, output = result
+
+        if memory_profiler is not None:
+            memory_profiler.after(stage.__class__, state, [input], [output])
+
+        if memoized:
+            memo_cache.put(key, MemoEntry(copy.copy(next_stage), output))
+
+        return next_stage, output
+
+    async def _profiled_compute(
+        self, stage: IAsyncStage, input: BaseSchema, profiler: IStageProfiler
+    ) -> object:
+        perf, cpu = time.perf_counter_ns, time.thread_time_ns if profiler.cpu else int
+        stage_class = stage.__class__
+
+        t0, c0 = perf(), cpu()
+        stage.set_input(input)
+        t1, c1 = perf(), cpu()
+        await stage.compute()
+        t2, c2 = perf(), cpu()
+        result = stage.get_output()
+        t3, c3 = perf(), cpu()
+
+        # The CPU time of the awaited compute includes the other tasks of the loop
+        if profiler.payloads:
+            output = result if isinstance(stage, ITerminalStage) else result[1]
+            in_bytes, out_bytes = deep_sizeof(input), deep_sizeof(output)
+            profiler.record(
+                stage_class, PHASE_SET_INPUT, t0, t1 - t0, c1 - c0, 1, in_bytes
+            )
+            profiler.record(stage_class, PHASE_COMPUTE, t1, t2 - t1, 0, 1)
+            profiler.record(
+                stage_class, PHASE_GET_OUTPUT, t2, t3 - t2, c3 - c2, 1, out_bytes
+            )
+        else:
+            profiler.record(stage_class, PHASE_SET_INPUT, t0, t1 - t0, c1 - c0, 1)
+            profiler.record(stage_class, PHASE_COMPUTE, t1, t2 - t1, 0, 1)
+            profiler.record(stage_class, PHASE_GET_OUTPUT, t2, t3 - t2, c3 - c2, 1)
+
+        return result
+
+    async def run(self, init_data: BaseSchema) -> Tuple[BaseSchema, str]:
+        """Performs the computation through the pipeline for one input.
+
+        Parameters
+        ----------
+        init_data : BaseSchema
+            Input dataclass for the InitStage.
+
+        Returns
+        -------
+        Tuple[BaseSchema, str]
+            Tuple of the terminal stage output data and a `run_id`
+
+        Raises
+        ------
+        ReferenceError
+            Check that the `get_output` method of a stage indeed returns an instance of
+            the next stage and not a class reference. If class reference the fail.
+        TypeError
+            If a stage returns a next stage which is not part of the compiled plan.
+        """
+        plan = self.compile()
+        run_id = str(uuid.uuid4())
+        capture = self.artifact_store.enabled
+
+        step = plan.steps[0]
+        stage = self._acquire(self.init_stage)
+        input = init_data
+        lineage = fingerprint(input) if self.incremental else None
+        token = current_run_ids.set((run_id,))
+
+        try:
+            while not step.terminal:
+                if capture:
+                    await self._capture(run_id, step, input)
+
+                next_stage, input = await self._compute_stage(stage, input, lineage)
+
+                if lineage is not None:
+                    lineage = self._lineage(stage, lineage)
+
+                if not capture:
+                    (input,) = self._drop_dead(step, stage, [input])
+
+                if isinstance(next_stage, type):
+                    raise ReferenceError(
+                        "The get_object method needs to return an instance!",
+                        next_stage,
+                    )
+
+                step = plan.step(next_stage.__class__)
+                stage, previous = self._acquire(next_stage), stage
+                self._release(previous)
+
+            _, output = await self._compute_stage(stage, input, lineage)
+
+            if not capture:
+                self._drop_dead(step, stage, [output])
+        finally:
+            current_run_ids.reset(token)
+            self._release(stage)
+
+        # The terminal stage is keyed by the artifact of its output
+        if capture:
+            await self._capture(run_id, step, output)
+
+        return output, run_id
+
+    async def start(self) -> Tuple[BaseSchema, str]:
+        """Performs the computation through the pipeline for the `init_data` of the
+        controller.
+
+        Returns
+        -------
+        Tuple[BaseSchema, str]
+            Tuple of the terminal stage output data and a `run_id`
+        """
+        return await self.run(self.init_data)
+
+    async def start_batch(
+        self, inputs: Iterable[BaseSchema]
+    ) -> List[Tuple[BaseSchema, str]]:
+        """Performs the computation through the pipeline for many inputs, with at most
+        `concurrency` pipeline instances running at once.
+
+        Parameters
+        ----------
+        inputs : Iterable[BaseSchema]
+            Input dataclasses for the InitStage.
+
+        Returns
+        -------
+        List[Tuple[BaseSchema, str]]
+            Tuple of the terminal stage output data and a `run_id` for each input,
+            in the order of the inputs.
+        """
+        return [result async for result in self.stream(inputs)]
+
+    async def map(self, inputs: Iterable[BaseSchema]) -> List[BaseSchema]:
+        """Same as `start_batch` but only returns the terminal outputs.
+
+        Parameters
+        ----------
+        inputs : Iterable[BaseSchema]
+            Input dataclasses for the InitStage.
+
+        Returns
+        -------
+        List[BaseSchema]
+            Terminal stage output data for each input, in the order of the inputs.
+        """
+        return [output for output, _ in await self.start_batch(inputs)]
+
+    async def stream(
+        self, inputs: Union[Iterable[BaseSchema], AsyncIterable[BaseSchema]]
+    ) -> AsyncIterator[Tuple[BaseSchema, str]]:
+        """Lazily performs the computation through the pipeline over an iterable or
+        async iterable, possibly unbounded, of inputs. At most `concurrency` inputs
+        are pulled ahead of the outputs which have been consumed, and the outputs
+        are yielded in the order of the inputs.
+
+        Parameters
+        ----------
+        inputs : Union[Iterable[BaseSchema], AsyncIterable[BaseSchema]]
+            Iterable or async iterable of input dataclasses for the InitStage.
+
+        Yields
+        ------
+        AsyncIterator[Tuple[BaseSchema, str]]
+            Tuple of the terminal stage output data and a `run_id` for each input.
+        """
+        if hasattr(inputs, "__aiter__"):
+            iterator = inputs.__aiter__()
+            next_input = iterator.__anext__
+        else:
+            sync_iterator = iter(inputs)
+
+            async def next_input() -> BaseSchema:
+                try:
+                    return next(sync_iterator)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        # Runs in input order, the oldest is awaited first
+        tasks: Deque[asyncio.Task] = deque()
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(tasks) < self.concurrency:
+                    try:
+                        input = await next_input()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+
+                    tasks.append(asyncio.ensure_future(self.run(input)))
+
+                if not tasks:
+                    return
+
+                yield await tasks.popleft()
+        finally:
+            for task in tasks:
+                task.cancel()
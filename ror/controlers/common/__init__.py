@@ -1 +1,5 @@
 from .base_controller import BaseController
+from .dag_plan import DagPlan, DagStep
+from .pipeline_plan import PipelinePlan, PlanStep
+from .process_stage_pool import ProcessStagePool
+from .stage_pool import StagePool
@@ -1,15 +1,36 @@
 # External imports
+import copy
+import time
 import uuid
-from collections import defaultdict
-from typing import Tuple
-
-from rich.console import Console
-from rich.table import Table
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 # Local imports
+from ror.caches.common import IMemoCache, MemoEntry, MemoKey, stage_path
+from ror.checkpoints.common import Checkpoint, ICheckpointStore
+from ror.profilers import MemoryProfiler
+from ror.profilers.common import (
+    PHASE_ARTIFACT,
+    PHASE_COMPUTE,
+    IStageProfiler,
+    current_run_ids,
+)
 from ror.schemas import BaseSchema
-from ror.stages import IInitStage, ITerminalStage
-from ror.stages.common import IBaseStage
+from ror.stages import IInitStage, IMemoizedStage, IProcessStage
+from ror.stages.common import (
+    IAsyncStage,
+    IBaseStage,
+    compute_group,
+    profiled_compute_group,
+)
+from ror.stores import MemoryArtifactStore
+from ror.stores.common import IArtifactStore
+from ror.utils.fingerprint import fingerprint, stage_fingerprint
+from ror.utils.sizeof import deep_sizeof
+
+from .pipeline_plan import PipelinePlan, PlanStep
+from .process_stage_pool import ProcessStagePool
+from .stage_pool import StagePool
 
 
 class BaseController:
@@ -60,10 +81,23 @@ class BaseController:
     >>> controller = BaseController(dataclass, stage)
 
     >>> controller.discover() # Prints out a table of the connected stages for debugging.
+    >>> plan = controller.compile() # Immutable plan of the stages reused by every run.
     >>> output = controller.start() # Computes through the pipeline and return terminal data.
+    >>> controller.close() # Tears down the warm instances of the reusable stages.
     """
 
-    def __init__(self, init_data: BaseSchema, init_stage: IInitStage):
+    def __init__(
+        self,
+        init_data: BaseSchema,
+        init_stage: IInitStage,
+        artifact_store: Optional[IArtifactStore] = None,
+        process_pool: Optional[ProcessStagePool] = None,
+        memo_cache: Optional[IMemoCache] = None,
+        profiler: Optional[IStageProfiler] = None,
+        memory_profiler: Optional[MemoryProfiler] = None,
+        checkpoint_store: Optional[ICheckpointStore] = None,
+        incremental: bool = False,
+    ):
         """Instantiates the controller with a pipeline input and an init stage.
 
         Parameters
@@ -72,20 +106,115 @@ class BaseController:
             Input dataclass for the InitStage.
         init_stage : IInitStage
             Reference to the InitStage class (reference and not instance).
+        artifact_store : Optional[IArtifactStore], optional
+            Store retaining the artifacts of each run, by default an unbounded
+            `MemoryArtifactStore`. Use a `NullArtifactStore` to disable artifacts.
+        process_pool : Optional[ProcessStagePool], optional
+            Pool of worker processes computing the stages extending `IProcessStage`,
+            by default None which computes them in the controller process.
+        memo_cache : Optional[IMemoCache], optional
+            Cache of the results of the stages extending `IMemoizedStage`, or of
+            every stage for incremental controllers, by default None which computes
+            every stage on every run.
+        profiler : Optional[IStageProfiler], optional
+            Profiler the phases of every stage are reported to, e.g. a
+            `TimingProfiler`, by default None which does not time anything.
+        memory_profiler : Optional[MemoryProfiler], optional
+            Profiler attributing the allocated memory and the size of the schema
+            fields to the stages, by default None.
+        checkpoint_store : Optional[ICheckpointStore], optional
+            Store of the checkpoint written after each stage of the runs computed
+            with `start`, from which `resume` restarts a run, by default None.
+        incremental : bool, optional
+            Whether the results of every stage are kept in the memo cache, such that
+            rerunning an input only recomputes the stages whose version changed and
+            the stages after them, by default False.
+
+        Raises
+        ------
+        ValueError
+            If the controller is incremental but has no memo cache.
         """
         self.init_data = init_data
         self.init_stage = init_stage
+        self.process_pool = process_pool
+        self.memo_cache = memo_cache
+        self.profiler = profiler
+        self.memory_profiler = memory_profiler
+        self.checkpoint_store = checkpoint_store
+        self.incremental = incremental
+
+        if incremental and memo_cache is None:
+            raise ValueError("Incremental runs need a memo cache to keep the results!")
+
+        self.artifact_store = (
+            MemoryArtifactStore() if artifact_store is None else artifact_store
+        )
+
+        self.stage_pool = StagePool()
+        self._plan: Optional[PipelinePlan] = None
+
+    def __enter__(self) -> "BaseController":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def warmup(self) -> None:
+        """Instantiates and sets up the reusable stages of the pipeline ahead of the
+        first run, e.g. to load the models before serving requests.
+        """
+        for step in self.compile():
+            if step.stage_class.reusable:
+                self._release(self._acquire(step.stage_class))
+
+    def close(self) -> None:
+        """Tears down the warm instances of the reusable stages, and stops the
+        allocation tracing of the memory profiler.
+        """
+        self.stage_pool.close()
+
+        if self.memory_profiler is not None:
+            self.memory_profiler.close()
+
+    def _acquire(self, stage: Union[type, IBaseStage]) -> IBaseStage:
+        """Returns the stage instance to compute with from the stage pool, except for
+        the stages computed by the process pool which are set up in the workers.
+
+        Parameters
+        ----------
+        stage : Union[type, IBaseStage]
+            Stage class or stage instance returned by the previous stage.
+
+        Returns
+        -------
+        IBaseStage
+            Stage instance to compute with.
+        """
+        if self.process_pool is not None and issubclass(
+            stage if isinstance(stage, type) else stage.__class__, IProcessStage
+        ):
+            return stage() if isinstance(stage, type) else stage
+
+        return self.stage_pool.acquire(stage)
+
+    def _release(self, stage: IBaseStage) -> None:
+        if self.process_pool is not None and isinstance(stage, IProcessStage):
+            return
 
-        self._artifact_cache = defaultdict(dict)
+        self.stage_pool.release(stage)
 
-    def _generate_discover_table(self) -> Table:
+    def _generate_discover_table(self) -> "rich.table.Table":
         """Creates a basic table to preview the connected computaion stages.
 
         Returns
         -------
-        Table
+        rich.table.Table
             Returns an instance of the table to be filled at `self.discover()`
         """
+        # Imported when used, as rich is slow to import and not needed to run
+        from rich.table import Table
+
         table = Table(title="Discover")
 
         table.add_column("Stage No.", style="cyan", no_wrap=True)
@@ -96,47 +225,107 @@ class BaseController:
 
         return table
 
-    def _stage_name(self, stage: IBaseStage) -> str:
-        return stage.__class__.__name__
+    def compile(self) -> PipelinePlan:
+        """Resolves the stage chain from the generics of the stages into an
+        immutable execution plan, compiled on first use and reused by every run.
+
+        Returns
+        -------
+        PipelinePlan
+            Compiled plan of the pipeline.
+
+        Raises
+        ------
+        TypeError
+            If the controller can not compute one of the stages, see `_check_stages`.
+        """
+        plan = self._plan
+
+        if plan is None or plan.init_stage is not self.init_stage:
+            plan = PipelinePlan.compile(self.init_stage)
+            self._check_stages(plan)
+            self._plan = plan
+
+        return plan
+
+    def _check_stages(self, steps: Iterable) -> None:
+        """Checks that the controller can compute every stage of a compiled plan.
+
+        Parameters
+        ----------
+        steps : Iterable
+            Compiled steps of the pipeline.
+
+        Raises
+        ------
+        TypeError
+            If a stage is async, its `compute` coroutine is only awaited by the
+            `AsyncController`.
+        """
+        for step in steps:
+            if issubclass(step.stage_class, IAsyncStage):
+                raise TypeError(
+                    f"{step.name} is an async stage, which is only computed by the "
+                    f"AsyncController and not the {self.__class__.__name__}!",
+                    step.stage_class,
+                )
 
     def discover(self) -> None:
-        """Iteratively goes through the entire pipelineand adds rows to the discover
-        table with the relationship links between the different stages, usefull for debugging
-        a pipeline.
+        """Goes through the compiled plan of the pipeline and adds rows to the discover
+        table with the relationship links between the different stages, usefull for
+        debugging a pipeline.
         """
         table = self._generate_discover_table()
-        stage = self.init_stage()
-        stage_no = 0
-
-        table.add_row(
-            str(stage_no),
-            self._stage_name(stage),
-            str(stage.input_schema()),
-            str(stage.output_schema()),
-            str(stage.discover()),
-        )
-
-        while not isinstance(stage, ITerminalStage):
-            stage = stage.discover()
-            stage = stage()
-            stage_no += 1
 
+        for step in self.compile():
             table.add_row(
-                str(stage_no),
-                self._stage_name(stage),
-                str(stage.input_schema()),
-                str(stage.output_schema()),
-                str(stage.discover()),
+                str(step.index),
+                step.name,
+                str(step.input_schema),
+                str(step.output_schema),
+                str(step.next_stage),
             )
 
+        from rich.console import Console
+
         console = Console()
         console.print(table)
 
-    def start(self) -> Tuple[BaseSchema, str]:
+    def report(self) -> None:
+        """Prints the tables of what the profilers of the controller have recorded,
+        e.g. the timings of every phase of every stage for a `TimingProfiler`, and
+        the memory of the stages and their largest fields for the memory profiler.
+
+        Raises
+        ------
+        ValueError
+            If the controller has no profiler.
+        """
+        if self.profiler is None and self.memory_profiler is None:
+            raise ValueError("The controller has no profiler to report!")
+
+        from rich.console import Console
+
+        console = Console()
+
+        if self.profiler is not None:
+            console.print(self.profiler.to_table())
+
+        if self.memory_profiler is not None:
+            console.print(self.memory_profiler.to_table())
+            console.print(self.memory_profiler.fields_table())
+
+    def start(self, run_id: Optional[str] = None) -> Tuple[BaseSchema, str]:
         """Performs the iterative computation through the pipeline and returns a tuple
         of the output data and a `run_id` which can be used to access the artifact cache
         produced for the different runs.
 
+        Parameters
+        ----------
+        run_id : Optional[str], optional
+            Run id of the run, by default a new one. Giving one allows resuming the
+            run from its checkpoint if it fails.
+
         Returns
         -------
         Tuple[BaseSchema, str]
@@ -147,39 +336,575 @@ class BaseController:
         ReferenceError
             Check that the `get_output` method of a stage indeed returns an instance of
             the next stage and not a class reference. If class reference the fail.
+        TypeError
+            If a stage returns a next stage which is not part of the compiled plan.
         """
-        run_id = str(uuid.uuid4())
+        run_id = str(uuid.uuid4()) if run_id is None else run_id
 
-        stage = self.init_stage()
-        stage.set_input(self.init_data)
+        return self._run(run_id, self.init_stage, self.init_data)
 
-        while not isinstance(stage, ITerminalStage):
-            # Cache artifact
-            self._artifact_cache[run_id][
-                stage.__class__.__name__
-            ] = stage.input.get_artifact()
+    def resume(self, run_id: str) -> Tuple[BaseSchema, str]:
+        """Restarts a run from its checkpoint, computing from the first stage after
+        the last checkpointed stage, e.g. after the run failed or the process was
+        killed. A run which was completed returns its output without computing.
 
-            # Compute and get next output
-            stage.compute()
-            stage, output = stage.get_output()
+        Parameters
+        ----------
+        run_id : str
+            Run id of the run to resume.
 
-            if isinstance(stage, type):
-                raise ReferenceError(
-                    "The get_object method needs to return an instance!", stage
-                )
+        Returns
+        -------
+        Tuple[BaseSchema, str]
+            Tuple of the terminal stage output data and the `run_id`
+
+        Raises
+        ------
+        ValueError
+            If the controller has no checkpoint store, or the run has no checkpoint.
+        TypeError
+            If the checkpointed next stage is no longer part of the compiled plan.
+        """
+        if self.checkpoint_store is None:
+            raise ValueError("The controller has no checkpoint store to resume from!")
 
-            stage.set_input(output)
+        checkpoint = self.checkpoint_store.get(run_id)
+        if checkpoint is None:
+            raise ValueError(f"The run {run_id} has no checkpoint!", run_id)
 
-        # Get terminal output and artifact
-        stage.compute()
-        output = stage.get_output()
-        self._artifact_cache[run_id][
-            stage.__class__.__name__
-        ] = stage.input.get_artifact()
-        self._artifact_cache[run_id][stage.__class__.__name__] = output.get_artifact()
+        if checkpoint.next_stage is None:
+            return checkpoint.output, run_id
+
+        return self._run(run_id, checkpoint.next_stage, checkpoint.output)
+
+    def _run(
+        self, run_id: str, stage: Union[type, IBaseStage], input: BaseSchema
+    ) -> Tuple[BaseSchema, str]:
+        """Computes a run from some stage through to the terminal stage, writing a
+        checkpoint after each stage if the controller has a checkpoint store.
+
+        Parameters
+        ----------
+        run_id : str
+            Run id of the run.
+        stage : Union[type, IBaseStage]
+            Stage class or instance to start computing from.
+        input : BaseSchema
+            Input of that stage.
+
+        Returns
+        -------
+        Tuple[BaseSchema, str]
+            Tuple of the terminal stage output data and the `run_id`
+        """
+        plan = self.compile()
+        capture = self.artifact_store.enabled
+        checkpoints = self.checkpoint_store
+
+        step = plan.step(stage if isinstance(stage, type) else stage.__class__)
+        stage = self._acquire(stage)
+        lineage = fingerprint(input) if self.incremental else None
+        token = current_run_ids.set((run_id,))
+
+        try:
+            while not step.terminal:
+                # Cache artifact
+                if capture:
+                    self._capture_artifact(run_id, step, input)
+
+                # Compute and get next output
+                parents = None if lineage is None else [lineage]
+                (next_stage,), (input,) = self._compute_group(stage, [input], parents)
+
+                if lineage is not None:
+                    lineage = self._lineage(stage, lineage)
+
+                if not capture:
+                    (input,) = self._drop_dead(step, stage, [input])
+
+                if isinstance(next_stage, type):
+                    raise ReferenceError(
+                        "The get_object method needs to return an instance!",
+                        next_stage,
+                    )
+
+                # Checkpointed as returned, before the next stage is set up
+                if checkpoints is not None and stage.checkpoint:
+                    checkpoint = Checkpoint(step.name, copy.copy(next_stage), input)
+                    checkpoints.put(run_id, checkpoint)
+
+                step = plan.step(next_stage.__class__)
+                stage, previous = self._acquire(next_stage), stage
+                self._release(previous)
+
+            # Get terminal output and artifact
+            parents = None if lineage is None else [lineage]
+            _, (output,) = self._compute_group(stage, [input], parents)
+
+            if not capture:
+                self._drop_dead(step, stage, [output])
+
+            if checkpoints is not None and stage.checkpoint:
+                checkpoints.put(run_id, Checkpoint(step.name, None, output))
+        except BaseException:
+            # The last checkpoint is on disk before the failure is raised
+            if checkpoints is not None:
+                checkpoints.flush()
+            raise
+        finally:
+            current_run_ids.reset(token)
+            self._release(stage)
+
+        # The terminal stage is keyed by the artifact of its output
+        if capture:
+            self._capture_artifact(run_id, step, output)
 
         return output, run_id
 
+    def _memoized(self, stage: IBaseStage) -> bool:
+        """Whether the results of a stage are reused from the memo cache."""
+        return self.memo_cache is not None and (
+            self.incremental or isinstance(stage, IMemoizedStage)
+        )
+
+    def _memo_key(
+        self, stage: IBaseStage, input: BaseSchema, parent: Optional[str] = None
+    ) -> MemoKey:
+        """Key of the memoized result of a stage for some input.
+
+        Parameters
+        ----------
+        stage : IBaseStage
+            Stage instance whose results are memoized.
+        input : BaseSchema
+            Input of the stage.
+        parent : Optional[str], optional
+            Lineage of the input in incremental runs, by default None which keys the
+            result by the fingerprint of the input.
+
+        Returns
+        -------
+        MemoKey
+            Key from the stage class, its version and the input field values or
+            the lineage of the input.
+        """
+        stage_class = stage.__class__
+
+        return MemoKey(
+            stage_path(stage_class),
+            stage_fingerprint(stage_class),
+            fingerprint(input) if parent is None else parent,
+        )
+
+    def _lineage(self, stage: IBaseStage, parent: str) -> str:
+        """Lineage of the output of a stage in incremental runs, which identifies the
+        input of the run and the version of every stage it went through, such that
+        the outputs of the stages are keyed without being fingerprinted.
+
+        Parameters
+        ----------
+        stage : IBaseStage
+            Stage instance which computed the output.
+        parent : str
+            Lineage of the input of the stage.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest.
+        """
+        return fingerprint(tuple(self._memo_key(stage, None, parent)))
+
+    def _compute_group(
+        self,
+        stage: IBaseStage,
+        inputs: List[BaseSchema],
+        parents: Optional[List[str]] = None,
+    ) -> Tuple[List[IBaseStage], List[BaseSchema]]:
+        """Computes a group of inputs at the same stage, as a batch if the stage
+        extends `IBatchStage` and otherwise one record at a time. Stages extending
+        `IProcessStage` are computed in the process pool if the controller has one,
+        and the results of stages extending `IMemoizedStage`, or of every stage for
+        incremental controllers, are reused from the memo cache if the controller
+        has one.
+
+        Parameters
+        ----------
+        stage : IBaseStage
+            Stage instance to compute the group with.
+        inputs : List[BaseSchema]
+            Inputs of the group.
+        parents : Optional[List[str]], optional
+            Lineage of each input in incremental runs, by default None which keys the
+            memoized results by the fingerprint of the inputs.
+
+        Returns
+        -------
+        Tuple[List[IBaseStage], List[BaseSchema]]
+            The next stage instance of each record, or None for terminal stages, and
+            the output of each record.
+        """
+        if not self._memoized(stage):
+            return self._compute_uncached(stage, inputs)
+
+        memo_cache = self.memo_cache
+        parents = [None] * len(inputs) if parents is None else parents
+        keys = [
+            self._memo_key(stage, input, parent)
+            for input, parent in zip(inputs, parents)
+        ]
+        entries = [memo_cache.get(key) for key in keys]
+        misses = [i for i, entry in enumerate(entries) if entry is None]
+
+        if misses:
+            next_stages, outputs = self._compute_uncached(
+                stage, [inputs[i] for i in misses]
+            )
+
+            for i, next_stage, output in zip(misses, next_stages, outputs):
+                entries[i] = MemoEntry(next_stage, output)
+                memo_cache.put(keys[i], MemoEntry(copy.copy(next_stage), output))
+
+        # Each run gets its own next stage instance, as the cached one is shared
+        return (
+            [copy.copy(entry.next_stage) for entry in entries],
+            [entry.output for entry in entries],
+        )
+
+    def _compute_uncached(
+        self, stage: IBaseStage, inputs: List[BaseSchema]
+    ) -> Tuple[List[IBaseStage], List[BaseSchema]]:
+        memory_profiler = self.memory_profiler
+        if memory_profiler is None:
+            return self._compute_timed(stage, inputs)
+
+        state = memory_profiler.before(stage.__class__, inputs)
+        next_stages, outputs = self._compute_timed(stage, inputs)
+        memory_profiler.after(stage.__class__, state, inputs, outputs)
+
+        return next_stages, outputs
+
+    def _compute_timed(
+        self, stage: IBaseStage, inputs: List[BaseSchema]
+    ) -> Tuple[List[IBaseStage], List[BaseSchema]]:
+        profiler = self.profiler
+
+        if self.process_pool is not None and isinstance(stage, IProcessStage):
+            if profiler is None:
+                return self.process_pool.compute(stage, inputs)
+
+            # Only the round trip to the workers is seen from the controller
+            start = time.perf_counter_ns()
+            result = self.process_pool.compute(stage, inputs)
+            wall = time.perf_counter_ns() - start
+            self._record_round_trip(stage, inputs, start, wall)
+
+            return result
+
+        if profiler is None:
+            return compute_group(stage, inputs)
+
+        return profiled_compute_group(stage, inputs, profiler)
+
+    def _record_round_trip(
+        self, stage: IBaseStage, inputs: List[BaseSchema], start: int, wall: int
+    ) -> None:
+        """Records the round trip of an out-of-process computation as its compute
+        phase, with the size of the inputs sent for the profilers of the payloads.
+        """
+        profiler = self.profiler
+
+        if profiler.payloads:
+            nbytes = deep_sizeof(inputs)
+            profiler.record(
+                stage.__class__, PHASE_COMPUTE, start, wall, 0, len(inputs), nbytes
+            )
+        else:
+            profiler.record(stage.__class__, PHASE_COMPUTE, start, wall, 0, len(inputs))
+
+    def _drop_dead(
+        self, step: PlanStep, stage: IBaseStage, outputs: List[BaseSchema]
+    ) -> List[BaseSchema]:
+        """Drops the references to what a computed stage no longer needs, the input
+        and output held by the stage instance and the fields of the outputs which
+        no later stage reads, such that the memory of a run stays bounded by the
+        fields which are still live. Only used when no artifacts are captured.
+
+        Parameters
+        ----------
+        step : PlanStep
+            Compiled stage which has been computed.
+        stage : IBaseStage
+            Stage instance which computed the outputs.
+        outputs : List[BaseSchema]
+            Outputs of the stage.
+
+        Returns
+        -------
+        List[BaseSchema]
+            Outputs without the dead fields, which are set to None.
+        """
+        stage.clear()
+
+        dead_fields = step.dead_fields
+        if not dead_fields:
+            return outputs
+
+        # Memoized outputs are shared with the memo cache and are left untouched
+        if self._memoized(stage):
+            outputs = [copy.copy(output) for output in outputs]
+
+        for output in outputs:
+            for name in dead_fields:
+                setattr(output, name, None)
+
+        return outputs
+
+    def _capture_artifact(
+        self,
+        run_id: str,
+        step: PlanStep,
+        schema: BaseSchema,
+        name: Optional[str] = None,
+    ) -> None:
+        """Puts the artifact of a schema into the artifact store, keyed by the stage.
+
+        Parameters
+        ----------
+        run_id : str
+            Run id of the record.
+        step : PlanStep
+            Compiled stage the artifact is captured at.
+        schema : BaseSchema
+            Input of the stage, or output of the terminal stage.
+        name : Optional[str], optional
+            Key of the artifact, by default the name of the stage.
+        """
+        profiler, memory_profiler = self.profiler, self.memory_profiler
+        name = step.name if name is None else name
+
+        if profiler is None and memory_profiler is None:
+            self.artifact_store.put(run_id, name, schema.get_artifact())
+            return
+
+        cpu = time.thread_time_ns if profiler is not None and profiler.cpu else int
+
+        start, start_cpu = time.perf_counter_ns(), cpu()
+        artifact = schema.get_artifact()
+        self.artifact_store.put(run_id, name, artifact)
+        wall, cpu = time.perf_counter_ns() - start, cpu() - start_cpu
+
+        if profiler is not None:
+            token = current_run_ids.set((run_id,))
+            if profiler.payloads:
+                nbytes = deep_sizeof(artifact)
+                profiler.record(
+                    step.stage_class, PHASE_ARTIFACT, start, wall, cpu, 1, nbytes
+                )
+            else:
+                profiler.record(step.stage_class, PHASE_ARTIFACT, start, wall, cpu, 1)
+            current_run_ids.reset(token)
+
+        if memory_profiler is not None:
+            memory_profiler.artifact(step.stage_class, artifact)
+
+    def _run_batch(
+        self,
+        inputs: List[BaseSchema],
+        run_ids: List[str],
+        stages: Dict[type, IBaseStage],
+        capture: bool,
+    ) -> List[BaseSchema]:
+        """Walks the stage chain once for a batch of inputs, where each stage
+        computes the records routed to it as one group.
+
+        Parameters
+        ----------
+        inputs : List[BaseSchema]
+            Input dataclasses for the InitStage.
+        run_ids : List[str]
+            Run id of each input, used to key the artifacts.
+        stages : Dict[type, IBaseStage]
+            Stage instances to compute with keyed by their class, the first instance
+            returned by `get_output` for a class is set up, added and reused after
+            that. The caller releases them once done.
+        capture : bool
+            Whether to capture the artifacts into the artifact store.
+
+        Returns
+        -------
+        List[BaseSchema]
+            Terminal stage output data for each input, in the order of the inputs.
+
+        Raises
+        ------
+        ReferenceError
+            Check that the `get_output` method of a stage indeed returns an instance of
+            the next stage and not a class reference. If class reference the fail.
+        TypeError
+            If a stage returns a next stage which is not part of the compiled plan.
+        """
+        plan = self.compile()
+        outputs = [None] * len(inputs)
+
+        if self.init_stage not in stages:
+            stages[self.init_stage] = self._acquire(self.init_stage)
+
+        # Groups of (record indices, inputs) keyed by the step they are routed to
+        init_step = plan.steps[0]
+        pending = {init_step: (list(range(len(inputs))), inputs)}
+        lineage = [fingerprint(i) for i in inputs] if self.incremental else None
+        token = current_run_ids.set(())
+
+        try:
+            while pending:
+                # Steps are computed in plan order, so that records skipping stages are
+                # grouped with the records reaching the same stage later
+                step = min(pending, key=lambda step: step.index)
+                indices, group = pending.pop(step)
+                stage = stages[step.stage_class]
+                current_run_ids.set(tuple(run_ids[i] for i in indices))
+
+                if capture and not step.terminal:
+                    for i, input in zip(indices, group):
+                        self._capture_artifact(run_ids[i], step, input)
+
+                parents = None if lineage is None else [lineage[i] for i in indices]
+                next_stages, group_outputs = self._compute_group(stage, group, parents)
+
+                if lineage is not None:
+                    for i, parent in zip(indices, parents):
+                        lineage[i] = self._lineage(stage, parent)
+
+                if not capture:
+                    group_outputs = self._drop_dead(step, stage, group_outputs)
+
+                for i, next_stage, output in zip(indices, next_stages, group_outputs):
+                    if step.terminal:
+                        outputs[i] = output
+                        if capture:
+                            self._capture_artifact(run_ids[i], step, output)
+                        continue
+
+                    if isinstance(next_stage, type):
+                        raise ReferenceError(
+                            "The get_object method needs to return an instance!",
+                            next_stage,
+                        )
+
+                    # Records routed to the same stage class are computed as one group
+                    next_step = plan.step(next_stage.__class__)
+                    if next_step.stage_class not in stages:
+                        stages[next_step.stage_class] = self._acquire(next_stage)
+                    next_indices, next_group = pending.setdefault(next_step, ([], []))
+                    next_indices.append(i)
+                    next_group.append(output)
+        finally:
+            current_run_ids.reset(token)
+
+        return outputs
+
+    def start_batch(self, inputs: Iterable[BaseSchema]) -> List[Tuple[BaseSchema, str]]:
+        """Performs the computation through the pipeline for a batch of inputs,
+        walking the stage chain once. Each stage receives the records routed to it
+        as one group, which is handed over at once to stages extending `IBatchStage`
+        and computed record by record for the other stages.
+
+        Parameters
+        ----------
+        inputs : Iterable[BaseSchema]
+            Input dataclasses for the InitStage.
+
+        Returns
+        -------
+        List[Tuple[BaseSchema, str]]
+            Tuple of the terminal stage output data and a `run_id` for each input,
+            in the order of the inputs.
+        """
+        inputs = list(inputs)
+        run_ids = [str(uuid.uuid4()) for _ in inputs]
+        stages = {}
+
+        try:
+            outputs = self._run_batch(
+                inputs, run_ids, stages, self.artifact_store.enabled
+            )
+        finally:
+            for stage in stages.values():
+                self._release(stage)
+
+        return list(zip(outputs, run_ids))
+
+    def stream(
+        self,
+        inputs: Iterable[BaseSchema],
+        chunk_size: int = 1,
+        capture_artifacts: bool = False,
+    ) -> Iterator[Tuple[BaseSchema, str]]:
+        """Lazily performs the computation through the pipeline over an iterable,
+        possibly unbounded, of inputs and yields the terminal outputs. At most
+        `chunk_size` inputs are pulled from `inputs` at a time, and only once the
+        outputs of the last chunk have been consumed, so memory stays bounded by
+        the chunk size no matter how long the stream is.
+
+        The stage instances are kept for the whole stream, one per stage class, such
+        that stages can hold state across records (e.g. a loaded model). The first
+        instance returned by `get_output` for a class is reused for every record,
+        and torn down at the end of the stream unless it is reusable.
+
+        Parameters
+        ----------
+        inputs : Iterable[BaseSchema]
+            Iterable or generator of input dataclasses for the InitStage.
+        chunk_size : int, optional
+            Number of inputs computed together, handed at once to stages extending
+            `IBatchStage`, by default 1
+        capture_artifacts : bool, optional
+            Whether to capture the artifacts of each record into the artifact store,
+            which then has to be bounded for memory to stay bounded, by default False
+
+        Yields
+        ------
+        Iterator[Tuple[BaseSchema, str]]
+            Tuple of the terminal stage output data and a `run_id` for each input,
+            in the order of the inputs.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size needs to be at least 1!", chunk_size)
+
+        capture = capture_artifacts and self.artifact_store.enabled
+        iterator = iter(inputs)
+        stages = {}
+
+        try:
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    return
+
+                run_ids = [str(uuid.uuid4()) for _ in chunk]
+                outputs = self._run_batch(chunk, run_ids, stages, capture)
+
+                yield from zip(outputs, run_ids)
+        finally:
+            for stage in stages.values():
+                self._release(stage)
+
+    def map(self, inputs: Iterable[BaseSchema]) -> List[BaseSchema]:
+        """Same as `start_batch` but only returns the terminal outputs.
+
+        Parameters
+        ----------
+        inputs : Iterable[BaseSchema]
+            Input dataclasses for the InitStage.
+
+        Returns
+        -------
+        List[BaseSchema]
+            Terminal stage output data for each input, in the order of the inputs.
+        """
+        return [output for output, _ in self.start_batch(inputs)]
+
     def get_artifacts(self, run_id: str) -> dict:
         """For some `run_id` try to access the artifacts which where produced during
         that specific run.
@@ -193,6 +918,6 @@ class BaseController:
         -------
         dict
             A dictionary where the keys are the stages, and the values are the artifacts
-            produced for those stages.
+            produced for those stages. Empty if the run is no longer retained.
         """
-        return self._artifact_cache[run_id]
+        return self.artifact_store.get(run_id)
@@ -0,0 +1,296 @@
+# External imports
+from collections import deque
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Tuple, get_args
+
+# Local imports
+from ror.stages import IFanOutStage, IJoinStage, ITerminalStage
+
+from .pipeline_plan import _resolve_stage
+
+
+@dataclass(frozen=True)
+class DagStep:
+    """Compiled stage of a DAG pipeline, with its schemas and the stages linked to
+    it on either side.
+
+    Parameters
+    ----------
+    index : int
+        Position of the stage in the topological order of the pipeline.
+    stage_class : type
+        Stage class.
+    name : str
+        Name of the stage, which keys its artifacts.
+    input_schema : type
+        Input schema of the stage, a tuple of schemas for join stages.
+    output_schema : type
+        Output schema of the stage.
+    next_stages : Tuple[type, ...]
+        Next stage classes, empty for the terminal stage.
+    previous_stages : Tuple[type, ...]
+        Previous stage classes, in the order of the inputs for join stages.
+    terminal : bool
+        Whether the stage is the terminal stage.
+    join : bool
+        Whether the stage joins the outputs of several previous stages.
+    """
+
+    index: int
+    stage_class: type
+    name: str
+    input_schema: type
+    output_schema: type
+    next_stages: Tuple[type, ...]
+    previous_stages: Tuple[type, ...]
+    terminal: bool
+    join: bool
+
+
+def _next_stages(stage_class: type) -> Tuple[type, ...]:
+    """Resolves the next stage classes from the generic of a stage class.
+
+    Raises
+    ------
+    TypeError
+        If the stage class does not define its schemas, or a next stage reference
+        does not resolve to a stage class.
+    ValueError
+        If a fan out stage has no next stage or names one twice.
+    """
+    types = getattr(stage_class, "_types", ())
+    if len(types) < 2:
+        raise TypeError(
+            f"{stage_class.__name__} does not define its schemas!", stage_class
+        )
+
+    if issubclass(stage_class, ITerminalStage):
+        return ()
+
+    if not issubclass(stage_class, IFanOutStage):
+        return (_resolve_stage(types[-1], stage_class),)
+
+    next_stages = tuple(_resolve_stage(r, stage_class) for r in get_args(types[-1]))
+    if not next_stages or len(set(next_stages)) != len(next_stages):
+        raise ValueError(
+            f"The next stages of {stage_class.__name__} need to be a tuple of "
+            "distinct stage classes!",
+            stage_class,
+        )
+
+    return next_stages
+
+
+def _join_order(stage_class: type, previous: List[type]) -> Tuple[type, ...]:
+    """Orders the previous stages of a join stage by the position of their output
+    schema in the input schemas of the join.
+
+    Raises
+    ------
+    ValueError
+        If the output schemas of the previous stages do not match the input schemas
+        of the join one to one.
+    """
+    input_schemas = get_args(stage_class._types[0])
+    by_schema = {}
+
+    for previous_class in previous:
+        schema = previous_class._types[1]
+
+        if schema in by_schema or input_schemas.count(schema) != 1:
+            raise ValueError(
+                f"The output of {previous_class.__name__} does not match exactly one "
+                f"input of the join {stage_class.__name__}!",
+                previous_class,
+            )
+
+        by_schema[schema] = previous_class
+
+    if len(by_schema) != len(input_schemas):
+        raise ValueError(
+            f"The join {stage_class.__name__} takes {len(input_schemas)} inputs but "
+            f"has {len(by_schema)} previous stages!",
+            stage_class,
+        )
+
+    return tuple(by_schema[schema] for schema in input_schemas)
+
+
+@dataclass(frozen=True)
+class DagPlan:
+    """Immutable execution plan of a DAG pipeline, where fan out stages name several
+    next stages and join stages take the outputs of several previous stages. It is
+    compiled once from the generics of the stages, walking every next stage
+    reference from the init stage, with the stages in topological order.
+
+    Examples
+    --------
+    >>> from ror.controlers.common import DagPlan
+
+    >>> plan = DagPlan.compile(InitStage)
+    >>> print(plan)
+    >>> plan.step(JoinStage).previous_stages
+    """
+
+    steps: Tuple[DagStep, ...]
+    _by_class: Mapping[type, DagStep] = field(repr=False, compare=False)
+
+    @classmethod
+    def compile(cls, init_stage: type) -> "DagPlan":
+        """Walks the stage graph from the init stage to the terminal stage.
+
+        Parameters
+        ----------
+        init_stage : type
+            Reference to the InitStage class (reference and not instance).
+
+        Returns
+        -------
+        DagPlan
+            Compiled plan of the pipeline.
+
+        Raises
+        ------
+        TypeError
+            If a stage does not define its schemas or its next stages.
+        ValueError
+            If the graph has a cycle, does not end in exactly one terminal stage, a
+            stage which is not a join has several previous stages, or the inputs of a
+            join do not match its previous stages.
+        """
+        next_stages: Dict[type, Tuple[type, ...]] = {}
+        previous: Dict[type, List[type]] = {init_stage: []}
+        queue = deque([init_stage])
+
+        while queue:
+            stage_class = queue.popleft()
+            next_stages[stage_class] = _next_stages(stage_class)
+
+            for next_stage in next_stages[stage_class]:
+                if next_stage not in previous:
+                    previous[next_stage] = []
+                    queue.append(next_stage)
+
+                previous[next_stage].append(stage_class)
+
+        # Kahn's algorithm, stages left over are on a cycle
+        indegree = {stage_class: len(p) for stage_class, p in previous.items()}
+        ready = deque(s for s, degree in indegree.items() if degree == 0)
+        order = []
+
+        while ready:
+            stage_class = ready.popleft()
+            order.append(stage_class)
+
+            for next_stage in next_stages[stage_class]:
+                indegree[next_stage] -= 1
+                if indegree[next_stage] == 0:
+                    ready.append(next_stage)
+
+        if len(order) != len(next_stages):
+            cycle = next(s for s in next_stages if s not in order)
+            raise ValueError(f"The pipeline has a cycle at {cycle.__name__}!", cycle)
+
+        terminals = [s for s in order if issubclass(s, ITerminalStage)]
+        if len(terminals) != 1:
+            raise ValueError(
+                "The pipeline needs to end in exactly one terminal stage!", terminals
+            )
+
+        steps = []
+
+        for index, stage_class in enumerate(order):
+            join = issubclass(stage_class, IJoinStage)
+            previous_stages = tuple(previous[stage_class])
+
+            if join:
+                previous_stages = _join_order(stage_class, previous[stage_class])
+            elif len(previous_stages) > 1:
+                raise ValueError(
+                    f"{stage_class.__name__} has several previous stages but is not "
+                    "a join stage!",
+                    stage_class,
+                )
+
+            steps.append(
+                DagStep(
+                    index=index,
+                    stage_class=stage_class,
+                    name=stage_class.__name__,
+                    input_schema=stage_class._types[0],
+                    output_schema=stage_class._types[1],
+                    next_stages=next_stages[stage_class],
+                    previous_stages=previous_stages,
+                    terminal=not next_stages[stage_class],
+                    join=join,
+                )
+            )
+
+        by_class = {step.stage_class: step for step in steps}
+
+        return cls(tuple(steps), MappingProxyType(by_class))
+
+    @property
+    def init_stage(self) -> type:
+        return self.steps[0].stage_class
+
+    @property
+    def terminal_step(self) -> DagStep:
+        return self.steps[-1]
+
+    def step(self, stage_class: type) -> DagStep:
+        """Returns the compiled step of a stage class.
+
+        Parameters
+        ----------
+        stage_class : type
+            Stage class of the step.
+
+        Returns
+        -------
+        DagStep
+            Compiled stage.
+
+        Raises
+        ------
+        TypeError
+            If the stage class is not part of the pipeline.
+        """
+        try:
+            return self._by_class[stage_class]
+        except KeyError:
+            raise TypeError(
+                f"{stage_class.__name__} is not a stage of the pipeline!", stage_class
+            ) from None
+
+    def __contains__(self, stage_class: type) -> bool:
+        return stage_class in self._by_class
+
+    def __iter__(self) -> Iterator[DagStep]:
+        return iter(self.steps)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __str__(self) -> str:
+        lines = []
+
+        for step in self.steps:
+            input_schema = step.input_schema
+            if step.join:
+                input_schema = (
+                    f"({', '.join(s.__name__ for s in get_args(input_schema))})"
+                )
+            else:
+                input_schema = getattr(input_schema, "__name__", input_schema)
+
+            next_stages = ", ".join(s.__name__ for s in step.next_stages) or "-"
+            lines.append(
+                f"{step.index}: {step.name}"
+                f" [{input_schema}"
+                f" -> {getattr(step.output_schema, '__name__', step.output_schema)}]"
+                f" -> {next_stages}"
+            )
+
+        return "\n".join(lines)
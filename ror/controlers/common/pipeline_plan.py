@@ -0,0 +1,415 @@
+# External imports
+import dataclasses
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, ForwardRef, Iterator, List, Mapping, Optional, Tuple
+
+# Local imports
+from ror.schemas import BaseSchema, SchemaLayout
+from ror.stages import ITerminalStage
+from ror.stages.common import IBaseStage
+
+
+def _resolve_stage(reference: object, owner: type) -> type:
+    """Resolves the next stage reference of a stage class, which is a forward
+    reference when the generic was given the name of the class as a string.
+
+    Parameters
+    ----------
+    reference : object
+        Next stage reference from the generic of the stage.
+    owner : type
+        Stage class declaring the reference.
+
+    Returns
+    -------
+    type
+        Next stage class.
+
+    Raises
+    ------
+    TypeError
+        If the reference does not resolve to a stage class.
+    """
+    if isinstance(reference, ForwardRef):
+        reference = reference.__forward_arg__
+
+    if isinstance(reference, str):
+        module = sys.modules.get(owner.__module__)
+        reference = getattr(module, reference, reference)
+
+    if not isinstance(reference, type) or not issubclass(reference, IBaseStage):
+        raise TypeError(
+            f"The next stage of {owner.__name__} is not a stage class!", reference
+        )
+
+    return reference
+
+
+def _schema_layout(schema: object) -> Optional[SchemaLayout]:
+    if (
+        isinstance(schema, type)
+        and issubclass(schema, BaseSchema)
+        and dataclasses.is_dataclass(schema)
+    ):
+        return schema._layout
+
+    return None
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """Compiled stage of a pipeline, with the schemas of the stage and the mapping
+    of the fields from its input to its output.
+
+    Parameters
+    ----------
+    index : int
+        Position of the stage in the pipeline.
+    stage_class : type
+        Stage class.
+    name : str
+        Name of the stage, which keys its artifacts.
+    input_schema : type
+        Input schema of the stage.
+    output_schema : type
+        Output schema of the stage.
+    next_stage : Optional[type]
+        Next stage class, None for the terminal stage.
+    terminal : bool
+        Whether the stage is the terminal stage.
+    artifact_fields : Tuple[str, ...]
+        Perishable fields of the input, captured as the artifact of the stage.
+    carried_fields : Tuple[str, ...]
+        Persistent fields of the input which are also fields of the output.
+    computed_fields : Tuple[str, ...]
+        Fields of the output which are not carried from the input.
+    dead_fields : Tuple[str, ...]
+        Fields of the output which no later stage reads, and which the controllers
+        drop once the stage is computed when no artifacts are captured.
+    """
+
+    index: int
+    stage_class: type
+    name: str
+    input_schema: type
+    output_schema: type
+    next_stage: Optional[type]
+    terminal: bool
+    artifact_fields: Tuple[str, ...] = ()
+    carried_fields: Tuple[str, ...] = ()
+    computed_fields: Tuple[str, ...] = ()
+    dead_fields: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_stage(cls, index: int, stage_class: type) -> "PlanStep":
+        """Compiles a stage class from the types of its generic.
+
+        Parameters
+        ----------
+        index : int
+            Position of the stage in the pipeline.
+        stage_class : type
+            Stage class to compile.
+
+        Returns
+        -------
+        PlanStep
+            Compiled stage.
+
+        Raises
+        ------
+        TypeError
+            If the stage class does not define its schemas with a stage generic.
+        """
+        types = getattr(stage_class, "_types", ())
+        if len(types) < 2:
+            raise TypeError(
+                f"{stage_class.__name__} does not define its schemas!", stage_class
+            )
+
+        terminal = issubclass(stage_class, ITerminalStage)
+        input_schema, output_schema = types[0], types[1]
+        next_stage = None if terminal else _resolve_stage(types[-1], stage_class)
+
+        input_layout = _schema_layout(input_schema)
+        output_layout = _schema_layout(output_schema)
+        artifact_fields = carried_fields = computed_fields = ()
+
+        if input_layout is not None:
+            artifact_fields = input_layout.perishable_order
+
+        if output_layout is not None:
+            persistent = () if input_layout is None else input_layout.persistent_order
+            carried_fields = tuple(n for n in persistent if n in output_layout.names)
+            computed_fields = tuple(
+                n for n in output_layout.names if n not in carried_fields
+            )
+
+        return cls(
+            index=index,
+            stage_class=stage_class,
+            name=stage_class.__name__,
+            input_schema=input_schema,
+            output_schema=output_schema,
+            next_stage=next_stage,
+            terminal=terminal,
+            artifact_fields=tuple(artifact_fields),
+            carried_fields=carried_fields,
+            computed_fields=computed_fields,
+        )
+
+
+@dataclass(frozen=True)
+class PipelinePlan:
+    """Immutable execution plan of a pipeline, compiled once from the generics of
+    the stages by walking the next stage references from the init stage to the
+    terminal stage.
+
+    Examples
+    --------
+    >>> from ror.controlers.common import PipelinePlan
+
+    >>> plan = PipelinePlan.compile(InitStage)
+    >>> print(plan)
+    >>> plan.step(ForwardStage).carried_fields
+    """
+
+    steps: Tuple[PlanStep, ...]
+    _by_class: Mapping[type, PlanStep] = field(repr=False, compare=False)
+    _last_read: Mapping[str, int] = field(repr=False, compare=False)
+
+    @classmethod
+    def compile(cls, init_stage: type) -> "PipelinePlan":
+        """Walks the stage chain from the init stage to the terminal stage.
+
+        Parameters
+        ----------
+        init_stage : type
+            Reference to the InitStage class (reference and not instance).
+
+        Returns
+        -------
+        PipelinePlan
+            Compiled plan of the pipeline.
+
+        Raises
+        ------
+        TypeError
+            If a stage does not define its schemas or its next stage.
+        ValueError
+            If the stage chain has a cycle, and so no terminal stage, or if a field
+            perishes at a stage which is not part of the pipeline.
+        """
+        steps = []
+        seen = set()
+        stage_class = init_stage
+
+        while stage_class is not None:
+            if stage_class in seen:
+                raise ValueError(
+                    f"The pipeline has a cycle at {stage_class.__name__}!",
+                    stage_class,
+                )
+
+            step = PlanStep.from_stage(len(steps), stage_class)
+            steps.append(step)
+            seen.add(stage_class)
+            stage_class = step.next_stage
+
+        output_keys, last_read = cls._liveness(steps)
+
+        # Values which end up in the output of the pipeline are never dead
+        returned = set(output_keys[-1].values())
+
+        # Fields of the output which are not read after the stage are dead
+        for i, step in enumerate(steps):
+            if step.terminal or not output_keys[i]:
+                continue
+
+            dead_fields = tuple(
+                name
+                for name, key in output_keys[i].items()
+                if last_read.get(key, -1) <= step.index and key not in returned
+            )
+            steps[i] = dataclasses.replace(step, dead_fields=dead_fields)
+
+        by_class = {step.stage_class: step for step in steps}
+
+        # Last stage reading each field name, over all the values of the field
+        last_read_names: Dict[str, int] = {}
+        for (name, _), index in last_read.items():
+            last_read_names[name] = max(last_read_names.get(name, -1), index)
+
+        return cls(
+            tuple(steps), MappingProxyType(by_class), MappingProxyType(last_read_names)
+        )
+
+    @staticmethod
+    def _liveness(
+        steps: List[PlanStep],
+    ) -> Tuple[List[Dict[str, tuple]], Dict[tuple, int]]:
+        """Works out the index of the last stage reading each value of each field,
+        as the last stage whose input schema has the field, or the stage given as
+        the `perish_stage` of the field if it comes earlier.
+
+        A value of a field is keyed by the name of the field and the index of the
+        stage which computed it, -1 for the input of the init stage. Carrying the
+        field over keeps its key, while a stage computing a field of the same name
+        again, or outputting a field which perished at or before it, starts a new
+        value which the earlier `perish_stage` does not apply to.
+
+        Parameters
+        ----------
+        steps : List[PlanStep]
+            Compiled stages of the pipeline in order.
+
+        Returns
+        -------
+        Tuple[List[Dict[str, tuple]], Dict[tuple, int]]
+            Key of each field of the output of each stage, and the index of the last
+            stage reading each key.
+
+        Raises
+        ------
+        ValueError
+            If a field perishes at a stage which is not part of the pipeline.
+        """
+        indices = {step.name: step.index for step in steps}
+        perish_at: Dict[tuple, int] = {}
+
+        def perish(layout: object, keys: Dict[str, tuple]) -> None:
+            for name, stage_name in layout.perish_stages.items():
+                if stage_name not in indices:
+                    raise ValueError(
+                        f"The field {name} perishes at {stage_name} which is not "
+                        "a stage of the pipeline!",
+                        stage_name,
+                    )
+
+                # A perish stage up to the stage computing the value is the one of
+                # an earlier value of the field
+                key = keys.get(name)
+                if key is None or indices[stage_name] <= key[1]:
+                    continue
+
+                perish_at[key] = min(
+                    perish_at.get(key, len(steps)), indices[stage_name]
+                )
+
+        input_keys: List[Dict[str, tuple]] = []
+        output_keys: List[Dict[str, tuple]] = []
+        current: Dict[str, tuple] = {}
+
+        for step in steps:
+            layout = _schema_layout(step.input_schema)
+            keys = {}
+            if layout is not None:
+                keys = {name: current.get(name, (name, -1)) for name in layout.names}
+                perish(layout, keys)
+            input_keys.append(keys)
+
+            layout = _schema_layout(step.output_schema)
+            current = {}
+            if layout is not None:
+                for name in layout.names:
+                    key = keys.get(name)
+                    carried = name in step.carried_fields and key is not None
+
+                    # The stage a value perishes at is its last reader, a field of
+                    # the same name in its output may have been computed from it
+                    if carried and perish_at.get(key, len(steps)) > step.index:
+                        current[name] = key
+                    else:
+                        current[name] = (name, step.index)
+
+                perish(layout, current)
+            output_keys.append(current)
+
+        last_read: Dict[tuple, int] = {}
+
+        for step, keys in zip(steps, input_keys):
+            for key in keys.values():
+                if step.index <= perish_at.get(key, step.index):
+                    last_read[key] = step.index
+
+        return output_keys, last_read
+
+    @property
+    def init_stage(self) -> type:
+        return self.steps[0].stage_class
+
+    def step(self, stage_class: type) -> PlanStep:
+        """Returns the compiled step of a stage class.
+
+        Parameters
+        ----------
+        stage_class : type
+            Stage class of the step.
+
+        Returns
+        -------
+        PlanStep
+            Compiled stage.
+
+        Raises
+        ------
+        TypeError
+            If the stage class is not part of the pipeline.
+        """
+        try:
+            return self._by_class[stage_class]
+        except KeyError:
+            raise TypeError(
+                f"{stage_class.__name__} is not a stage of the pipeline!", stage_class
+            ) from None
+
+    def last_reader(self, name: str) -> Optional[PlanStep]:
+        """Returns the last stage reading a field, after which the field is dead.
+
+        Parameters
+        ----------
+        name : str
+            Name of the field.
+
+        Returns
+        -------
+        Optional[PlanStep]
+            Last stage reading the field, None if no stage reads it.
+        """
+        index = self._last_read.get(name)
+
+        return None if index is None else self.steps[index]
+
+    def __contains__(self, stage_class: type) -> bool:
+        return stage_class in self._by_class
+
+    def __iter__(self) -> Iterator[PlanStep]:
+        return iter(self.steps)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __str__(self) -> str:
+        lines = []
+
+        for step in self.steps:
+            next_stage = "-" if step.terminal else step.next_stage.__name__
+            lines.append(
+                f"{step.index}: {step.name}"
+                f" [{getattr(step.input_schema, '__name__', step.input_schema)}"
+                f" -> {getattr(step.output_schema, '__name__', step.output_schema)}]"
+                f" -> {next_stage}"
+            )
+
+            if step.artifact_fields:
+                lines.append(f"    artifact: {', '.join(step.artifact_fields)}")
+            if step.carried_fields:
+                lines.append(f"    carried:  {', '.join(step.carried_fields)}")
+            if step.computed_fields:
+                lines.append(f"    computed: {', '.join(step.computed_fields)}")
+            if step.dead_fields:
+                lines.append(f"    dead:     {', '.join(step.dead_fields)}")
+
+        return "\n".join(lines)
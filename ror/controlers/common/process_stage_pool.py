@@ -0,0 +1,162 @@
+# External imports
+import math
+import os
+from typing import Dict, List, Optional, Tuple
+
+# Local imports
+from ror.stages.common import IBaseStage, compute_group
+from ror.utils import shm_pickle
+
+# Stage instances of a worker process, kept for the lifetime of the process
+_WORKER_STAGES: Dict[type, IBaseStage] = {}
+
+
+def _compute_in_worker(stage_class: type, payload: bytes, threshold: int) -> tuple:
+    """Computes a chunk of inputs in a worker process, with the instance of the
+    stage class kept by this process, which is set up on its first chunk and
+    cleared after each chunk, such that it does not keep the shared memory of the
+    chunk referenced until the next one.
+    """
+    stage = _WORKER_STAGES.get(stage_class)
+    if stage is None:
+        stage = _WORKER_STAGES[stage_class] = stage_class()
+        stage.setup()
+
+    try:
+        result = compute_group(stage, shm_pickle.loads(payload))
+    finally:
+        stage.clear()
+
+    return shm_pickle.dumps(result, threshold)
+
+
+class ProcessStagePool:
+    """Pool of worker processes computing the stages extending `IProcessStage`, for
+    CPU-bound stages which do not scale with threads. The records of a group are
+    split into chunks computed in parallel, and NumPy arrays of at least
+    `threshold` bytes are handed over through shared memory instead of being
+    pickled, both ways. The workers are started on first use.
+
+    Examples
+    --------
+    >>> from ror.controlers.common import ProcessStagePool
+
+    >>> with ProcessStagePool(max_workers=64) as pool:
+    >>>     controller = BaseController(None, InitStage, process_pool=pool)
+    >>>     outputs = controller.map(inputs)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        threshold: int = shm_pickle.DEFAULT_THRESHOLD,
+        mp_context: Optional[object] = None,
+    ):
+        """Instantiates the pool, without starting the worker processes.
+
+        Parameters
+        ----------
+        max_workers : Optional[int], optional
+            Number of worker processes, by default the number of CPUs
+        chunk_size : Optional[int], optional
+            Number of records sent to a worker at once, by default the group is
+            split evenly over the workers
+        threshold : int, optional
+            Minimum number of bytes of an array to go through shared memory, by
+            default 64KiB
+        mp_context : Optional[object], optional
+            Multiprocessing context to start the workers with, by default None
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.threshold = threshold
+        self.mp_context = mp_context
+
+        self._executor: Optional["concurrent.futures.ProcessPoolExecutor"] = None
+
+    def _get_executor(self) -> "concurrent.futures.ProcessPoolExecutor":
+        if self._executor is None:
+            # Imported when the pool is first used, to keep `import ror` fast
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import resource_tracker
+
+            # The workers have to share the resource tracker of this process, which
+            # unlinks the shared memory segments if this process dies
+            resource_tracker.ensure_running()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=self.mp_context
+            )
+
+        return self._executor
+
+    def compute(self, stage: IBaseStage, inputs: list) -> Tuple[List[IBaseStage], list]:
+        """Computes a group of inputs at a stage in the worker processes.
+
+        Parameters
+        ----------
+        stage : IBaseStage
+            Stage instance of the group, only its class is sent to the workers.
+        inputs : list
+            Inputs of the group.
+
+        Returns
+        -------
+        Tuple[List[IBaseStage], list]
+            The next stage instance of each record, or None for terminal stages, and
+            the output of each record.
+        """
+        executor = self._get_executor()
+        chunk_size = self.chunk_size or max(
+            1, math.ceil(len(inputs) / self.max_workers)
+        )
+
+        futures, segments = [], []
+        next_stages, outputs = [], []
+        consumed = 0
+
+        try:
+            for start in range(0, len(inputs), chunk_size):
+                payload, chunk_segments = shm_pickle.dumps(
+                    inputs[start : start + chunk_size], self.threshold
+                )
+                segments.extend(chunk_segments)
+                futures.append(
+                    executor.submit(
+                        _compute_in_worker, stage.__class__, payload, self.threshold
+                    )
+                )
+
+            for future in futures:
+                data, result_segments = future.result()
+                consumed += 1
+                try:
+                    chunk_next_stages, chunk_outputs = shm_pickle.loads(data)
+                finally:
+                    shm_pickle.unlink(result_segments)
+
+                next_stages.extend(chunk_next_stages)
+                outputs.extend(chunk_outputs)
+        finally:
+            # On failure, wait for the chunks in flight and drop their segments
+            for future in futures[consumed:]:
+                future.cancel()
+            for future in futures[consumed:]:
+                if not future.cancelled() and future.exception() is None:
+                    shm_pickle.unlink(future.result()[1])
+
+            shm_pickle.unlink(segments)
+
+        return next_stages, outputs
+
+    def shutdown(self) -> None:
+        """Stops the worker processes, the pool is restarted on the next use."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ProcessStagePool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
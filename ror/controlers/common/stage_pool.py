@@ -0,0 +1,109 @@
+# External imports
+import threading
+from typing import Dict, List, Union
+
+# Local imports
+from ror.stages.common import IBaseStage
+
+
+class StagePool:
+    """Pool of warm stage instances kept by a controller across runs. Stages which
+    declare themselves `reusable` are instantiated and set up once, then reused by
+    the following runs until the pool is closed, while the other stages are set up
+    for the run they were created for and torn down after computing it.
+
+    A warm instance is only handed to one run at a time, as the stages keep their
+    input and output on the instance. A run acquiring a stage class whose warm
+    instances are all in use by concurrent runs gets a new one, which is set up and
+    kept, such that the pool grows to the largest number of concurrent runs.
+
+    Examples
+    --------
+    >>> from ror.controlers.common import StagePool
+
+    >>> pool = StagePool()
+    >>> stage = pool.acquire(ModelStage) # Calls `setup` once for reusable stages
+    >>> ...
+    >>> pool.release(stage) # Calls `teardown` for stages which are not reusable
+    >>> pool.close() # Calls `teardown` for the warm stages
+    """
+
+    def __init__(self):
+        # Every warm instance and the ones not acquired by a run, by stage class
+        self._warm: Dict[type, List[IBaseStage]] = {}
+        self._free: Dict[type, List[IBaseStage]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, stage: Union[type, IBaseStage]) -> IBaseStage:
+        """Returns the stage instance to compute with, a free warm instance of the
+        stage class if it is reusable, else the given stage set up for one run.
+
+        Parameters
+        ----------
+        stage : Union[type, IBaseStage]
+            Stage class or stage instance returned by the previous stage.
+
+        Returns
+        -------
+        IBaseStage
+            Stage instance which has been set up, used by no other run until it is
+            released.
+        """
+        stage_class = stage if isinstance(stage, type) else stage.__class__
+
+        if not stage_class.reusable:
+            stage = stage_class() if isinstance(stage, type) else stage
+            stage.setup()
+
+            return stage
+
+        with self._lock:
+            free = self._free.get(stage_class)
+            if free:
+                return free.pop()
+
+        # Set up outside of the lock, such that slow setups do not block the
+        # runs acquiring other stages
+        warm = stage_class() if isinstance(stage, type) else stage
+        warm.setup()
+
+        with self._lock:
+            self._warm.setdefault(stage_class, []).append(warm)
+            self._free.setdefault(stage_class, [])
+
+        return warm
+
+    def release(self, stage: IBaseStage) -> None:
+        """Tears down a stage after its run, or hands a warm instance back to the
+        pool for the next runs.
+
+        Parameters
+        ----------
+        stage : IBaseStage
+            Stage instance returned by `acquire`.
+        """
+        if not stage.reusable:
+            stage.teardown()
+            return
+
+        with self._lock:
+            warm = self._warm.get(stage.__class__, ())
+
+            # Instances acquired before the pool was closed were torn down by it
+            if any(instance is stage for instance in warm):
+                self._free[stage.__class__].append(stage)
+
+    def close(self) -> None:
+        """Tears down and drops the warm instances, the next runs set them up again."""
+        with self._lock:
+            warm, self._warm, self._free = self._warm, {}, {}
+
+        for stages in warm.values():
+            for stage in stages:
+                stage.teardown()
+
+    def __contains__(self, stage_class: type) -> bool:
+        return stage_class in self._warm
+
+    def __len__(self) -> int:
+        return sum(len(stages) for stages in self._warm.values())
@@ -0,0 +1,395 @@
+# External imports
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Local imports
+from ror.profilers.common import current_run_ids
+from ror.schemas import BaseSchema
+from ror.stages import IInitStage
+from ror.stages.common import IBaseStage
+from ror.utils.fingerprint import fingerprint
+
+from .common import BaseController, DagPlan, DagStep
+
+
+class DagController(BaseController):
+    """Controller for DAG pipelines, where fan out stages extending `IFanOutStage`
+    name several next stages and join stages extending `IJoinStage` take the
+    outputs of several previous stages. Every stage is computed as soon as all its
+    previous stages are, on a thread pool, such that independent branches run
+    concurrently and the wall-clock time of a wide pipeline approaches the one of
+    its critical path rather than the sum of its stages.
+
+    Branches releasing the GIL (NumPy, I/O) run in parallel on the threads, and
+    CPU-bound branches extending `IProcessStage` are computed in the worker
+    processes of the `process_pool` given to the controller. As with
+    `BaseController.start_batch`, each stage computes all the records of a batch
+    as one group, and all the records go through every stage of the pipeline.
+
+    Examples
+    --------
+    >>> from ror.controlers import DagController
+
+    >>> class FeatureStage(IFanOutStage[Input, Text, Tuple[PcaStage, TfidfStage]]): ...
+    >>> class PcaStage(IForwardStage[Text, PcaOutput, JoinStage]): ...
+    >>> class TfidfStage(IForwardStage[Text, TfidfOutput, JoinStage]): ...
+    >>> class JoinStage(IJoinStage[Tuple[PcaOutput, TfidfOutput], Features, Model]): ...
+
+    >>> controller = DagController(None, FeatureStage, max_workers=4)
+    >>> print(controller.compile()) # Stages in topological order
+    >>> outputs = controller.map(inputs)
+    """
+
+    def __init__(
+        self,
+        init_data: BaseSchema,
+        init_stage: IInitStage,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ):
+        """Instantiates the controller with a pipeline input and an init stage.
+
+        Parameters
+        ----------
+        init_data : BaseSchema
+            Input dataclass for the InitStage, used by `start`.
+        init_stage : IInitStage
+            Reference to the InitStage class (reference and not instance).
+        max_workers : Optional[int], optional
+            Maximum number of stages computed at once, by default the number of
+            threads of a `ThreadPoolExecutor`
+        **kwargs
+            Options of the `BaseController`, e.g. `process_pool`.
+        """
+        super().__init__(init_data, init_stage, **kwargs)
+
+        if self.checkpoint_store is not None:
+            raise ValueError("DAG pipelines can not be checkpointed and resumed!")
+
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("The max workers need to be positive!", max_workers)
+
+        self.max_workers = max_workers
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> "concurrent.futures.ThreadPoolExecutor":
+        # Imported when used, such that importing the controllers stays cheap
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="ror-dag"
+                )
+
+            return self._executor
+
+    def close(self) -> None:
+        """Stops the threads computing the stages, then tears down the warm
+        instances of the reusable stages.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
+
+        super().close()
+
+    def compile(self) -> DagPlan:
+        """Resolves the stage graph from the generics of the stages into an
+        immutable execution plan, compiled on first use and reused by every run.
+
+        Returns
+        -------
+        DagPlan
+            Compiled plan of the pipeline.
+
+        Raises
+        ------
+        TypeError
+            If one of the stages is async.
+        """
+        plan = self._plan
+
+        if plan is None or plan.init_stage is not self.init_stage:
+            plan = DagPlan.compile(self.init_stage)
+            self._check_stages(plan)
+            self._plan = plan
+
+        return plan
+
+    def discover(self) -> None:
+        """Goes through the compiled plan of the pipeline and adds rows to the discover
+        table with the links between the stages, in topological order.
+        """
+        table = self._generate_discover_table()
+
+        for step in self.compile():
+            table.add_row(
+                str(step.index),
+                step.name,
+                str(step.input_schema),
+                str(step.output_schema),
+                ", ".join(s.__name__ for s in step.next_stages) or "None",
+            )
+
+        from rich.console import Console
+
+        console = Console()
+        console.print(table)
+
+    def start(self) -> Tuple[BaseSchema, str]:
+        """Performs the computation through the pipeline and returns a tuple of the
+        output data and a `run_id` which can be used to access the artifacts. The
+        artifacts of the inputs of a join stage are keyed by the join and the
+        previous stage, e.g. `JoinStage[PcaStage]`.
+
+        Returns
+        -------
+        Tuple[BaseSchema, str]
+            Tuple of the terminal stage output data and a `run_id`
+
+        Raises
+        ------
+        ReferenceError
+            Check that the `get_output` method of a stage indeed returns instances of
+            the next stages and not class references. If class reference the fail.
+        TypeError
+            If a stage returns next stages which are not its next stages in the plan.
+        """
+        ((output, run_id),) = self.start_batch([self.init_data])
+
+        return output, run_id
+
+    def _next_instances(
+        self, step: DagStep, next_stages: list
+    ) -> Dict[type, IBaseStage]:
+        """Checks the next stages returned for each record of a group against the
+        plan, as every record goes through the same stages of a DAG pipeline.
+
+        Parameters
+        ----------
+        step : DagStep
+            Compiled stage which returned the next stages.
+        next_stages : list
+            Next stage instance, or tuple of instances for fan out stages, of each
+            record of the group.
+
+        Returns
+        -------
+        Dict[type, IBaseStage]
+            Next stage instances returned for the first record keyed by their class.
+
+        Raises
+        ------
+        ReferenceError
+            If a stage returned a class reference instead of an instance.
+        TypeError
+            If a stage returned next stages which are not its next stages.
+        """
+        expected = set(step.next_stages)
+        instances = {}
+
+        for next_stage in next_stages:
+            returned = next_stage if isinstance(next_stage, tuple) else (next_stage,)
+
+            if any(isinstance(stage, type) for stage in returned):
+                raise ReferenceError(
+                    "The get_object method needs to return an instance!", next_stage
+                )
+
+            classes = [stage.__class__ for stage in returned]
+            if len(classes) != len(expected) or set(classes) != expected:
+                raise TypeError(
+                    f"{step.name} returned {[c.__name__ for c in classes]} which are "
+                    "not its next stages!",
+                    next_stage,
+                )
+
+            if not instances:
+                instances = dict(zip(classes, returned))
+
+        return instances
+
+    def _compute_step(
+        self,
+        step: DagStep,
+        stage: IBaseStage,
+        inputs: list,
+        run_ids: List[str],
+        capture: bool,
+        parents: Optional[List[str]] = None,
+    ) -> Tuple[list, List[BaseSchema]]:
+        """Computes the records of a batch at one stage, on a thread of the pool.
+
+        Parameters
+        ----------
+        step : DagStep
+            Compiled stage to compute.
+        stage : IBaseStage
+            Stage instance to compute with.
+        inputs : list
+            Input of each record, a tuple of the previous outputs for join stages.
+        run_ids : List[str]
+            Run id of each record, used to key the artifacts.
+        capture : bool
+            Whether to capture the artifacts into the artifact store.
+        parents : Optional[List[str]], optional
+            Lineage of each input in incremental runs, by default None
+
+        Returns
+        -------
+        Tuple[list, List[BaseSchema]]
+            The next stages returned for each record and the output of each record.
+        """
+        current_run_ids.set(tuple(run_ids))
+
+        if capture and not step.terminal:
+            for run_id, input in zip(run_ids, inputs):
+                if not step.join:
+                    self._capture_artifact(run_id, step, input)
+                    continue
+
+                for previous, schema in zip(step.previous_stages, input):
+                    name = f"{step.name}[{previous.__name__}]"
+                    self._capture_artifact(run_id, step, schema, name)
+
+        next_stages, outputs = self._compute_group(stage, inputs, parents)
+
+        if capture and step.terminal:
+            for run_id, output in zip(run_ids, outputs):
+                self._capture_artifact(run_id, step, output)
+
+        return next_stages, outputs
+
+    def _run_batch(
+        self,
+        inputs: List[BaseSchema],
+        run_ids: List[str],
+        stages: Dict[type, IBaseStage],
+        capture: bool,
+    ) -> List[BaseSchema]:
+        """Computes a batch of inputs through the stage graph, submitting each stage
+        to the thread pool once all its previous stages are computed.
+
+        Parameters
+        ----------
+        inputs : List[BaseSchema]
+            Input dataclasses for the InitStage.
+        run_ids : List[str]
+            Run id of each input, used to key the artifacts.
+        stages : Dict[type, IBaseStage]
+            Stage instances to compute with keyed by their class, the first instance
+            returned by `get_output` for a class is set up, added and reused after
+            that. The caller releases them once done.
+        capture : bool
+            Whether to capture the artifacts into the artifact store.
+
+        Returns
+        -------
+        List[BaseSchema]
+            Terminal stage output data for each input, in the order of the inputs.
+
+        Raises
+        ------
+        ReferenceError
+            Check that the `get_output` method of a stage indeed returns instances of
+            the next stages and not class references. If class reference the fail.
+        TypeError
+            If a stage returns next stages which are not its next stages in the plan.
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        if not inputs:
+            return []
+
+        plan = self.compile()
+        executor = self._get_executor()
+        incremental = self.incremental
+
+        if self.init_stage not in stages:
+            stages[self.init_stage] = self._acquire(self.init_stage)
+
+        # Number of previous stages left to compute, and the outputs of the computed
+        # ones for join stages with their lineage, keyed by stage class
+        waiting = {step.stage_class: len(step.previous_stages) for step in plan}
+        joined: Dict[type, list] = {}
+        joined_lineage: Dict[type, list] = {}
+
+        running = {}
+
+        def submit(step: DagStep, group: list, parents: Optional[list]) -> None:
+            stage = stages[step.stage_class]
+            future = executor.submit(
+                self._compute_step, step, stage, group, run_ids, capture, parents
+            )
+            running[future] = (step, parents)
+
+        submit(
+            plan.steps[0],
+            inputs,
+            [fingerprint(i) for i in inputs] if incremental else None,
+        )
+        outputs = []
+
+        try:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    step, parents = running.pop(future)
+                    next_stages, group_outputs = future.result()
+
+                    if step.terminal:
+                        outputs = group_outputs
+                        continue
+
+                    lineage = None
+                    if incremental:
+                        stage = stages[step.stage_class]
+                        lineage = [self._lineage(stage, parent) for parent in parents]
+
+                    instances = self._next_instances(step, next_stages)
+
+                    for next_class in step.next_stages:
+                        if next_class not in stages:
+                            stages[next_class] = self._acquire(instances[next_class])
+
+                        next_step = plan.step(next_class)
+                        waiting[next_class] -= 1
+
+                        if not next_step.join:
+                            submit(next_step, group_outputs, lineage)
+                            continue
+
+                        position = next_step.previous_stages.index(step.stage_class)
+                        groups = joined.setdefault(
+                            next_class, [None] * len(next_step.previous_stages)
+                        )
+                        groups[position] = group_outputs
+                        lineages = joined_lineage.setdefault(
+                            next_class, [None] * len(next_step.previous_stages)
+                        )
+                        lineages[position] = lineage
+
+                        if waiting[next_class] > 0:
+                            continue
+
+                        # Each record is joined as a tuple of the previous outputs, and
+                        # its lineage from the lineages of the previous outputs
+                        lineages = joined_lineage.pop(next_class)
+                        join_parents = None
+                        if incremental:
+                            join_parents = [fingerprint(p) for p in zip(*lineages)]
+                        submit(
+                            next_step, list(zip(*joined.pop(next_class))), join_parents
+                        )
+        except BaseException:
+            # The stages of the branches still running are released by the caller
+            wait(running)
+            raise
+
+        return outputs
@@ -0,0 +1,92 @@
+# External imports
+import time
+from typing import List, Tuple, Union
+
+# Local imports
+from ror.distributed import Coordinator
+from ror.schemas import BaseSchema
+from ror.stages import IInitStage
+from ror.stages.common import IBaseStage
+
+from .common import BaseController
+
+
+class DistributedController(BaseController):
+    """Controller spreading the stages over `StageWorker` processes, possibly on
+    several machines. The stages hosted by the workers of the coordinator are
+    computed on the workers, the group of records of such a stage being split over
+    the least loaded workers hosting it, while the other stages are computed in the
+    controller process. Artifacts are captured by the controller from the inputs
+    and outputs it sends and receives.
+
+    Examples
+    --------
+    >>> from ror.controlers import DistributedController
+    >>> from ror.distributed import Coordinator
+
+    On each machine, e.g. `python -m ror.distributed 0.0.0.0:7100 app.FeatureStage`.
+
+    >>> with Coordinator([("10.0.0.1", 7100), ("10.0.0.2", 7100)]) as coordinator:
+    >>>     controller = DistributedController(None, InitStage, coordinator)
+    >>>     outputs = controller.map(inputs)
+    """
+
+    def __init__(
+        self,
+        init_data: BaseSchema,
+        init_stage: IInitStage,
+        coordinator: Coordinator,
+        **kwargs,
+    ):
+        """Instantiates the controller with a pipeline input and an init stage.
+
+        Parameters
+        ----------
+        init_data : BaseSchema
+            Input dataclass for the InitStage, used by `start`.
+        init_stage : IInitStage
+            Reference to the InitStage class (reference and not instance).
+        coordinator : Coordinator
+            Coordinator of the workers the hosted stages are computed on.
+        **kwargs
+            Options of the `BaseController`, e.g. `artifact_store`.
+        """
+        super().__init__(init_data, init_stage, **kwargs)
+
+        self.coordinator = coordinator
+
+    def _remote(self, stage: Union[type, IBaseStage]) -> bool:
+        return self.coordinator.hosts(
+            stage if isinstance(stage, type) else stage.__class__
+        )
+
+    def _acquire(self, stage: Union[type, IBaseStage]) -> IBaseStage:
+        # Stages hosted by the workers are set up in the workers
+        if self._remote(stage):
+            return stage() if isinstance(stage, type) else stage
+
+        return super()._acquire(stage)
+
+    def _release(self, stage: IBaseStage) -> None:
+        if self._remote(stage):
+            return
+
+        super()._release(stage)
+
+    def _compute_timed(
+        self, stage: IBaseStage, inputs: List[BaseSchema]
+    ) -> Tuple[List[IBaseStage], List[BaseSchema]]:
+        if not self._remote(stage):
+            return super()._compute_timed(stage, inputs)
+
+        profiler = self.profiler
+        if profiler is None:
+            return self.coordinator.compute(stage, inputs)
+
+        # Only the round trip to the workers is seen from the controller
+        start = time.perf_counter_ns()
+        result = self.coordinator.compute(stage, inputs)
+        wall = time.perf_counter_ns() - start
+        self._record_round_trip(stage, inputs, start, wall)
+
+        return result
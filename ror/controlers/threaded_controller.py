@@ -0,0 +1,325 @@
+# External imports
+import queue
+import threading
+import uuid
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Local imports
+from ror.profilers.common import current_run_ids
+from ror.schemas import BaseSchema
+from ror.stages import IBatchStage, IInitStage, IProcessStage
+from ror.stages.common import IBaseStage
+from ror.utils.fingerprint import fingerprint
+
+from .common import BaseController, PlanStep
+
+# Seconds between checks of the stop event while blocked on a queue
+_POLL_INTERVAL = 0.05
+
+
+class _Failure:
+    """Result marker for an exception raised in a stage worker."""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+class _StageWorker(threading.Thread):
+    """Worker thread computing all the records routed to one stage class, reading
+    them from a bounded queue and dispatching the outputs to the next stage.
+    """
+
+    def __init__(
+        self, controller: "ThreadedController", step: PlanStep, stage: IBaseStage
+    ):
+        super().__init__(name=f"ror-{step.name}", daemon=True)
+
+        self.controller = controller
+        self.step = step
+        self.stage = stage
+        self.queue = queue.Queue(maxsize=controller.queue_size)
+
+    def _next_group(self) -> Optional[list]:
+        stop = self.controller._stop
+
+        while not stop.is_set():
+            try:
+                group = [self.queue.get(timeout=_POLL_INTERVAL)]
+                break
+            except queue.Empty:
+                continue
+        else:
+            return None
+
+        # Batch and process stages also take whatever else is already waiting in the
+        # queue, the latter to compute the records in parallel in the process pool
+        if isinstance(self.stage, (IBatchStage, IProcessStage)):
+            while len(group) < self.controller.queue_size:
+                try:
+                    group.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+        return group
+
+    def _compute(self, group: list) -> None:
+        controller = self.controller
+        terminal = self.step.terminal
+        current_run_ids.set(tuple(run_id for _, run_id, _, _ in group))
+
+        if controller._capture and not terminal:
+            for _, run_id, input, _ in group:
+                controller._capture_artifact(run_id, self.step, input)
+
+        # Lineage of each input in incremental runs, None otherwise
+        parents = [parent for *_, parent in group]
+        next_stages, outputs = controller._compute_group(
+            self.stage,
+            [input for _, _, input, _ in group],
+            parents if controller.incremental else None,
+        )
+
+        if not controller._capture:
+            outputs = controller._drop_dead(self.step, self.stage, outputs)
+
+        if controller.incremental:
+            parents = [controller._lineage(self.stage, parent) for parent in parents]
+
+        for (index, run_id, _, _), next_stage, output, parent in zip(
+            group, next_stages, outputs, parents
+        ):
+            if terminal:
+                if controller._capture:
+                    controller._capture_artifact(run_id, self.step, output)
+                controller._results.put((index, run_id, output))
+            else:
+                controller._dispatch(next_stage, (index, run_id, output, parent))
+
+    def run(self) -> None:
+        controller = self.controller
+
+        while True:
+            group = self._next_group()
+            if group is None:
+                return
+
+            try:
+                # Computed in its own frame, such that no reference to the records
+                # is held while waiting for the next group
+                self._compute(group)
+                del group
+            except BaseException as exception:
+                controller._stop.set()
+                controller._results.put(_Failure(exception))
+                return
+
+
+class ThreadedController(BaseController):
+    """Controller which pipelines the computation of many inputs, where every stage
+    class is computed on its own worker thread and the stages are connected by
+    bounded queues. Stage k can then work on record i while stage k+1 works on
+    record i-1, which for stages releasing the GIL (NumPy, I/O) brings the
+    throughput close to the one of the slowest stage.
+
+    As with `BaseController.stream`, one instance is kept per stage class for the
+    whole run and stages extending `IBatchStage` are handed whatever records are
+    waiting in their queue at once.
+
+    Examples
+    --------
+    >>> from ror.controlers import ThreadedController
+
+    >>> controller = ThreadedController(None, InitStage, queue_size=16)
+    >>> outputs = controller.map(inputs)
+    >>> for output, run_id in controller.stream(generator_of_inputs): ...
+    """
+
+    def __init__(
+        self,
+        init_data: BaseSchema,
+        init_stage: IInitStage,
+        queue_size: int = 16,
+        max_in_flight: int = 64,
+        **kwargs,
+    ):
+        """Instantiates the controller with a pipeline input and an init stage.
+
+        Parameters
+        ----------
+        init_data : BaseSchema
+            Input dataclass for the InitStage, used by `start`.
+        init_stage : IInitStage
+            Reference to the InitStage class (reference and not instance).
+        queue_size : int, optional
+            Capacity of the queue in front of each stage, by default 16
+        max_in_flight : int, optional
+            Maximum number of records in the pipeline at once, by default 64
+        **kwargs
+            Options of the `BaseController`, e.g. `artifact_store`.
+        """
+        super().__init__(init_data, init_stage, **kwargs)
+
+        if queue_size < 1 or max_in_flight < 1:
+            raise ValueError("The queue size and max in flight need to be positive!")
+
+        self.queue_size = queue_size
+        self.max_in_flight = max_in_flight
+
+        self._lock = threading.Lock()
+        self._running = False
+
+    def _dispatch(
+        self, stage: IBaseStage, item: Tuple[int, str, BaseSchema, Optional[str]]
+    ) -> None:
+        """Puts a record on the queue of the worker of the stage class, starting the
+        worker with this stage instance if there is none yet.
+
+        Parameters
+        ----------
+        stage : IBaseStage
+            Stage instance returned for the record, set up if it starts a worker.
+        item : Tuple[int, str, BaseSchema, Optional[str]]
+            Index of the record, its run id, the input for the stage and the lineage
+            of the input in incremental runs, else None.
+
+        Raises
+        ------
+        ReferenceError
+            Check that the `get_output` method of a stage indeed returns an instance of
+            the next stage and not a class reference. If class reference the fail.
+        TypeError
+            If the stage is not part of the compiled plan.
+        """
+        if isinstance(stage, type):
+            raise ReferenceError(
+                "The get_object method needs to return an instance!", stage
+            )
+
+        with self._lock:
+            worker = self._workers.get(stage.__class__)
+
+            if worker is None:
+                step = self._plan.step(stage.__class__)
+                worker = self._workers[stage.__class__] = _StageWorker(
+                    self, step, self._acquire(stage)
+                )
+                worker.start()
+
+        while not self._stop.is_set():
+            try:
+                worker.queue.put(item, timeout=_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _shutdown(self) -> None:
+        self._stop.set()
+
+        for worker in list(self._workers.values()):
+            worker.join()
+            self._release(worker.stage)
+
+        self._running = False
+
+    def stream(
+        self,
+        inputs: Iterable[BaseSchema],
+        capture_artifacts: bool = False,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[BaseSchema, str]]:
+        """Lazily performs the pipelined computation over an iterable, possibly
+        unbounded, of inputs and yields the terminal outputs. At most
+        `max_in_flight` records are in the pipeline or waiting to be consumed at
+        once, and full queues block the stage in front of them.
+
+        Parameters
+        ----------
+        inputs : Iterable[BaseSchema]
+            Iterable or generator of input dataclasses for the InitStage.
+        capture_artifacts : bool, optional
+            Whether to capture the artifacts of each record into the artifact store,
+            which then has to be bounded for memory to stay bounded, by default False
+        ordered : bool, optional
+            Yield the outputs in the order of the inputs, else as soon as they are
+            computed, by default True
+
+        Yields
+        ------
+        Iterator[Tuple[BaseSchema, str]]
+            Tuple of the terminal stage output data and a `run_id` for each input.
+
+        Raises
+        ------
+        RuntimeError
+            If the controller is already running a stream.
+        """
+        self.compile()
+
+        with self._lock:
+            if self._running:
+                raise RuntimeError("The controller is already running a stream!")
+            self._running = True
+
+        self._capture = capture_artifacts and self.artifact_store.enabled
+        self._stop = threading.Event()
+        self._results = queue.Queue()
+        self._workers: Dict[type, _StageWorker] = {}
+
+        iterator = iter(inputs)
+        init_stage = self.init_stage()
+        fed = yielded = 0
+        exhausted = False
+        pending: Dict[int, Tuple[BaseSchema, str]] = {}
+
+        try:
+            while True:
+                while not exhausted and fed - yielded < self.max_in_flight:
+                    if self._stop.is_set():
+                        break
+
+                    try:
+                        input = next(iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    parent = fingerprint(input) if self.incremental else None
+                    self._dispatch(init_stage, (fed, str(uuid.uuid4()), input, parent))
+                    fed += 1
+
+                if exhausted and yielded == fed:
+                    return
+
+                result = self._results.get()
+                if isinstance(result, _Failure):
+                    raise result.exception
+
+                index, run_id, output = result
+                if not ordered:
+                    yielded += 1
+                    yield output, run_id
+                    continue
+
+                pending[index] = (output, run_id)
+                while yielded in pending:
+                    output_run = pending.pop(yielded)
+                    yielded += 1
+                    yield output_run
+        finally:
+            self._shutdown()
+
+    def start_batch(self, inputs: Iterable[BaseSchema]) -> List[Tuple[BaseSchema, str]]:
+        """Performs the pipelined computation for a batch of inputs.
+
+        Parameters
+        ----------
+        inputs : Iterable[BaseSchema]
+            Input dataclasses for the InitStage.
+
+        Returns
+        -------
+        List[Tuple[BaseSchema, str]]
+            Tuple of the terminal stage output data and a `run_id` for each input,
+            in the order of the inputs.
+        """
+        return list(self.stream(inputs, capture_artifacts=self.artifact_store.enabled))
@@ -0,0 +1,2 @@
+from .coordinator import Coordinator, WorkerInfo
+from .stage_worker import StageWorker
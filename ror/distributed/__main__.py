@@ -0,0 +1,3 @@
+from .stage_worker import main
+
+main()
@@ -0,0 +1,367 @@
+# External imports
+import math
+import threading
+import time
+from collections import deque
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+# Local imports
+from ror.caches.common import stage_path
+from ror.stages.common import IBaseStage
+
+from .stage_worker import Address, _is_local
+
+
+class WorkerInfo(NamedTuple):
+    """State of a worker as seen by a coordinator.
+
+    Attributes
+    ----------
+    address : Address
+        Address of the worker.
+    pid : int
+        Process id of the worker on its machine.
+    stages : Tuple[str, ...]
+        Import paths of the stage classes hosted by the worker.
+    in_flight : int
+        Records sent to the worker which it has not answered yet.
+    alive : bool
+        Whether the connection to the worker is open.
+    """
+
+    address: Address
+    pid: int
+    stages: Tuple[str, ...]
+    in_flight: int
+    alive: bool
+
+
+class _WorkerDown(ConnectionError):
+    """Raised for the requests to a worker whose connection was lost."""
+
+
+class _WorkerConnection:
+    """Connection of a coordinator to one worker, on which requests are pipelined
+    and answered in order, read back by a thread resolving their futures.
+    """
+
+    def __init__(self, address: Address, connection: object):
+        _, stages, pid = connection.recv()
+
+        self.address = address
+        self.pid = pid
+        self.stages = frozenset(stages)
+        self.alive = True
+
+        # Records sent and not answered, and the groups the worker was computing
+        # when it last answered, which includes those of other coordinators
+        self.in_flight = 0
+        self.busy = 0
+
+        # Chunks routed to the worker, which spreads the chunks over idle workers
+        self.routed = 0
+
+        self._connection = connection
+        self._pending = deque()
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+
+        threading.Thread(
+            target=self._read, name=f"ror-coordinator-{pid}", daemon=True
+        ).start()
+
+    @property
+    def load(self) -> int:
+        return self.in_flight + self.busy
+
+    def submit(self, path: str, inputs: list) -> "concurrent.futures.Future":
+        """Sends a group of inputs to compute at a stage, the caller has already
+        added them to `in_flight`.
+        """
+        from concurrent.futures import Future
+
+        future = Future()
+        item = (future, len(inputs))
+
+        with self._send_lock:
+            with self._pending_lock:
+                if not self.alive:
+                    self.in_flight -= len(inputs)
+                    raise _WorkerDown(f"The worker {self.address} is down!")
+                self._pending.append(item)
+
+            try:
+                self._connection.send(("compute", path, inputs))
+            except Exception as exception:
+                with self._pending_lock:
+                    self._pending.remove(item)
+                    self.in_flight -= len(inputs)
+
+                if isinstance(exception, OSError):
+                    self._fail()
+                    raise _WorkerDown(
+                        f"The worker {self.address} is down!"
+                    ) from exception
+                raise
+
+        return future
+
+    def _read(self) -> None:
+        while True:
+            try:
+                tag, *payload = self._connection.recv()
+            except (EOFError, OSError):
+                self._fail()
+                return
+            except Exception as exception:
+                # The reply could not be unpickled, the worker is still up
+                tag, payload = "error", (exception,)
+
+            with self._pending_lock:
+                future, records = self._pending.popleft()
+                self.in_flight -= records
+
+            if tag == "result":
+                result, self.busy = payload
+                future.set_result(result)
+            else:
+                future.set_exception(payload[0])
+
+    def _fail(self) -> None:
+        """Marks the worker as down and fails the requests it has not answered."""
+        with self._pending_lock:
+            self.alive = False
+            pending, self._pending = self._pending, deque()
+            self.in_flight = 0
+
+        for future, _ in pending:
+            future.set_exception(_WorkerDown(f"The worker {self.address} is down!"))
+
+    def close(self) -> None:
+        with self._send_lock:
+            self._connection.close()
+
+    def info(self) -> WorkerInfo:
+        return WorkerInfo(
+            self.address,
+            self.pid,
+            tuple(sorted(self.stages)),
+            self.in_flight,
+            self.alive,
+        )
+
+
+class Coordinator:
+    """Client of a set of `StageWorker` processes, possibly on other machines, which
+    dispatches the groups of records of the stages they host. The group of a stage
+    is split into chunks, each sent to the live worker hosting the stage with the
+    least load, counted as the records it has not answered yet plus the groups it
+    reported computing for other coordinators, and to the worker sent the fewest
+    chunks among equally loaded workers. Chunks sent to a worker which goes
+    down are sent again to the other workers hosting the stage.
+
+    The workers are connected to on first use, and retried until `connect_timeout`
+    to let them start.
+
+    Examples
+    --------
+    >>> from ror.distributed import Coordinator
+
+    >>> with Coordinator([("10.0.0.1", 7100), ("10.0.0.2", 7100)], authkey=b"secret") as coordinator:
+    >>>     controller = DistributedController(None, InitStage, coordinator)
+    >>>     outputs = controller.map(inputs)
+    """
+
+    def __init__(
+        self,
+        addresses: Iterable[Address],
+        authkey: Optional[bytes] = None,
+        chunk_size: Optional[int] = None,
+        connect_timeout: float = 10.0,
+    ):
+        """Instantiates the coordinator, without connecting to the workers.
+
+        Parameters
+        ----------
+        addresses : Iterable[Address]
+            Addresses of the workers, (host, port) tuples for TCP or paths of Unix
+            sockets.
+        authkey : Optional[bytes], optional
+            Key to authenticate to the workers with, by default None, which is only
+            allowed for workers on Unix sockets and loopback addresses
+        chunk_size : Optional[int], optional
+            Number of records sent to a worker at once, by default the group is
+            split evenly over the workers hosting the stage
+        connect_timeout : float, optional
+            Seconds to retry connecting to a worker for, by default 10.0
+
+        Raises
+        ------
+        ValueError
+            If there is no `authkey` and a worker is not local to the machine.
+        """
+        self.addresses = list(addresses)
+
+        for address in self.addresses:
+            if not authkey and not _is_local(address):
+                raise ValueError(
+                    f"Connecting to the worker {address} needs an authkey, since "
+                    "the messages it sends are unpickled!"
+                )
+
+        self.authkey = authkey
+        self.chunk_size = chunk_size
+        self.connect_timeout = connect_timeout
+
+        self._workers: Optional[List[_WorkerConnection]] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Coordinator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _connect(self, address: Address) -> _WorkerConnection:
+        from multiprocessing.connection import Client
+
+        deadline = time.monotonic() + self.connect_timeout
+
+        while True:
+            try:
+                return _WorkerConnection(address, Client(address, authkey=self.authkey))
+            except (ConnectionRefusedError, FileNotFoundError):
+                if time.monotonic() > deadline:
+                    raise ConnectionError(
+                        f"Can not connect to the worker {address}!", address
+                    )
+                time.sleep(0.05)
+
+    def connect(self) -> None:
+        """Connects to the workers and receives the stages they host, done on first
+        use otherwise.
+
+        Raises
+        ------
+        ConnectionError
+            If a worker can not be connected to within `connect_timeout`.
+        """
+        with self._lock:
+            if self._workers is None:
+                self._workers = [self._connect(address) for address in self.addresses]
+
+    def workers(self) -> List[WorkerInfo]:
+        """Returns the state of the workers.
+
+        Returns
+        -------
+        List[WorkerInfo]
+            State of each worker, in the order of the addresses.
+        """
+        self.connect()
+
+        return [worker.info() for worker in self._workers]
+
+    def hosts(self, stage_class: type) -> bool:
+        """Whether a live worker hosts a stage class.
+
+        Parameters
+        ----------
+        stage_class : type
+            Stage class.
+
+        Returns
+        -------
+        bool
+            True if the stage is computed by the workers.
+        """
+        self.connect()
+        path = stage_path(stage_class)
+
+        return any(w.alive and path in w.stages for w in self._workers)
+
+    def _route(self, path: str, records: int) -> _WorkerConnection:
+        """Picks the least loaded live worker hosting a stage, and reserves the
+        records of a chunk on it.
+
+        Raises
+        ------
+        ConnectionError
+            If no live worker hosts the stage.
+        """
+        with self._lock:
+            candidates = [w for w in self._workers if w.alive and path in w.stages]
+            if not candidates:
+                raise ConnectionError(f"No live worker hosts the stage {path}!", path)
+
+            worker = min(candidates, key=lambda w: (w.load, w.routed))
+            worker.in_flight += records
+            worker.routed += 1
+
+        return worker
+
+    def _submit(self, path: str, chunk: list) -> "concurrent.futures.Future":
+        while True:
+            worker = self._route(path, len(chunk))
+            try:
+                return worker.submit(path, chunk)
+            except _WorkerDown:
+                continue
+
+    def compute(self, stage: IBaseStage, inputs: list) -> Tuple[List[IBaseStage], list]:
+        """Computes a group of inputs at a stage on the workers hosting it.
+
+        Parameters
+        ----------
+        stage : IBaseStage
+            Stage instance of the group, only its class is sent to the workers.
+        inputs : list
+            Inputs of the group.
+
+        Returns
+        -------
+        Tuple[List[IBaseStage], list]
+            The next stage instance of each record, or None for terminal stages, and
+            the output of each record.
+
+        Raises
+        ------
+        ConnectionError
+            If no live worker hosts the stage.
+        """
+        self.connect()
+        path = stage_path(stage.__class__)
+
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            hosting = sum(1 for w in self._workers if w.alive and path in w.stages)
+            chunk_size = max(1, math.ceil(len(inputs) / max(1, hosting)))
+
+        chunks = [
+            inputs[start : start + chunk_size]
+            for start in range(0, len(inputs), chunk_size)
+        ]
+        futures = [self._submit(path, chunk) for chunk in chunks]
+        next_stages, outputs = [], []
+
+        for chunk, future in zip(chunks, futures):
+            while True:
+                try:
+                    chunk_next_stages, chunk_outputs = future.result()
+                    break
+                except _WorkerDown:
+                    # The worker went down, the chunk is sent to another one
+                    future = self._submit(path, chunk)
+
+            next_stages.extend(chunk_next_stages)
+            outputs.extend(chunk_outputs)
+
+        return next_stages, outputs
+
+    def close(self) -> None:
+        """Closes the connections to the workers, which keep running."""
+        with self._lock:
+            workers, self._workers = self._workers or [], None
+
+        for worker in workers:
+            worker.close()
@@ -0,0 +1,273 @@
+"""Worker process hosting stage classes for the `Coordinator` of a
+`DistributedController`, which can be started on any machine with
+
+    python -m ror.distributed HOST:PORT package.module.StageClass ...
+
+or with the path of a Unix socket instead of `HOST:PORT`. The `ROR_AUTHKEY`
+environment variable sets the key the coordinator has to authenticate with, a random
+key is generated and printed if it is not set and the worker listens on TCP on
+another address than loopback.
+"""
+
+# External imports
+import argparse
+import importlib
+import os
+import secrets
+import threading
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+# Local imports
+from ror.caches.common import stage_path
+from ror.stages.common import IBaseStage, compute_group
+
+# Address of a worker, a (host, port) tuple for TCP or a path for a Unix socket
+Address = Union[Tuple[str, int], str]
+
+
+def _is_local(address: Address) -> bool:
+    """Whether only the local machine can connect to the address, a Unix socket or a
+    loopback host.
+    """
+    if isinstance(address, str):
+        return True
+
+    host = address[0]
+    if host == "localhost":
+        return True
+
+    import ipaddress
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        # Host names other than localhost, and "" for all the interfaces
+        return False
+
+
+class StageWorker:
+    """Server computing the groups of records sent by coordinators at the stage
+    classes it hosts. Each stage class is instantiated and set up once when the
+    worker starts and kept until it stops, and the stage classes, inputs, outputs and
+    next stage instances are pickled, so have to be importable on both sides.
+
+    Every coordinator connecting to the worker is first sent the import paths of the
+    hosted stage classes, then requests are answered in order on each connection.
+    Connections are served on their own thread, and each stage instance computes one
+    group at a time.
+
+    Pickled messages can execute code when loaded, so an `authkey` is required to
+    listen on TCP on another address than loopback, and workers should only listen on
+    trusted networks.
+
+    Examples
+    --------
+    >>> from ror.distributed import StageWorker
+
+    >>> worker = StageWorker([FeatureStage, InferenceStage], ("0.0.0.0", 7100), authkey=b"secret")
+    >>> worker.serve_forever()
+    """
+
+    def __init__(
+        self,
+        stages: Iterable[type],
+        address: Address,
+        authkey: Optional[bytes] = None,
+    ):
+        """Instantiates the worker and starts listening, without serving yet.
+
+        Parameters
+        ----------
+        stages : Iterable[type]
+            Stage classes hosted by the worker.
+        address : Address
+            A (host, port) tuple to listen on TCP, the port can be 0 for any free
+            port, or the path of a Unix socket.
+        authkey : Optional[bytes], optional
+            Key the coordinators have to authenticate with, by default None, which is
+            only allowed for Unix sockets and loopback addresses
+
+        Raises
+        ------
+        ValueError
+            If there is no `authkey` and the address is not local to the machine.
+        """
+        from multiprocessing.connection import Listener
+
+        if not authkey and not _is_local(address):
+            raise ValueError(
+                f"A worker listening on {address} needs an authkey, since the "
+                "messages it receives are unpickled!"
+            )
+
+        self._stage_classes = {stage_path(stage): stage for stage in stages}
+        self._stages: Dict[str, IBaseStage] = {}
+        self._locks = {path: threading.Lock() for path in self._stage_classes}
+
+        # Number of groups being computed, reported to the coordinators
+        self._busy = 0
+        self._busy_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._serving = False
+
+        self._listener = Listener(address, authkey=authkey)
+
+    @property
+    def address(self) -> Address:
+        """Address the worker listens on, with the actual port for port 0."""
+        return self._listener.address
+
+    def _compute(self, path: str, inputs: list) -> tuple:
+        stage = self._stages.get(path)
+        if stage is None:
+            raise LookupError(f"The worker does not host the stage {path}!", path)
+
+        with self._busy_lock:
+            self._busy += 1
+
+        try:
+            with self._locks[path]:
+                return compute_group(stage, inputs)
+        finally:
+            with self._busy_lock:
+                self._busy -= 1
+
+    def _serve_connection(self, connection: object) -> None:
+        """Answers the requests of one coordinator until it disconnects."""
+        with connection:
+            connection.send(("register", list(self._stage_classes), os.getpid()))
+
+            while not self._closed.is_set():
+                try:
+                    _, path, inputs = connection.recv()
+                except (EOFError, OSError):
+                    return
+                except Exception as exception:
+                    # The request could not be unpickled, e.g. a schema can not be
+                    # imported by the worker, and is answered with the error
+                    reply = ("error", exception)
+                else:
+                    try:
+                        reply = ("result", self._compute(path, inputs), self._busy)
+                    except Exception as exception:
+                        reply = ("error", exception)
+
+                try:
+                    connection.send(reply)
+                except (EOFError, OSError):
+                    return
+                except Exception as exception:
+                    # The reply could not be pickled
+                    connection.send(("error", RuntimeError(repr(exception))))
+
+    def serve_forever(self) -> None:
+        """Sets up the stages and serves the coordinators until `close` is called,
+        then tears down the stages.
+        """
+        self._serving = True
+
+        for path, stage_class in self._stage_classes.items():
+            stage = self._stages[path] = stage_class()
+            stage.setup()
+
+        try:
+            while not self._closed.is_set():
+                try:
+                    connection = self._listener.accept()
+                except Exception:
+                    # A coordinator failed to authenticate, or `close` woke us up
+                    continue
+
+                if self._closed.is_set():
+                    connection.close()
+                    break
+
+                threading.Thread(
+                    target=self._serve_connection,
+                    args=(connection,),
+                    name="ror-worker",
+                    daemon=True,
+                ).start()
+        finally:
+            self._listener.close()
+
+            for stage in self._stages.values():
+                stage.teardown()
+
+    def close(self) -> None:
+        """Stops accepting coordinators, `serve_forever` then returns. The
+        connections already accepted are served until the coordinators close them.
+        """
+        import socket
+
+        self._closed.set()
+        if not self._serving:
+            self._listener.close()
+            return
+
+        address = self.address
+
+        # A blocking accept is not interrupted by closing the listener, so it is
+        # woken up by a connection
+        try:
+            if isinstance(address, str):
+                with socket.socket(socket.AF_UNIX) as wake:
+                    wake.connect(address)
+            else:
+                host = "127.0.0.1" if address[0] in ("", "0.0.0.0") else address[0]
+                socket.create_connection((host, address[1])).close()
+        except OSError:
+            pass
+
+
+def _import_stage(path: str) -> type:
+    """Imports a stage class from its import path, e.g. `package.module.Stage`."""
+    module_name, _, name = path.rpartition(".")
+    attributes = [name]
+
+    while module_name:
+        try:
+            obj = importlib.import_module(module_name)
+        except ModuleNotFoundError:
+            module_name, _, name = module_name.rpartition(".")
+            attributes.insert(0, name)
+            continue
+
+        for attribute in attributes:
+            obj = getattr(obj, attribute)
+
+        return obj
+
+    raise ImportError(f"Can not import the stage {path}!", path)
+
+
+def _parse_address(address: str) -> Address:
+    host, _, port = address.rpartition(":")
+
+    return (host, int(port)) if host and port.isdigit() else address
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("address", help="HOST:PORT to listen on, or a socket path")
+    parser.add_argument("stages", nargs="+", help="Import paths of the stages")
+    args = parser.parse_args()
+
+    address = _parse_address(args.address)
+    authkey = os.environ.get("ROR_AUTHKEY")
+
+    if not authkey and not _is_local(address):
+        authkey = secrets.token_hex(16)
+        print(f"Generated the authkey {authkey}, set ROR_AUTHKEY to choose one")
+
+    worker = StageWorker(
+        [_import_stage(path) for path in args.stages],
+        address,
+        authkey=authkey.encode() if authkey else None,
+    )
+    print(f"Serving {', '.join(args.stages)} on {worker.address}", flush=True)
+
+    try:
+        worker.serve_forever()
+    except KeyboardInterrupt:
+        worker.close()
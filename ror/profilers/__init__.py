@@ -0,0 +1,4 @@
+from .common import IStageProfiler
+from .memory_profiler import FieldMemory, MemoryProfiler, StageMemory
+from .timing_profiler import PhaseTimings, TimingProfiler
+from .trace_profiler import TraceProfiler
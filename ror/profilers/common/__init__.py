@@ -0,0 +1,10 @@
+from .i_stage_profiler import (
+    PHASE_ARTIFACT,
+    PHASE_COMPUTE,
+    PHASE_GET_OUTPUT,
+    PHASE_SET_INPUT,
+    PHASES,
+    IStageProfiler,
+    current_run_ids,
+)
+from .log_histogram import LogHistogram
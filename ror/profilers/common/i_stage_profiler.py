@@ -0,0 +1,86 @@
+# External imports
+from contextvars import ContextVar
+from typing import Optional, Tuple
+
+# Phases of a stage reported to the profilers
+PHASE_SET_INPUT = "set_input"
+PHASE_COMPUTE = "compute"
+PHASE_GET_OUTPUT = "get_output"
+PHASE_ARTIFACT = "artifact"
+
+PHASES = (PHASE_SET_INPUT, PHASE_COMPUTE, PHASE_GET_OUTPUT, PHASE_ARTIFACT)
+
+# Run ids of the records the current thread or task is computing, set by the
+# controllers such that the profilers can attribute the phases to the runs
+current_run_ids: ContextVar[Tuple[str, ...]] = ContextVar("current_run_ids", default=())
+
+
+class IStageProfiler:
+    """Interface for the profilers the controllers report the phases of the stages
+    to. A phase is a call of `set_input`, `compute`, `get_output` (or their batch
+    variants) or the capture of an artifact, for one or more records.
+
+    Examples
+    --------
+    >>> from ror.profilers import TimingProfiler
+
+    >>> profiler = TimingProfiler()
+    >>> controller = BaseController(data, InitStage, profiler=profiler)
+    >>> controller.start()
+    >>> controller.report() # Prints the table of the profiler
+    """
+
+    # Whether the controllers measure the CPU time of the phases for this profiler
+    cpu: bool = True
+
+    # Whether the controllers measure the size of the payloads for this profiler
+    payloads: bool = False
+
+    def record(
+        self,
+        stage: type,
+        phase: str,
+        start: int,
+        wall: int,
+        cpu: int,
+        records: int,
+        nbytes: Optional[int] = None,
+    ) -> None:
+        """Records a phase of a stage, called from the thread which ran the phase.
+        The run ids of its records are in `current_run_ids`.
+
+        Parameters
+        ----------
+        stage : type
+            Stage class.
+        phase : str
+            One of `set_input`, `compute`, `get_output` or `artifact`.
+        start : int
+            Start of the phase from `time.perf_counter_ns`.
+        wall : int
+            Wall time of the phase in nanoseconds.
+        cpu : int
+            CPU time of the calling thread in nanoseconds, 0 when not measured, e.g.
+            for awaited or out-of-process computations.
+        records : int
+            Number of records of the call.
+        nbytes : Optional[int], optional
+            Estimated size of the inputs of `set_input` and of out-of-process
+            computations, of the outputs of `get_output` and of the artifacts, only
+            passed when `payloads` is set, by default None
+        """
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Drops what has been recorded so far."""
+        raise NotImplementedError
+
+    def to_table(self) -> "rich.table.Table":
+        """Renders what has been recorded as a table.
+
+        Returns
+        -------
+        rich.table.Table
+            Table to print with a rich console.
+        """
+        raise NotImplementedError
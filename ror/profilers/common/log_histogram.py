@@ -0,0 +1,118 @@
+# External imports
+from typing import List
+
+# Sub-buckets per power of two, the relative error of the quantiles is 1 / 2**BITS
+_SUB_BITS = 3
+_SUB_BUCKETS = 1 << _SUB_BITS
+_SUB_MASK = _SUB_BUCKETS - 1
+
+# Enough buckets for values up to 2**64
+_BUCKETS = (64 - _SUB_BITS + 1) * _SUB_BUCKETS
+
+
+def _bucket_bounds(bucket: int) -> tuple:
+    if bucket < _SUB_BUCKETS:
+        return bucket, bucket + 1
+
+    shift = bucket // _SUB_BUCKETS - 1
+    low = (_SUB_BUCKETS + bucket % _SUB_BUCKETS) << shift
+
+    return low, low + (1 << shift)
+
+
+class LogHistogram:
+    """Histogram of non-negative integers with log-linear buckets, where every
+    power of two is split into 8 buckets. Adding a value is a few integer
+    operations and the quantiles are within 12.5% of the exact ones, which is
+    enough to tell the p50 and p99 of a stage apart at a constant memory cost.
+
+    Examples
+    --------
+    >>> from ror.profilers.common import LogHistogram
+
+    >>> histogram = LogHistogram()
+    >>> for value in (1_000, 2_000, 40_000): histogram.add(value)
+    >>> histogram.quantile(0.5)
+    """
+
+    __slots__ = ("_counts", "count", "min", "max")
+
+    def __init__(self):
+        self._counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.min = 0
+        self.max = 0
+
+    def add(self, value: int) -> None:
+        """Adds a value to the histogram.
+
+        Parameters
+        ----------
+        value : int
+            Non-negative value, e.g. a duration in nanoseconds.
+        """
+        if value < _SUB_BUCKETS:
+            bucket = value if value > 0 else 0
+        else:
+            shift = value.bit_length() - _SUB_BITS - 1
+            bucket = (shift + 1) * _SUB_BUCKETS + ((value >> shift) & _SUB_MASK)
+
+        self._counts[bucket] += 1
+
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile of the values, as the middle of the bucket it falls
+        into clamped to the observed minimum and maximum.
+
+        Parameters
+        ----------
+        q : float
+            Quantile between 0 and 1, e.g. 0.99 for the p99.
+
+        Returns
+        -------
+        float
+            Estimated quantile, 0 if the histogram is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("The quantile needs to be between 0 and 1!", q)
+
+        if not self.count:
+            return 0.0
+
+        rank = max(1, round(q * self.count))
+        seen = 0
+
+        for bucket, count in enumerate(self._counts):
+            seen += count
+
+            if seen >= rank:
+                low, high = _bucket_bounds(bucket)
+                return float(min(max((low + high - 1) / 2, self.min), self.max))
+
+        return float(self.max)
+
+    def merge(self, other: "LogHistogram") -> None:
+        """Adds the values of another histogram to this one.
+
+        Parameters
+        ----------
+        other : LogHistogram
+            Histogram to merge.
+        """
+        if not other.count:
+            return
+
+        for bucket, count in enumerate(other._counts):
+            if count:
+                self._counts[bucket] += count
+
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
@@ -0,0 +1,438 @@
+# External imports
+import sys
+import threading
+import tracemalloc
+from dataclasses import fields as dataclass_fields
+from typing import Dict, List, Optional, Tuple
+
+# Local imports
+from ror.utils.sizeof import deep_sizeof
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+# Roles of the schemas whose fields are measured
+ROLE_INPUT = "input"
+ROLE_OUTPUT = "output"
+ROLE_ARTIFACT = "artifact"
+
+
+def _peak_rss() -> int:
+    """Peak resident set size of the process in bytes, 0 where it is unknown."""
+    if resource is None:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageMemory:
+    """Memory accounting of one stage class over all its computations.
+
+    Attributes
+    ----------
+    stage : type
+        Stage class.
+    calls : int
+        Number of computed groups.
+    records : int
+        Number of computed records.
+    allocated : int
+        Net bytes allocated over all the computations, which are still allocated
+        after the computation, e.g. retained by the outputs.
+    peak : int
+        Largest number of bytes allocated at once during a computation, above what
+        was allocated before it.
+    rss_growth : int
+        Bytes by which the peak RSS of the process grew during the computations.
+    """
+
+    __slots__ = ("stage", "calls", "records", "allocated", "peak", "rss_growth")
+
+    def __init__(self, stage: type):
+        self.stage = stage
+        self.calls = 0
+        self.records = 0
+        self.allocated = 0
+        self.peak = 0
+        self.rss_growth = 0
+
+
+class FieldMemory:
+    """Deep size of one field of the schemas seen at one stage class.
+
+    Attributes
+    ----------
+    stage : type
+        Stage class.
+    role : str
+        Schema of the stage the field belongs to, `input`, `output` or `artifact`.
+    name : str
+        Name of the field.
+    persistent : bool
+        Whether the field is persistent in its schema.
+    samples : int
+        Number of measured values.
+    total : int
+        Sum of the deep sizes of the values in bytes.
+    max : int
+        Largest deep size of a value in bytes.
+    """
+
+    __slots__ = ("stage", "role", "name", "persistent", "samples", "total", "max")
+
+    def __init__(self, stage: type, role: str, name: str, persistent: bool):
+        self.stage = stage
+        self.role = role
+        self.name = name
+        self.persistent = persistent
+        self.samples = 0
+        self.total = 0
+        self.max = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.samples if self.samples else 0.0
+
+
+class MemoryProfiler:
+    """Opt-in profiler attributing memory to the stages of a pipeline and to the
+    fields of their schemas. For every computation of a stage it records the bytes
+    allocated through `tracemalloc` and the growth of the peak RSS of the process,
+    and for every input, output and artifact schema the deep size of each field.
+
+    The report lists the fields retaining the most bytes, and flags the persistent
+    fields which stay large over many stages, as these are carried through the
+    pipeline and are candidates to be made perishable.
+
+    Tracing allocations slows Python down considerably, and both the allocations
+    and the RSS are process-wide, so the attribution is only exact when a single
+    record is computed at a time. Allocations in the workers of a process pool are
+    not seen.
+
+    Examples
+    --------
+    >>> from ror.profilers import MemoryProfiler
+
+    >>> profiler = MemoryProfiler(large_field=1024**2)
+    >>> controller = BaseController(data, InitStage, memory_profiler=profiler)
+    >>> controller.start()
+
+    >>> profiler.top_fields(5)
+    >>> profiler.large_persistent_fields() # {"X": ["InitStage", "ModelStage"]}
+    >>> controller.report() # Prints the stage and field tables
+    """
+
+    def __init__(
+        self,
+        trace: bool = True,
+        fields: bool = True,
+        large_field: int = 1024**2,
+        min_stages: int = 2,
+    ):
+        """Instantiates the profiler, `tracemalloc` is started on the first stage.
+
+        Parameters
+        ----------
+        trace : bool, optional
+            Whether to trace the allocations with `tracemalloc`, by default True
+        fields : bool, optional
+            Whether to measure the deep size of the fields, by default True
+        large_field : int, optional
+            Mean deep size in bytes from which a field is large, by default 1MiB
+        min_stages : int, optional
+            Number of stages a persistent field has to be large at to be flagged,
+            by default 2
+        """
+        self.trace = trace
+        self.fields = fields
+        self.large_field = large_field
+        self.min_stages = min_stages
+
+        self._stages: Dict[type, StageMemory] = {}
+        self._fields: Dict[Tuple[type, str, str], FieldMemory] = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+
+    def _start_tracing(self) -> None:
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def close(self) -> None:
+        """Stops `tracemalloc` if the profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def before(self, stage: type, inputs: list) -> tuple:
+        """Called by the controller before computing a group of inputs.
+
+        Parameters
+        ----------
+        stage : type
+            Stage class.
+        inputs : list
+            Input schemas of the group.
+
+        Returns
+        -------
+        tuple
+            State to give back to `after`.
+        """
+        if self.fields:
+            for input in inputs:
+                self._measure(stage, ROLE_INPUT, input)
+
+        self._start_tracing()
+
+        if tracemalloc.is_tracing():
+            reset_peak = getattr(tracemalloc, "reset_peak", None)
+
+            if reset_peak is not None:
+                current, _ = tracemalloc.get_traced_memory()
+                reset_peak()
+            else:
+                # Python 3.8 has no `reset_peak`, clearing the traces resets both the
+                # traced memory and its peak, and frees of earlier blocks are no
+                # longer counted
+                tracemalloc.clear_traces()
+                current = 0
+        else:
+            current = None
+
+        return current, _peak_rss()
+
+    def after(self, stage: type, state: tuple, inputs: list, outputs: list) -> None:
+        """Called by the controller after computing a group of inputs.
+
+        Parameters
+        ----------
+        stage : type
+            Stage class.
+        state : tuple
+            State returned by `before`.
+        inputs : list
+            Input schemas of the group.
+        outputs : list
+            Output schemas of the group.
+        """
+        before, rss_before = state
+        allocated = peak = 0
+
+        if before is not None and tracemalloc.is_tracing():
+            current, traced_peak = tracemalloc.get_traced_memory()
+            allocated = current - before
+            peak = max(traced_peak - before, 0)
+
+        rss_growth = _peak_rss() - rss_before
+
+        with self._lock:
+            memory = self._stages.get(stage)
+            if memory is None:
+                memory = self._stages[stage] = StageMemory(stage)
+
+            memory.calls += 1
+            memory.records += len(inputs)
+            memory.allocated += allocated
+            memory.peak = max(memory.peak, peak)
+            memory.rss_growth += rss_growth
+
+        if self.fields:
+            for output in outputs:
+                self._measure(stage, ROLE_OUTPUT, output)
+
+    def artifact(self, stage: type, artifact: object) -> None:
+        """Called by the controller with every captured artifact.
+
+        Parameters
+        ----------
+        stage : type
+            Stage class the artifact is keyed by.
+        artifact : object
+            Captured artifact.
+        """
+        if self.fields:
+            self._measure(stage, ROLE_ARTIFACT, artifact)
+
+    def _measure(self, stage: type, role: str, schema: object) -> None:
+        # Join stages take a tuple of the outputs of their previous stages
+        if isinstance(schema, tuple):
+            for item in schema:
+                self._measure(stage, role, item)
+            return
+
+        layout = getattr(schema.__class__, "_layout", None)
+
+        if layout is not None:
+            names, persistent = layout.names, layout.persistent
+        else:
+            # Artifacts only hold perishable fields next to their standard fields
+            standard = schema.get_standard_fields()
+            names = [f.name for f in dataclass_fields(schema) if f.name not in standard]
+            persistent = ()
+
+        sizes = [(name, deep_sizeof(getattr(schema, name))) for name in names]
+
+        with self._lock:
+            for name, size in sizes:
+                key = (stage, role, name)
+                field = self._fields.get(key)
+                if field is None:
+                    field = self._fields[key] = FieldMemory(
+                        stage, role, name, name in persistent
+                    )
+
+                field.samples += 1
+                field.total += size
+                field.max = max(field.max, size)
+
+    def stage(self, stage: type) -> Optional[StageMemory]:
+        """Returns the memory accounting of a stage class.
+
+        Parameters
+        ----------
+        stage : type
+            Stage class.
+
+        Returns
+        -------
+        Optional[StageMemory]
+            Accounting of the stage, None if it has not been computed.
+        """
+        return self._stages.get(stage)
+
+    def stages(self) -> List[StageMemory]:
+        """Returns the memory accounting of every stage, in the order the stages were
+        first computed.
+
+        Returns
+        -------
+        List[StageMemory]
+            Accounting of each stage.
+        """
+        return list(self._stages.values())
+
+    def top_fields(self, n: Optional[int] = 10) -> List[FieldMemory]:
+        """Returns the fields retaining the most bytes, by mean deep size.
+
+        Parameters
+        ----------
+        n : Optional[int], optional
+            Number of fields, by default 10, None for all.
+
+        Returns
+        -------
+        List[FieldMemory]
+            Fields by decreasing mean deep size.
+        """
+        fields = sorted(self._fields.values(), key=lambda f: f.mean, reverse=True)
+
+        return fields if n is None else fields[:n]
+
+    def large_persistent_fields(self) -> Dict[str, List[str]]:
+        """Returns the persistent fields which are large in the inputs of at least
+        `min_stages` stages, as they are carried through the pipeline.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            Names of the stages each flagged field is large at, keyed by field name.
+        """
+        stages: Dict[str, List[str]] = {}
+
+        for field in self._fields.values():
+            if (
+                field.role == ROLE_INPUT
+                and field.persistent
+                and field.mean >= self.large_field
+            ):
+                stages.setdefault(field.name, []).append(field.stage.__name__)
+
+        return {
+            name: names
+            for name, names in stages.items()
+            if len(names) >= self.min_stages
+        }
+
+    def reset(self) -> None:
+        """Drops what has been recorded so far."""
+        with self._lock:
+            self._stages = {}
+            self._fields = {}
+
+    def to_table(self) -> "rich.table.Table":
+        """Renders the memory accounting of the stages as a table.
+
+        Returns
+        -------
+        rich.table.Table
+            Table to print with a rich console.
+        """
+        from rich.table import Table
+
+        table = Table(title="Memory")
+
+        table.add_column("Stage Name", style="magenta")
+        table.add_column("Calls", justify="right")
+        table.add_column("Records", justify="right")
+        table.add_column("Allocated (KiB)", justify="right", style="green")
+        table.add_column("Peak (KiB)", justify="right", style="red")
+        table.add_column("RSS Growth (KiB)", justify="right", style="red")
+
+        for memory in self.stages():
+            table.add_row(
+                memory.stage.__name__,
+                str(memory.calls),
+                str(memory.records),
+                f"{memory.allocated / 1024:.1f}",
+                f"{memory.peak / 1024:.1f}",
+                f"{memory.rss_growth / 1024:.1f}",
+            )
+
+        return table
+
+    def fields_table(self, n: Optional[int] = 10) -> "rich.table.Table":
+        """Renders the fields retaining the most bytes as a table, where the large
+        persistent fields are flagged.
+
+        Parameters
+        ----------
+        n : Optional[int], optional
+            Number of fields, by default 10, None for all.
+
+        Returns
+        -------
+        rich.table.Table
+            Table to print with a rich console.
+        """
+        from rich.table import Table
+
+        flagged = self.large_persistent_fields()
+        table = Table(title="Fields")
+
+        table.add_column("Stage Name", style="magenta")
+        table.add_column("Schema", style="cyan")
+        table.add_column("Field", style="green")
+        table.add_column("Persistent", justify="center")
+        table.add_column("Mean (KiB)", justify="right")
+        table.add_column("Max (KiB)", justify="right", style="red")
+        table.add_column("Flag", style="red")
+
+        for field in self.top_fields(n):
+            flag = field.role == ROLE_INPUT and field.name in flagged
+            table.add_row(
+                field.stage.__name__,
+                field.role,
+                field.name,
+                "yes" if field.persistent else "no",
+                f"{field.mean / 1024:.1f}",
+                f"{field.max / 1024:.1f}",
+                f"large over {len(flagged[field.name])} stages" if flag else "",
+            )
+
+        return table
@@ -0,0 +1,255 @@
+# External imports
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# Local imports
+from .common import PHASES, IStageProfiler, LogHistogram
+
+
+class PhaseTimings:
+    """Timings of one phase of one stage class, with the totals and a histogram
+    of the wall time per call.
+
+    Attributes
+    ----------
+    stage : type
+        Stage class.
+    phase : str
+        One of `set_input`, `compute`, `get_output` or `artifact`.
+    calls : int
+        Number of calls.
+    records : int
+        Number of records over all the calls, more than the calls for batches.
+    wall : int
+        Total wall time in nanoseconds.
+    cpu : int
+        Total CPU time in nanoseconds.
+    histogram : LogHistogram
+        Wall time per call in nanoseconds.
+    """
+
+    __slots__ = ("stage", "phase", "calls", "records", "wall", "cpu", "histogram")
+
+    def __init__(self, stage: type, phase: str):
+        self.stage = stage
+        self.phase = phase
+        self.calls = 0
+        self.records = 0
+        self.wall = 0
+        self.cpu = 0
+        self.histogram = LogHistogram()
+
+    @property
+    def p50(self) -> float:
+        return self.histogram.quantile(0.5)
+
+    @property
+    def p95(self) -> float:
+        return self.histogram.quantile(0.95)
+
+    @property
+    def p99(self) -> float:
+        return self.histogram.quantile(0.99)
+
+    @property
+    def throughput(self) -> float:
+        """Records per second of wall time spent in the phase."""
+        return self.records * 1e9 / self.wall if self.wall else 0.0
+
+    def to_dict(self) -> dict:
+        """Returns the timings as plain values, with the times in nanoseconds.
+
+        Returns
+        -------
+        dict
+            Calls, records, totals, quantiles and throughput of the phase.
+        """
+        return {
+            "calls": self.calls,
+            "records": self.records,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "p50": self.p50,
+            "p95": self.p95,
+            "p99": self.p99,
+            "throughput": self.throughput,
+        }
+
+
+class TimingProfiler(IStageProfiler):
+    """Profiler recording the wall time, the CPU time and the call and record counts
+    of every phase of every stage class, with a histogram of the wall time per call
+    to report the p50, p95 and p99. A controller without a profiler does not time
+    anything.
+
+    Recording a phase only appends to a buffer, which is folded into the timings
+    every `buffer_size` phases and when the timings are queried, such that the
+    overhead on the stages stays around a microsecond. Reading the CPU time of the
+    thread is a system call on most platforms, set `cpu` to False to skip it.
+
+    Examples
+    --------
+    >>> from ror.profilers import TimingProfiler
+
+    >>> profiler = TimingProfiler()
+    >>> controller = BaseController(data, InitStage, profiler=profiler)
+    >>> controller.map(inputs)
+
+    >>> profiler.timings(InferenceStage, "compute").p99 # Nanoseconds
+    >>> controller.report() # Prints a table of the timings
+    """
+
+    def __init__(self, cpu: bool = True, buffer_size: int = 4096):
+        """Instantiates the profiler without any timings.
+
+        Parameters
+        ----------
+        cpu : bool, optional
+            Whether to measure the CPU time of the phases, by default True
+        buffer_size : int, optional
+            Number of phases buffered before being folded into the timings, by
+            default 4096
+        """
+        if buffer_size < 1:
+            raise ValueError("The buffer size needs to be positive!", buffer_size)
+
+        self.cpu = cpu
+        self.buffer_size = buffer_size
+
+        self._timings: Dict[Tuple[type, str], PhaseTimings] = {}
+        self._lock = threading.Lock()
+        # Appends and pops of a deque are atomic, no phase is lost to a fold
+        self._buffer = deque()
+
+    def record(
+        self,
+        stage: type,
+        phase: str,
+        start: int,
+        wall: int,
+        cpu: int,
+        records: int,
+        nbytes: Optional[int] = None,
+    ) -> None:
+        buffer = self._buffer
+        buffer.append((stage, phase, wall, cpu, records))
+
+        if len(buffer) >= self.buffer_size:
+            self._fold()
+
+    def _fold(self) -> None:
+        """Folds the buffered phases into the timings."""
+        buffer = self._buffer
+        timings_of = self._timings
+
+        with self._lock:
+            while True:
+                try:
+                    stage, phase, wall, cpu, records = buffer.popleft()
+                except IndexError:
+                    return
+
+                timings = timings_of.get((stage, phase))
+                if timings is None:
+                    timings = timings_of[(stage, phase)] = PhaseTimings(stage, phase)
+
+                timings.calls += 1
+                timings.records += records
+                timings.wall += wall
+                timings.cpu += cpu
+                timings.histogram.add(wall)
+
+    def timings(self, stage: type, phase: str) -> Optional[PhaseTimings]:
+        """Returns the timings of a phase of a stage class.
+
+        Parameters
+        ----------
+        stage : type
+            Stage class.
+        phase : str
+            One of `set_input`, `compute`, `get_output` or `artifact`.
+
+        Returns
+        -------
+        Optional[PhaseTimings]
+            Timings of the phase, None if it has not been recorded.
+        """
+        self._fold()
+
+        return self._timings.get((stage, phase))
+
+    def stages(self) -> List[type]:
+        """Returns the stage classes recorded so far, in the order they were first
+        recorded.
+
+        Returns
+        -------
+        List[type]
+            Stage classes.
+        """
+        self._fold()
+
+        return list(dict.fromkeys(stage for stage, _ in self._timings))
+
+    def summary(self) -> Dict[str, Dict[str, dict]]:
+        """Returns the timings as plain values keyed by stage name and phase, e.g.
+        to be logged or dumped as JSON.
+
+        Returns
+        -------
+        Dict[str, Dict[str, dict]]
+            Timings of each phase of each stage, see `PhaseTimings.to_dict`.
+        """
+        summary = {}
+
+        for stage in self.stages():
+            summary[stage.__name__] = {
+                phase: self._timings[(stage, phase)].to_dict()
+                for phase in PHASES
+                if (stage, phase) in self._timings
+            }
+
+        return summary
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buffer.clear()
+            self._timings = {}
+
+    def to_table(self) -> "rich.table.Table":
+        from rich.table import Table
+
+        table = Table(title="Timings")
+
+        table.add_column("Stage Name", style="magenta")
+        table.add_column("Phase", style="cyan")
+        table.add_column("Calls", justify="right")
+        table.add_column("Records", justify="right")
+        table.add_column("Wall (ms)", justify="right", style="green")
+        table.add_column("CPU (ms)", justify="right", style="green")
+        table.add_column("p50 (µs)", justify="right")
+        table.add_column("p95 (µs)", justify="right")
+        table.add_column("p99 (µs)", justify="right", style="red")
+        table.add_column("Records/s", justify="right")
+
+        for stage in self.stages():
+            for phase in PHASES:
+                timings = self._timings.get((stage, phase))
+                if timings is None:
+                    continue
+
+                table.add_row(
+                    stage.__name__,
+                    phase,
+                    str(timings.calls),
+                    str(timings.records),
+                    f"{timings.wall / 1e6:.3f}",
+                    f"{timings.cpu / 1e6:.3f}",
+                    f"{timings.p50 / 1e3:.1f}",
+                    f"{timings.p95 / 1e3:.1f}",
+                    f"{timings.p99 / 1e3:.1f}",
+                    f"{timings.throughput:.0f}",
+                )
+
+        return table
@@ -0,0 +1,255 @@
+# External imports
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# Local imports
+from .common import IStageProfiler, current_run_ids
+
+
+def _track() -> Tuple[Hashable, str]:
+    """Key and name of the track of the caller, its asyncio task if it runs in
+    one, since the tasks of a loop interleave on its thread, or else its thread.
+    """
+    thread = threading.current_thread()
+
+    # asyncio is only looked up if it has been imported by the async controller
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is not None:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        if task is not None:
+            name = task.get_name()
+            return (thread.ident, name), f"{name} ({thread.name})"
+
+    return thread.ident, thread.name
+
+
+class TraceProfiler(IStageProfiler):
+    """Profiler recording every phase of every stage as a span, with the run ids of
+    its records, the process, the thread or asyncio task which ran it and the size
+    of its payload, and exporting the spans in the Chrome trace event format which
+    opens in Perfetto (https://ui.perfetto.dev) or `chrome://tracing`.
+
+    Each thread, and each task of the async controller, is a track of the trace,
+    such that the stages computing concurrently show as overlapping spans and the
+    time a stage waits on the others as gaps in its track. Out-of-process
+    computations, in the process pool or on distributed workers, show as one
+    compute span for the round trip, on the track of the thread waiting on it.
+
+    Examples
+    --------
+    >>> from ror.profilers import TraceProfiler
+
+    >>> tracer = TraceProfiler()
+    >>> controller = ThreadedController(None, InitStage, profiler=tracer)
+    >>> controller.map(inputs)
+
+    >>> tracer.write("pipeline.trace.json") # Open in https://ui.perfetto.dev
+    >>> controller.report() # Prints the busy and idle time of every track
+    """
+
+    def __init__(
+        self,
+        cpu: bool = False,
+        payloads: bool = True,
+        max_spans: Optional[int] = 1_000_000,
+        name: str = "ror",
+    ):
+        """Instantiates the profiler without any spans.
+
+        Parameters
+        ----------
+        cpu : bool, optional
+            Whether to measure the CPU time of the phases, by default False
+        payloads : bool, optional
+            Whether to measure the size of the inputs, outputs and artifacts of the
+            phases, which walks the payloads after each phase, by default True
+        max_spans : Optional[int], optional
+            Number of most recent spans kept, by default 1,000,000, None keeps all
+        name : str, optional
+            Name of the controller process in the trace, by default "ror"
+        """
+        if max_spans is not None and max_spans < 1:
+            raise ValueError("The maximum number of spans needs to be positive!")
+
+        self.cpu = cpu
+        self.payloads = payloads
+        self.max_spans = max_spans
+        self.name = name
+
+        # Appends to a deque are atomic, the spans need no lock
+        self._spans = deque(maxlen=max_spans)
+        self._tracks: Dict[Hashable, str] = {}
+        self._origin = time.perf_counter_ns()
+
+    def record(
+        self,
+        stage: type,
+        phase: str,
+        start: int,
+        wall: int,
+        cpu: int,
+        records: int,
+        nbytes: Optional[int] = None,
+    ) -> None:
+        key, name = _track()
+        if key not in self._tracks:
+            self._tracks[key] = name
+
+        self._spans.append(
+            (
+                stage,
+                phase,
+                start,
+                wall,
+                cpu,
+                records,
+                nbytes,
+                current_run_ids.get(),
+                os.getpid(),
+                key,
+            )
+        )
+
+    def events(self) -> List[dict]:
+        """Returns the spans as Chrome trace events, complete events with the times
+        in microseconds from the creation of the profiler, preceded by the metadata
+        events naming the process and the tracks.
+
+        Returns
+        -------
+        List[dict]
+            Trace events, in the order the spans were recorded.
+        """
+        tids: Dict[Tuple[int, Hashable], int] = {}
+        spans = []
+        origin = self._origin
+
+        for stage, phase, start, wall, cpu, records, nbytes, run_ids, pid, key in list(
+            self._spans
+        ):
+            tid = tids.setdefault((pid, key), len(tids) + 1)
+
+            args = {"stage": stage.__name__, "records": records, "run_ids": run_ids}
+            if nbytes is not None:
+                args["bytes"] = nbytes
+            if self.cpu:
+                args["cpu_us"] = cpu / 1e3
+
+            spans.append(
+                {
+                    "name": f"{stage.__name__}.{phase}",
+                    "cat": phase,
+                    "ph": "X",
+                    "ts": (start - origin) / 1e3,
+                    "dur": wall / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+
+        metadata = []
+        for pid in dict.fromkeys(pid for pid, _ in tids):
+            metadata.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": 0,
+                    "args": {"name": self.name},
+                }
+            )
+
+        for (pid, key), tid in tids.items():
+            metadata.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": self._tracks.get(key, str(key))},
+                }
+            )
+            metadata.append(
+                {
+                    "name": "thread_sort_index",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"sort_index": tid},
+                }
+            )
+
+        return metadata + spans
+
+    def to_dict(self) -> dict:
+        """Returns the trace as the JSON object of the Chrome trace event format.
+
+        Returns
+        -------
+        dict
+            Object with the `traceEvents`, see `events`.
+        """
+        return {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        """Writes the trace to a JSON file, to open in Perfetto or Chrome.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, conventionally ending in `.json`.
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file)
+
+    def reset(self) -> None:
+        self._spans.clear()
+        self._tracks = {}
+        self._origin = time.perf_counter_ns()
+
+    def to_table(self) -> "rich.table.Table":
+        from rich.table import Table
+
+        # Spans, busy time, first start and last end of each track
+        tracks: Dict[Hashable, list] = {}
+        for _, _, start, wall, *_, key in list(self._spans):
+            track = tracks.get(key)
+            if track is None:
+                tracks[key] = [1, wall, start, start + wall]
+                continue
+
+            track[0] += 1
+            track[1] += wall
+            track[2] = min(track[2], start)
+            track[3] = max(track[3], start + wall)
+
+        table = Table(title="Trace")
+
+        table.add_column("Track", style="magenta")
+        table.add_column("Spans", justify="right")
+        table.add_column("Busy (ms)", justify="right", style="green")
+        table.add_column("Idle (ms)", justify="right", style="red")
+        table.add_column("Busy (%)", justify="right")
+
+        for key, (spans, busy, first, last) in tracks.items():
+            elapsed = last - first
+
+            table.add_row(
+                self._tracks.get(key, str(key)),
+                str(spans),
+                f"{busy / 1e6:.3f}",
+                f"{max(elapsed - busy, 0) / 1e6:.3f}",
+                f"{100 * busy / elapsed:.1f}" if elapsed else "100.0",
+            )
+
+        return table
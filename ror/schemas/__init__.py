@@ -1 +1,7 @@
-from .common import ArtifactSchema, BaseSchema
+from .common import (
+    ArtifactSchema,
+    BaseSchema,
+    BatchSchema,
+    SchemaLayout,
+    slotted_schema,
+)
@@ -1,2 +1,5 @@
 from .artifact_schema import ArtifactSchema
 from .base_schema import BaseSchema
+from .batch_schema import BatchSchema
+from .schema_layout import SchemaLayout
+from .slotted_schema import slotted_schema
@@ -1,11 +1,13 @@
 # External imports
-from dataclasses import dataclass, fields, make_dataclass
-from typing import List, Set
+from dataclasses import dataclass
+from typing import List, Set, Type, TypeVar
 
 # Local imports
-from ror.utils._const import FIELD_PERSISTANCE
-
 from .artifact_schema import ArtifactSchema
+from .carrier import _carriers, get_carrier
+from .schema_layout import SchemaLayoutDescriptor
+
+_Schema = TypeVar("_Schema", bound="BaseSchema")
 
 
 @dataclass
@@ -35,8 +37,18 @@ class BaseSchema:
     Where Output does not contain field B as it is marked perishable in the input,
     and thus this data is only used in the computation for this stage and not
     propagated further from the output data of this stage.
+
+    Schemas of records which are in flight by the millions can be slotted, with
+    `@dataclass(slots=True)` from Python 3.10 or `slotted_schema` before, such that
+    their instances do not carry a `__dict__`.
     """
 
+    # No `__dict__` is added here, such that slotted subclasses have none either
+    __slots__ = ()
+
+    # Field layout of the schema class, see `SchemaLayout`
+    _layout = SchemaLayoutDescriptor()
+
     def _del_fields(self, fields: List[str]) -> dict:
         """Given a list of field key names in the dataclass, remove these from
         the dataclass instance.
@@ -52,7 +64,7 @@ class BaseSchema:
             Dictionary representation of the new data which will be in the
             dataclass after removal.
         """
-        _temp = self.__dict__.copy()
+        _temp = {name: getattr(self, name) for name in self._layout.names}
 
         for field in fields:
             _temp.pop(field)
@@ -73,7 +85,7 @@ class BaseSchema:
         List[str]
             List of strings representing the key/field names in dataclass.
         """
-        return [v.name for v in fields(schema)]
+        return list(schema._layout.names)
 
     def _get_perishables(self, schema: dataclass) -> List[str]:
         """Similar to `self._get_fields` but extracts only the list of key/field
@@ -89,7 +101,7 @@ class BaseSchema:
         List[str]
             List of strings representing the perishable key/field names.
         """
-        return [v.name for v in fields(schema) if not v.metadata[FIELD_PERSISTANCE]]
+        return list(schema._layout.perishable_order)
 
     def _validate_retire(self, fields: Set[str]) -> None:
         """Given a set of unique field names to retire/drop from the dataclass
@@ -107,11 +119,11 @@ class BaseSchema:
             Raises an exception if the set of fields contain a field which is not
             present in the instance of this dataclass.
         """
-        _fields = set(self._get_fields(schema=self))
-        _shared_fields = fields.intersection(_fields)
+        _layout = self._layout
+        _diff = fields - _layout.persistent - _layout.perishable
 
-        if len(_shared_fields) != len(fields):
-            _diff = set(fields) - _fields
+        if _diff:
+            _fields = set(_layout.names)
             raise Exception(
                 f"""
                   Fields to retire not present:
@@ -135,7 +147,7 @@ class BaseSchema:
         dict
             Dictionary with keys names and their repsective types.
         """
-        return {v.name: v.type for v in fields(schema)}
+        return dict(schema._layout.types)
 
     def get_artifact(self) -> ArtifactSchema:
         """Constructs an ArtfifactSchema instance with the data which was marked
@@ -147,20 +159,15 @@ class BaseSchema:
         ArtifactSchema
             Dataclass containing the perishable data and additional meta-data.
         """
-        _perishables = self._get_perishables(schema=self)
-        _base_fields = self._get_fields(schema=self)
+        _layout = self._layout
 
-        artifact_fields = set(_base_fields) - set(_perishables)
-        _fields = [
-            (n, t)
-            for n, t in self._get_field_types(schema=self).items()
-            if n in _perishables
-        ]
-        _values = self._del_fields(artifact_fields)
+        if _layout.slotted:
+            _values = {name: getattr(self, name) for name in _layout.perishable_order}
+        else:
+            _dict = self.__dict__
+            _values = {name: _dict[name] for name in _layout.perishable_order}
 
-        return make_dataclass("Artifact", fields=_fields, bases=(ArtifactSchema,))(
-            **_values, source_schema=self.__class__
-        )
+        return _layout.artifact_class(**_values, source_schema=self.__class__)
 
     def get_carry(self) -> dict:
         """Returns a dictionary instance of this dataclass where all the perishable
@@ -171,6 +178,46 @@ class BaseSchema:
         dict
             Carry over dictionary without the perishable fields.
         """
-        _perishables = self._get_perishables(schema=self)
+        _layout = self._layout
+
+        if _layout.slotted:
+            return {name: getattr(self, name) for name in _layout.persistent_order}
+
+        _dict = self.__dict__
+
+        return {name: _dict[name] for name in _layout.persistent_order}
+
+    def carry_to(self, schema: Type[_Schema], **fields) -> _Schema:
+        """Constructs an instance of another schema from this instance, where the
+        persistent fields of this instance which are fields of the other schema are
+        carried over and the given fields are set next to them, or in place of them
+        when a carried field is given explicitly.
+
+        Unlike `schema(**{**self.get_carry(), **fields})` no intermediate dictionary
+        is built, the carried fields are passed from this instance to the other
+        schema through a constructor generated once per pair of schemas and set of
+        given field names.
+
+        Parameters
+        ----------
+        schema : Type[_Schema]
+            BaseSchema class to construct.
+        **fields
+            Values of the fields which are not carried over.
+
+        Returns
+        -------
+        _Schema
+            Instance of the other schema.
+
+        Examples
+        --------
+        >>> def get_output(self) -> Tuple[ModelStage, FeaturesOutput]:
+        >>>     return ModelStage(), self.input.carry_to(FeaturesOutput, X=self._X)
+        """
+        try:
+            carrier = _carriers[(self.__class__, schema, tuple(fields))]
+        except KeyError:
+            carrier = get_carrier(self.__class__, schema, tuple(fields))
 
-        return self._del_fields(_perishables)
+        return carrier(self, **fields)
@@ -0,0 +1,204 @@
+# External imports
+import threading
+from dataclasses import dataclass, field, fields, make_dataclass
+from typing import ClassVar, List, Optional
+from weakref import WeakKeyDictionary
+
+# Local imports
+from .base_schema import BaseSchema
+
+# Field types stored as NumPy arrays, the other fields are stored as lists
+_SCALAR_TYPES = (bool, int, float, complex)
+
+
+def _numpy() -> Optional[object]:
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def _is_array_type(tp: object, numpy: Optional[object]) -> bool:
+    if numpy is None or not isinstance(tp, type):
+        return False
+
+    return tp in _SCALAR_TYPES or issubclass(tp, (numpy.ndarray, numpy.generic))
+
+
+def _rebuild_batch(record_schema: type, columns: dict) -> "BatchSchema":
+    """Reconstructs a batch of some record schema from its columns, used when
+    unpickling batches since the generated classes are not importable.
+
+    Parameters
+    ----------
+    record_schema : type
+        The BaseSchema class of the records of the batch.
+    columns : dict
+        Columns of the batch keyed by field name.
+
+    Returns
+    -------
+    BatchSchema
+        Batch instance of the generated batch class of `record_schema`.
+    """
+    return BatchSchema.of(record_schema)(**columns)
+
+
+def _reduce_batch(batch: "BatchSchema") -> tuple:
+    columns = {name: getattr(batch, name) for name in batch._layout.names}
+
+    return _rebuild_batch, (batch.record_schema, columns)
+
+
+@dataclass
+class BatchSchema(BaseSchema):
+    """Columnar counterpart of a BaseSchema class, generated with `BatchSchema.of`,
+    which stores each field of a batch of records as one column. Fields of scalar
+    or NumPy types are stacked into a NumPy array, the other fields are kept as a
+    list of the values, as are all fields when NumPy is not installed.
+
+    The generated class has the same persistant and perishable fields as the
+    record schema, such that `get_carry`, `get_artifact` and `carry_to` work on
+    whole columns and hand them over without copying them.
+
+    Examples
+    --------
+    >>> from ror.schemas import BatchSchema
+
+    >>> batch = BatchSchema.of(PredictInput).from_records(self.inputs)
+    >>> labels = model.predict(batch.features) # One vectorised call
+    >>> output = batch.carry_to(BatchSchema.of(PredictOutput), labels=labels)
+    >>> output.to_records() # [PredictOutput, ...]
+    """
+
+    # Record schema the batch class was generated from
+    record_schema: ClassVar[type] = None
+
+    @staticmethod
+    def of(schema: type) -> type:
+        """Returns the batch class of a record schema, generated on first use.
+
+        Parameters
+        ----------
+        schema : type
+            BaseSchema class of the records.
+
+        Returns
+        -------
+        type
+            BatchSchema subclass with one column per field of the schema.
+
+        Raises
+        ------
+        TypeError
+            If the schema is not a BaseSchema dataclass, or is already a batch.
+        """
+        try:
+            return _batch_classes[schema]
+        except (KeyError, TypeError):
+            pass
+
+        if not (isinstance(schema, type) and issubclass(schema, BaseSchema)):
+            raise TypeError(f"{schema!r} is not a BaseSchema class!", schema)
+        if issubclass(schema, BatchSchema):
+            raise TypeError(f"{schema.__name__} is already a batch!", schema)
+
+        with _lock:
+            batch_class = _batch_classes.get(schema)
+            if batch_class is None:
+                batch_class = _batch_classes[schema] = _make_batch_class(schema)
+
+        return batch_class
+
+    @classmethod
+    def from_records(cls, records: List[BaseSchema]) -> "BatchSchema":
+        """Builds a batch from a list of records of the record schema.
+
+        Parameters
+        ----------
+        records : List[BaseSchema]
+            Records of the batch.
+
+        Returns
+        -------
+        BatchSchema
+            Batch with one column per field, in the order of the records.
+        """
+        numpy = _numpy()
+        types = cls._layout.types
+        columns = {}
+
+        for name in cls._layout.names:
+            values = [getattr(record, name) for record in records]
+
+            if types[name] is list:
+                columns[name] = values
+                continue
+
+            try:
+                columns[name] = numpy.stack(values) if values else numpy.asarray(())
+            except ValueError:
+                # Ragged arrays can not be stacked
+                columns[name] = values
+
+        return cls(**columns)
+
+    def to_records(self) -> List[BaseSchema]:
+        """Splits the batch back into records of the record schema, where the values
+        of scalar fields are converted back to Python scalars.
+
+        Returns
+        -------
+        List[BaseSchema]
+            Records in the order of the batch.
+        """
+        numpy = _numpy()
+        record_types = self.record_schema._layout.types
+        names = self._layout.names
+        columns = []
+
+        for name in names:
+            column = getattr(self, name)
+
+            if numpy is not None and isinstance(column, numpy.ndarray):
+                if record_types[name] in _SCALAR_TYPES:
+                    column = column.tolist()
+
+            columns.append(column)
+
+        record_schema = self.record_schema
+
+        return [record_schema(**dict(zip(names, row))) for row in zip(*columns)]
+
+    def __len__(self) -> int:
+        names = self._layout.names
+
+        return len(getattr(self, names[0])) if names else 0
+
+
+_batch_classes: "WeakKeyDictionary[type, type]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _make_batch_class(schema: type) -> type:
+    """Generates the batch class of a record schema, with a column for each field
+    which keeps the metadata of the field, and so its persistance.
+    """
+    numpy = _numpy()
+    columns = []
+
+    for v in fields(schema):
+        column_type = numpy.ndarray if _is_array_type(v.type, numpy) else list
+        columns.append((v.name, column_type, field(metadata=v.metadata)))
+
+    batch_class = make_dataclass(
+        f"{schema.__name__}Batch",
+        fields=columns,
+        bases=(BatchSchema,),
+        namespace={"record_schema": schema, "__reduce__": _reduce_batch},
+    )
+    batch_class.__module__ = schema.__module__
+
+    return batch_class
@@ -0,0 +1,104 @@
+# External imports
+import threading
+from typing import Callable, Dict, Tuple
+
+# Local imports
+from .schema_layout import SchemaLayout
+
+# Generated carriers keyed by source schema, target schema and names of the fields
+# given to `carry_to`, there are only as many as distinct call sites
+_carriers: Dict[Tuple[type, type, Tuple[str, ...]], Callable] = {}
+_lock = threading.Lock()
+
+
+def make_carrier(
+    source: type, target: type, names: Tuple[str, ...]
+) -> Callable[..., object]:
+    """Generates the constructor of a target schema from an instance of a source
+    schema, which reads the carried fields straight from the source instance and
+    passes them as keywords to the target schema next to the given fields, such
+    that no intermediate dictionary is built.
+
+    The carried fields are the persistent fields of the source schema which are
+    also fields of the target schema and are not given explicitly.
+
+    Parameters
+    ----------
+    source : type
+        BaseSchema class of the instance to carry from.
+    target : type
+        BaseSchema class to construct.
+    names : Tuple[str, ...]
+        Names of the fields given next to the carried ones, in call order.
+
+    Returns
+    -------
+    Callable[..., object]
+        Function taking the source instance and the given fields as keywords, and
+        returning the target instance.
+
+    Raises
+    ------
+    TypeError
+        If the target is not a BaseSchema class.
+    """
+    if not isinstance(getattr(target, "_layout", None), SchemaLayout):
+        raise TypeError(f"{target!r} is not a BaseSchema class!", target)
+
+    source_layout: SchemaLayout = source._layout
+    target_names = set(target._layout.names)
+    carried = [
+        name
+        for name in source_layout.persistent_order
+        if name in target_names and name not in names
+    ]
+
+    # `__source__` can not clash with a field name, which can not be a dunder
+    arguments = [f"{name}=__source__.{name}" for name in carried]
+    arguments += [f"{name}={name}" for name in names]
+    parameters = "".join(f", {name}" for name in names)
+
+    code = (
+        f"def carry(__source__{parameters}):\n"
+        f"    return __target__({', '.join(arguments)})\n"
+    )
+
+    namespace = {"__target__": target}
+    exec(code, namespace)
+    carry = namespace["carry"]
+    carry.__qualname__ = f"{source.__name__}.carry_to({target.__name__})"
+
+    return carry
+
+
+def get_carrier(
+    source: type, target: type, names: Tuple[str, ...]
+) -> Callable[..., object]:
+    """Returns the generated carrier of a source and target schema for the given
+    field names, generating it on first use, see `make_carrier`.
+
+    Parameters
+    ----------
+    source : type
+        BaseSchema class of the instance to carry from.
+    target : type
+        BaseSchema class to construct.
+    names : Tuple[str, ...]
+        Names of the fields given next to the carried ones, in call order.
+
+    Returns
+    -------
+    Callable[..., object]
+        Generated carrier.
+    """
+    key = (source, target, names)
+
+    try:
+        return _carriers[key]
+    except KeyError:
+        with _lock:
+            carrier = _carriers.get(key)
+            if carrier is None:
+                carrier = _carriers[key] = make_carrier(source, target, names)
+
+        return carrier
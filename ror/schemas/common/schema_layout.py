@@ -0,0 +1,149 @@
+# External imports
+from dataclasses import dataclass, field, fields, make_dataclass
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Tuple
+from weakref import WeakKeyDictionary
+
+# Local imports
+from ror.utils._const import FIELD_PERISH_STAGE, FIELD_PERSISTANCE
+
+from .artifact_schema import ArtifactSchema
+
+
+def _rebuild_artifact(source_schema: type, values: dict) -> ArtifactSchema:
+    """Reconstructs an artifact for some source schema from its field values, used
+    when unpickling artifacts since the generated classes are not importable.
+
+    Parameters
+    ----------
+    source_schema : type
+        The BaseSchema class which the artifact was produced from.
+    values : dict
+        Perishable field values of the artifact.
+
+    Returns
+    -------
+    ArtifactSchema
+        Artifact instance of the registered artifact class of `source_schema`.
+    """
+    return source_schema._layout.artifact_class(source_schema=source_schema, **values)
+
+
+def _reduce_artifact(artifact: ArtifactSchema) -> tuple:
+    values = {
+        name: getattr(artifact, name)
+        for name in artifact.__dataclass_fields__
+        if name not in artifact.get_standard_fields()
+    }
+
+    return _rebuild_artifact, (artifact.source_schema, values)
+
+
+@dataclass(frozen=True)
+class SchemaLayout:
+    """Immutable field layout of a BaseSchema class, computed once per class such
+    that the carry and artifact methods only have to do dictionary work.
+
+    Attributes
+    ----------
+    names : Tuple[str, ...]
+        All field names in definition (slot) order.
+    persistent : FrozenSet[str]
+        Names of the fields marked as persistant.
+    perishable : FrozenSet[str]
+        Names of the fields marked as perishable.
+    persistent_order : Tuple[str, ...]
+        Persistant field names in definition order.
+    perishable_order : Tuple[str, ...]
+        Perishable field names in definition order.
+    types : Mapping[str, type]
+        Read-only mapping of field names to their types.
+    artifact_class : type
+        Generated ArtifactSchema subclass holding the perishable fields.
+    perish_stages : Mapping[str, str]
+        Read-only mapping of field names to the name of the last stage reading
+        them, for the fields declared with a `perish_stage`.
+    slotted : bool
+        Whether the instances store their fields in slots and have no `__dict__`.
+    """
+
+    names: Tuple[str, ...]
+    persistent: FrozenSet[str]
+    perishable: FrozenSet[str]
+    persistent_order: Tuple[str, ...]
+    perishable_order: Tuple[str, ...]
+    types: Mapping[str, type]
+    artifact_class: type
+    perish_stages: Mapping[str, str] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    slotted: bool = False
+
+    @classmethod
+    def from_schema(cls, schema: type) -> "SchemaLayout":
+        """Builds the layout of a schema class from its dataclass fields.
+
+        Parameters
+        ----------
+        schema : type
+            BaseSchema class to compute the layout for.
+
+        Returns
+        -------
+        SchemaLayout
+            Layout of the schema class.
+        """
+        _fields = fields(schema)
+        persistent_order = tuple(
+            v.name for v in _fields if v.metadata[FIELD_PERSISTANCE]
+        )
+        perishable_order = tuple(
+            v.name for v in _fields if not v.metadata[FIELD_PERSISTANCE]
+        )
+        types = {v.name: v.type for v in _fields}
+        perish_stages = {
+            v.name: v.metadata[FIELD_PERISH_STAGE]
+            for v in _fields
+            if v.metadata.get(FIELD_PERISH_STAGE) is not None
+        }
+
+        artifact_class = make_dataclass(
+            f"{schema.__name__}Artifact",
+            fields=[(name, types[name]) for name in perishable_order],
+            bases=(ArtifactSchema,),
+            namespace={"__reduce__": _reduce_artifact},
+        )
+        artifact_class.__module__ = schema.__module__
+
+        return cls(
+            names=tuple(v.name for v in _fields),
+            persistent=frozenset(persistent_order),
+            perishable=frozenset(perishable_order),
+            persistent_order=persistent_order,
+            perishable_order=perishable_order,
+            types=MappingProxyType(types),
+            artifact_class=artifact_class,
+            perish_stages=MappingProxyType(perish_stages),
+            slotted=schema.__dictoffset__ == 0,
+        )
+
+
+class SchemaLayoutDescriptor:
+    """Class-level descriptor which resolves to the SchemaLayout of the class it is
+    accessed from. Layouts are computed on first access, as the dataclass decorator
+    is applied after `__init_subclass__`, and kept in a weak registry per class.
+    """
+
+    def __init__(self):
+        self._layouts = WeakKeyDictionary()
+
+    def __get__(self, instance: object, owner: type) -> SchemaLayout:
+        try:
+            return self._layouts[owner]
+        except KeyError:
+            layout = self._layouts[owner] = SchemaLayout.from_schema(owner)
+
+            return layout
+
+    def __set__(self, instance: object, value: object) -> None:
+        raise AttributeError("The schema layout is read-only")
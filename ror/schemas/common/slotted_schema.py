@@ -0,0 +1,70 @@
+# External imports
+import dataclasses
+from itertools import chain
+
+
+def _base_slots(schema: type) -> set:
+    slots = (base.__dict__.get("__slots__", ()) for base in schema.__mro__[1:])
+
+    return set(chain.from_iterable((s,) if isinstance(s, str) else s for s in slots))
+
+
+def slotted_schema(schema: type) -> type:
+    """Class decorator turning a BaseSchema dataclass into a slotted one, whose
+    instances store their fields in slots and do not carry a `__dict__`, which
+    saves a quarter to a half of the memory of small records. Equivalent to
+    `@dataclass(slots=True)` which is only available from Python 3.10, and to be
+    applied above the dataclass decorator.
+
+    As with `@dataclass(slots=True)` a new class is returned, so methods of the
+    schema can not call `super()` without arguments.
+
+    Parameters
+    ----------
+    schema : type
+        BaseSchema dataclass to make slotted.
+
+    Returns
+    -------
+    type
+        Slotted copy of the schema class.
+
+    Raises
+    ------
+    TypeError
+        If the schema is not a dataclass or already defines `__slots__`.
+
+    Examples
+    --------
+    >>> from ror.schemas import BaseSchema, slotted_schema
+
+    >>> @slotted_schema
+    >>> @dataclass
+    >>> class Record(BaseSchema):
+    >>>     A: int = field_persistance()
+    >>>     B: float = field_perishable()
+    """
+    if not dataclasses.is_dataclass(schema):
+        raise TypeError(f"{schema.__name__} is not a dataclass!", schema)
+
+    if "__slots__" in schema.__dict__:
+        raise TypeError(f"{schema.__name__} already defines __slots__!", schema)
+
+    inherited = _base_slots(schema)
+    names = tuple(f.name for f in dataclasses.fields(schema) if f.name not in inherited)
+
+    namespace = dict(schema.__dict__)
+    namespace["__slots__"] = names
+
+    # Defaults stored as class attributes would conflict with the slots, the
+    # generated `__init__` holds its own references to them
+    for name in names:
+        namespace.pop(name, None)
+
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    slotted = type(schema)(schema.__name__, schema.__bases__, namespace)
+    slotted.__qualname__ = schema.__qualname__
+
+    return slotted
@@ -1,17 +1,32 @@
 # External import
 from dataclasses import Field, field
+from typing import Optional, Union
 
 # Local imports
-from ror.utils._const import FIELD_PERSISTANCE
+from ror.utils._const import FIELD_PERISH_STAGE, FIELD_PERSISTANCE
 
 
-def field_perishable(**kwargs) -> Field:
+def field_perishable(
+    perish_stage: Optional[Union[str, type]] = None, **kwargs
+) -> Field:
     """Field type for fields in the BaseSchema to mark fields as perishable
     which will be a part of the ArtifactSchema produced for this BaseSchema.
 
+    Parameters
+    ----------
+    perish_stage : Optional[Union[str, type]], optional
+        Last stage (class or class name) which reads the field, after which the
+        controllers drop it when no artifacts are captured, by default None for
+        the last stage whose input schema has the field.
+
     Returns
     -------
     Field
         Dataclass field with the `FIELD_PERSISTANCE` flag set to False.
     """
-    return field(metadata={FIELD_PERSISTANCE: False}, **kwargs)
+    if isinstance(perish_stage, type):
+        perish_stage = perish_stage.__name__
+
+    return field(
+        metadata={FIELD_PERSISTANCE: False, FIELD_PERISH_STAGE: perish_stage}, **kwargs
+    )
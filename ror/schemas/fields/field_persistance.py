@@ -1,18 +1,34 @@
 # External import
 from dataclasses import Field, field
+from typing import Optional, Union
 
 # Local imports
-from ror.utils._const import FIELD_PERSISTANCE
+from ror.utils._const import FIELD_PERISH_STAGE, FIELD_PERSISTANCE
 
 
-def field_persistance(**kwargs) -> Field:
+def field_persistance(
+    perish_stage: Optional[Union[str, type]] = None, **kwargs
+) -> Field:
     """Dataclass field type which indeicates that this field will be carried over
     to the output dataclass. Thus, fields with this propoerty will be carried over
     until there is some BaseSchema at a stage which sets it to `perishable`.
 
+    Parameters
+    ----------
+    perish_stage : Optional[Union[str, type]], optional
+        Last stage (class or class name) which reads the field, after which the
+        controllers drop it when no artifacts are captured even if it is still
+        carried over, by default None for the last stage whose input schema has
+        the field.
+
     Returns
     -------
     Field
         Dataclass field with the `FIELD_PERSISTANCE` flag set to True.
     """
-    return field(metadata={FIELD_PERSISTANCE: True}, **kwargs)
+    if isinstance(perish_stage, type):
+        perish_stage = perish_stage.__name__
+
+    return field(
+        metadata={FIELD_PERSISTANCE: True, FIELD_PERISH_STAGE: perish_stage}, **kwargs
+    )
@@ -1,3 +1,11 @@
+from .i_async_forward_stage import IAsyncForwardStage
+from .i_async_init_stage import IAsyncInitStage
+from .i_async_terminal_stage import IAsyncTerminalStage
+from .i_batch_stage import IBatchStage
+from .i_fan_out_stage import IFanOutStage
 from .i_forward_stage import IForwardStage
 from .i_init_stage import IInitStage
+from .i_join_stage import IJoinStage
+from .i_memoized_stage import IMemoizedStage
+from .i_process_stage import IProcessStage
 from .i_terminal_stage import ITerminalStage
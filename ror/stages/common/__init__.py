@@ -1 +1,3 @@
+from .compute import compute_group, profiled_compute_group
+from .i_async_stage import IAsyncStage
 from .i_base_stage import IBaseStage
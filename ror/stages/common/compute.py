@@ -0,0 +1,171 @@
+# External imports
+import time
+from typing import List, Tuple
+
+# Local imports
+from ror.profilers.common import (
+    PHASE_COMPUTE,
+    PHASE_GET_OUTPUT,
+    PHASE_SET_INPUT,
+    IStageProfiler,
+    current_run_ids,
+)
+from ror.utils.sizeof import deep_sizeof
+
+from .i_base_stage import IBaseStage
+
+
+def _batch_output(stage: IBaseStage, terminal: bool) -> tuple:
+    """Gets the outputs of a batch stage as records, splitting them if the stage
+    returned them as a `BatchSchema`.
+    """
+    from ror.schemas import BatchSchema
+
+    result = stage.get_batch_output()
+    next_stage, outputs = (None, result) if terminal else result
+
+    if isinstance(outputs, BatchSchema):
+        outputs = outputs.to_records()
+
+    return [next_stage] * len(outputs), outputs
+
+
+def compute_group(stage: IBaseStage, inputs: list) -> Tuple[List[IBaseStage], list]:
+    """Computes a group of inputs at the same stage, as a batch if the stage
+    extends `IBatchStage` and otherwise one record at a time.
+
+    Parameters
+    ----------
+    stage : IBaseStage
+        Stage instance to compute the group with.
+    inputs : list
+        Inputs of the group.
+
+    Returns
+    -------
+    Tuple[List[IBaseStage], list]
+        The next stage instance of each record, or None for terminal stages, and
+        the output of each record.
+    """
+    from ror.stages import IBatchStage, ITerminalStage
+
+    terminal = isinstance(stage, ITerminalStage)
+
+    if isinstance(stage, IBatchStage):
+        stage.set_batch_input(inputs)
+        stage.compute_batch()
+
+        return _batch_output(stage, terminal)
+
+    next_stages, outputs = [], []
+    for input in inputs:
+        stage.set_input(input)
+        stage.compute()
+
+        if terminal:
+            next_stages.append(None)
+            outputs.append(stage.get_output())
+        else:
+            next_stage, output = stage.get_output()
+            next_stages.append(next_stage)
+            outputs.append(output)
+
+    return next_stages, outputs
+
+
+def profiled_compute_group(
+    stage: IBaseStage, inputs: list, profiler: IStageProfiler
+) -> Tuple[List[IBaseStage], list]:
+    """Same as `compute_group` but reports the wall and CPU time of the `set_input`,
+    `compute` and `get_output` phases to a profiler. The phases are timed back to
+    back and reported once the record is computed, so that the profiler itself is
+    not part of the timings. The size of the inputs and of the outputs is measured
+    after the phases for the profilers which record the payloads.
+
+    Parameters
+    ----------
+    stage : IBaseStage
+        Stage instance to compute the group with.
+    inputs : list
+        Inputs of the group.
+    profiler : IStageProfiler
+        Profiler to report the phases to.
+
+    Returns
+    -------
+    Tuple[List[IBaseStage], list]
+        The next stage instance of each record, or None for terminal stages, and
+        the output of each record.
+    """
+    from ror.stages import IBatchStage, ITerminalStage
+
+    # `int()` is 0, the cheapest stand-in when the CPU time is not measured
+    perf, cpu = time.perf_counter_ns, time.thread_time_ns if profiler.cpu else int
+    stage_class = stage.__class__
+    record = profiler.record
+    terminal = isinstance(stage, ITerminalStage)
+    payloads = profiler.payloads
+
+    if isinstance(stage, IBatchStage):
+        records = len(inputs)
+
+        t0, c0 = perf(), cpu()
+        stage.set_batch_input(inputs)
+        t1, c1 = perf(), cpu()
+        stage.compute_batch()
+        t2, c2 = perf(), cpu()
+        result = _batch_output(stage, terminal)
+        t3, c3 = perf(), cpu()
+
+        if payloads:
+            in_bytes, out_bytes = deep_sizeof(inputs), deep_sizeof(result[1])
+            record(
+                stage_class, PHASE_SET_INPUT, t0, t1 - t0, c1 - c0, records, in_bytes
+            )
+            record(stage_class, PHASE_COMPUTE, t1, t2 - t1, c2 - c1, records)
+            record(
+                stage_class, PHASE_GET_OUTPUT, t2, t3 - t2, c3 - c2, records, out_bytes
+            )
+        else:
+            record(stage_class, PHASE_SET_INPUT, t0, t1 - t0, c1 - c0, records)
+            record(stage_class, PHASE_COMPUTE, t1, t2 - t1, c2 - c1, records)
+            record(stage_class, PHASE_GET_OUTPUT, t2, t3 - t2, c3 - c2, records)
+
+        return result
+
+    # Each record is recorded under its own run id, when the group has one per record
+    run_ids = current_run_ids.get()
+    per_record = len(run_ids) == len(inputs) > 1
+    next_stages, outputs = [], []
+
+    for i, input in enumerate(inputs):
+        if per_record:
+            current_run_ids.set(run_ids[i : i + 1])
+
+        t0, c0 = perf(), cpu()
+        stage.set_input(input)
+        t1, c1 = perf(), cpu()
+        stage.compute()
+        t2, c2 = perf(), cpu()
+        result = stage.get_output()
+        t3, c3 = perf(), cpu()
+
+        next_stage, output = (None, result) if terminal else result
+
+        if payloads:
+            in_bytes, out_bytes = deep_sizeof(input), deep_sizeof(output)
+            record(stage_class, PHASE_SET_INPUT, t0, t1 - t0, c1 - c0, 1, in_bytes)
+            record(stage_class, PHASE_COMPUTE, t1, t2 - t1, c2 - c1, 1)
+            record(stage_class, PHASE_GET_OUTPUT, t2, t3 - t2, c3 - c2, 1, out_bytes)
+        else:
+            record(stage_class, PHASE_SET_INPUT, t0, t1 - t0, c1 - c0, 1)
+            record(stage_class, PHASE_COMPUTE, t1, t2 - t1, c2 - c1, 1)
+            record(stage_class, PHASE_GET_OUTPUT, t2, t3 - t2, c3 - c2, 1)
+
+        next_stages.append(next_stage)
+        outputs.append(output)
+
+    if per_record:
+        current_run_ids.set(run_ids)
+
+    return next_stages, outputs
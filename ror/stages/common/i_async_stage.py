@@ -0,0 +1,8 @@
+class IAsyncStage:
+    """Interface for stages whose `compute` is a coroutine, e.g. for stages waiting on
+    databases or object stores. Such stages are awaited on the event loop of the
+    `AsyncController`, while the other stages are offloaded to a thread executor.
+    """
+
+    async def compute(self) -> None:
+        pass
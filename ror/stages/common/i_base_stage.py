@@ -16,14 +16,51 @@ class IBaseStage(Generic[I, O]):
     Generic : Generic
         Typing generic used to explicitly define the input dataclass of
         the stage and the output dataclass in the stage.
+
+    Stages doing expensive work once, e.g. loading a model, can do it in `setup`
+    and release it in `teardown`. Setting `reusable` lets the controller keep one
+    warm instance of the stage across runs, and one more per run computing it
+    concurrently, which should not depend on the arguments given to its
+    constructor. An instance is only computing one run at a time. Unsetting
+    `checkpoint` skips the checkpoint written after the stage.
     """
 
+    # Whether instances can be set up once and reused by the following runs
+    reusable: bool = False
+
+    # Whether the controller checkpoints a run after this stage, stages which are
+    # cheap to recompute can opt out and are then computed again on resume
+    checkpoint: bool = True
+
     def __str__(self) -> str:
         return f"hello"
 
     def __repr__(self):
         pass
 
+    def setup(self) -> None:
+        """Prepares the stage before its first computation, called once per run or
+        once per controller for reusable stages.
+        """
+        pass
+
+    def teardown(self) -> None:
+        """Releases what `setup` acquired, called after the run or when the
+        controller is closed for reusable stages.
+        """
+        pass
+
+    def clear(self) -> None:
+        """Drops the references of the stage to its last input and output once the
+        controller has taken the output, such that the fields no later stage reads
+        can be freed. Removes the `input`, `inputs`, `_output` and `_outputs`
+        attributes, stages holding other references can extend it.
+        """
+        _dict = self.__dict__
+
+        for name in ("input", "inputs", "_output", "_outputs"):
+            _dict.pop(name, None)
+
     def set_input(self, input: I) -> None:
         """Given an input from the last stage or init dataclass, set the
         local state for this stage -> data used in `compute`.
@@ -0,0 +1,25 @@
+# External imports
+from typing import TypeVar
+
+# Local imports
+from .common import IAsyncStage, IBaseStage
+from .i_forward_stage import IForwardStage
+
+# Generics
+I = TypeVar("I")  # Input data type
+O = TypeVar("O")  # Output data type
+N = TypeVar("N", bound=IBaseStage)  # Next stage reference
+
+
+class IAsyncForwardStage(IAsyncStage, IForwardStage[I, O, N]):
+    """Async variant of the forward stage, where `compute` is a coroutine awaited by
+    the `AsyncController`.
+
+    Examples
+    --------
+    >>> from ror.stages import IAsyncForwardStage
+
+    >>> class ForwardStage(IAsyncForwardStage[InputSchema, OutputSchema, NextStage]):
+    >>>     async def compute(self) -> None:
+    >>>         self._output = {"blob": await bucket.get(self.input.key)}
+    """
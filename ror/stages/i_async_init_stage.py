@@ -0,0 +1,25 @@
+# External imports
+from typing import TypeVar
+
+# Local imports
+from .common import IAsyncStage, IBaseStage
+from .i_init_stage import IInitStage
+
+# Generics
+I = TypeVar("I")  # Input data type
+O = TypeVar("O")  # Output data type
+N = TypeVar("N", bound=IBaseStage)  # Next stage reference
+
+
+class IAsyncInitStage(IAsyncStage, IInitStage[I, O, N]):
+    """Async variant of the IInit stage, where `compute` is a coroutine awaited by
+    the `AsyncController`.
+
+    Examples
+    --------
+    >>> from ror.stages import IAsyncInitStage
+
+    >>> class InitStage(IAsyncInitStage[InputSchema, OutputSchema, NextStage]):
+    >>>     async def compute(self) -> None:
+    >>>         self._output = {"rows": await database.fetch(self.input.query)}
+    """
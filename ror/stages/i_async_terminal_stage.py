@@ -0,0 +1,24 @@
+# External imports
+from typing import TypeVar
+
+# Local imports
+from .common import IAsyncStage
+from .i_terminal_stage import ITerminalStage
+
+# Generics
+I = TypeVar("I")  # Input data type
+O = TypeVar("O")  # Output data type
+
+
+class IAsyncTerminalStage(IAsyncStage, ITerminalStage[I, O]):
+    """Async variant of the ITerminal stage, where `compute` is a coroutine awaited
+    by the `AsyncController`.
+
+    Examples
+    --------
+    >>> from ror.stages import IAsyncTerminalStage
+
+    >>> class TerminalStage(IAsyncTerminalStage[InputSchema, OutputSchema]):
+    >>>     async def compute(self) -> None:
+    >>>         await database.insert(self.input.labels)
+    """
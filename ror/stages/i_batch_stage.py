@@ -0,0 +1,79 @@
+# External imports
+from typing import Generic, List, TypeVar
+
+# Local imports
+from ror.schemas import BatchSchema
+
+# Generics
+I = TypeVar("I")  # Input data type
+O = TypeVar("O")  # Output data type
+
+
+class IBatchStage(Generic[I, O]):
+    """Mixin for stages which can compute over a batch of inputs at once, used by
+    `BaseController.start_batch` to hand the whole batch to the stage instead of
+    one record at a time. Stages which do not extend it are computed per record.
+
+    The mixin has to be listed after the stage interface, as the stage interfaces
+    read their generics from the first base class.
+
+    Examples
+    --------
+    >>> from ror.stages import IBatchStage, IForwardStage
+
+    >>> class InferenceStage(IForwardStage[InputSchema, OutputSchema, NextStage], IBatchStage):
+    >>>     def compute_batch(self) -> None:
+    >>>         X = numpy.stack([input.X for input in self.inputs])
+    >>>         self._labels = self.model.predict(X)
+    >>>
+    >>>     def get_batch_output(self) -> Tuple[NextStage, List[OutputSchema]]:
+    >>>         return NextStage(), [OutputSchema(labels=l) for l in self._labels]
+
+    Stages can also work on the columns of the batch, and return the outputs as a
+    batch which the controller splits back into records.
+
+    >>>     def compute_batch(self) -> None:
+    >>>         self._batch = self.get_columns()
+    >>>         self._labels = self.model.predict(self._batch.X)
+    >>>
+    >>>     def get_batch_output(self) -> Tuple[NextStage, BatchSchema]:
+    >>>         output = BatchSchema.of(OutputSchema)
+    >>>         return NextStage(), self._batch.carry_to(output, labels=self._labels)
+    """
+
+    def set_batch_input(self, inputs: List[I]) -> None:
+        """Given the inputs of a batch from the last stage or the init dataclasses,
+        set the local state for this stage -> data used in `compute_batch`.
+
+        Parameters
+        ----------
+        inputs : List[I]
+            List of input dataclasses of the defined input dataclass I.
+        """
+        self.inputs = inputs
+
+    def get_columns(self) -> BatchSchema:
+        """Returns the inputs of the batch as columns, see `BatchSchema`.
+
+        Returns
+        -------
+        BatchSchema
+            Batch of the input schema with one column per field.
+        """
+        return BatchSchema.of(self.inputs[0].__class__).from_records(self.inputs)
+
+    def compute_batch(self) -> None:
+        pass
+
+    def get_batch_output(self) -> List[O]:
+        """Returns the outputs of the batch in the same order as the inputs. Init and
+        forward stages return a tuple of the next stage instance, shared by the whole
+        batch, and the list of outputs. The outputs can also be given as a
+        `BatchSchema` of the output dataclass, which is split into records.
+
+        Returns
+        -------
+        List[O]
+            List of output dataclasses defined for this stage.
+        """
+        pass
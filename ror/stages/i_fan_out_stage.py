@@ -0,0 +1,67 @@
+# External imports
+from typing import Generic, Tuple, TypeVar, get_args
+
+# Local imports
+from .common import IBaseStage
+
+# Generics
+I = TypeVar("I")  # Input data type
+O = TypeVar("O")  # Output data type
+N = TypeVar("N")  # Tuple of the next stage references
+
+
+class IFanOutStage(IBaseStage[I, O], Generic[I, O, N]):
+    """Interface for the fan out stage, defines an input datatype, an output
+    datatype and a tuple of next stages. The output is the input of every next
+    stage, whose branches are computed concurrently by the `DagController`, and
+    the `get_output` method returns a tuple with an instance of each next stage.
+
+    The branches share the output instance, and so should not modify it but carry
+    it to their own output schema instead.
+
+    Examples
+    --------
+    >>> from ror.stages import IFanOutStage
+
+    This will define a new stage with an input, ouput schema and two next stages.
+
+    >>> class FanOutStage(IFanOutStage[InputSchema, OutputSchema, Tuple[PcaStage, TfidfStage]]):
+    >>>     def get_output(self):
+    >>>         return (PcaStage(), TfidfStage()), self._output
+    """
+
+    def __init_subclass__(cls) -> None:
+        cls._types = get_args(cls.__orig_bases__[0])
+
+    def discover(self) -> N:
+        """Returns the class objects of the next stages linked from this stage.
+
+        Returns
+        -------
+        N
+            Tuple of class references to the next stages
+        """
+        return get_args(self._types[-1])
+
+    def get_output(self) -> Tuple[N, O]:
+        pass
+
+    def input_schema(self) -> I:
+        """Returns the input schema defined for this stage
+
+        Returns
+        -------
+        I
+            Reference to dataclass schema
+        """
+        return self._types[0]
+
+    def output_schema(self) -> O:
+        """Returns the output schema defined for this stage
+
+        Returns
+        -------
+        O
+            Reference to dataclass schema
+        """
+        return self._types[1]
@@ -0,0 +1,76 @@
+# External imports
+from typing import Generic, Tuple, TypeVar, get_args
+
+# Local imports
+from .common import IBaseStage
+
+# Generics
+I = TypeVar("I")  # Tuple of the input data types
+O = TypeVar("O")  # Output data type
+N = TypeVar("N", bound=IBaseStage)  # Next stage reference
+
+
+class IJoinStage(IBaseStage[I, O], Generic[I, O, N]):
+    """Interface for the join stage, defines a tuple of input datatypes, one for
+    each upstream stage, an output datatype and a dependency for the next stage.
+    The `DagController` computes the join once all its upstream stages are, and
+    `set_input` is given a tuple of their outputs in the order of the input
+    datatypes, which are matched to the output schemas of the upstream stages.
+
+    Examples
+    --------
+    >>> from ror.stages import IJoinStage
+
+    This will define a new stage joining the outputs of two branches.
+
+    >>> class JoinStage(IJoinStage[Tuple[PcaOutput, TfidfOutput], OutputSchema, NextStage]):
+    >>>     def compute(self):
+    >>>         pca, tfidf = self.input
+    """
+
+    def __init_subclass__(cls) -> None:
+        cls._types = get_args(cls.__orig_bases__[0])
+
+    def discover(self) -> N:
+        """Returns a class object for the next stage in linked
+        from this stage.
+
+        Returns
+        -------
+        N
+            Class reference to next stage
+        """
+        return self._types[-1]
+
+    def get_output(self) -> Tuple[N, O]:
+        pass
+
+    def input_schemas(self) -> Tuple[type, ...]:
+        """Returns the input schemas of the upstream stages joined by this stage
+
+        Returns
+        -------
+        Tuple[type, ...]
+            References to dataclass schemas, in the order of the inputs
+        """
+        return get_args(self._types[0])
+
+    def input_schema(self) -> I:
+        """Returns the input schema defined for this stage
+
+        Returns
+        -------
+        I
+            Reference to the tuple of dataclass schemas
+        """
+        return self._types[0]
+
+    def output_schema(self) -> O:
+        """Returns the output schema defined for this stage
+
+        Returns
+        -------
+        O
+            Reference to dataclass schema
+        """
+        return self._types[1]
@@ -0,0 +1,27 @@
+# External imports
+from typing import Optional
+
+
+class IMemoizedStage:
+    """Marker mixin for deterministic stages whose results can be reused across runs
+    by a controller given a memo cache. The result of a record is keyed by the
+    stage class, its version and the field values of its input, and on a hit the
+    controller skips `compute` and reuses the output and the next stage.
+
+    The version is taken from the `version` attribute, or if it is not set from the
+    source code of the class, and the mixin has to be listed after the stage
+    interface.
+
+    Examples
+    --------
+    >>> from ror.stages import IForwardStage, IMemoizedStage
+
+    >>> class PreprocessStage(IForwardStage[InputSchema, OutputSchema, NextStage], IMemoizedStage):
+    >>>     version = "2"
+    >>> ...
+
+    >>> controller = BaseController(data, InitStage, memo_cache=MemoryMemoCache())
+    """
+
+    # Version of the stage, bump it to invalidate previously cached results
+    version: Optional[str] = None
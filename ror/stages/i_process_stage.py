@@ -0,0 +1,21 @@
+class IProcessStage:
+    """Marker mixin for CPU-bound stages which are computed in the worker processes
+    of the `ProcessStagePool` given to the controller, instead of in the controller
+    process. The stage class, its inputs and its outputs have to be picklable, and
+    large NumPy arrays are handed over through shared memory.
+
+    Each worker process keeps one instance of the stage class, created and set up on
+    the first record it computes, and the mixin has to be listed after the stage
+    interface.
+
+    Examples
+    --------
+    >>> from ror.stages import IForwardStage, IProcessStage
+
+    >>> class FeatureStage(IForwardStage[InputSchema, OutputSchema, NextStage], IProcessStage):
+    >>> ...
+
+    >>> with ProcessStagePool(max_workers=64) as pool:
+    >>>     controller = BaseController(None, InitStage, process_pool=pool)
+    >>>     outputs = controller.map(inputs)
+    """
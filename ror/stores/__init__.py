@@ -0,0 +1,4 @@
+from .common import IArtifactStore
+from .disk_artifact_store import DiskArtifactStore, LazyArtifact
+from .memory_artifact_store import MemoryArtifactStore
+from .null_artifact_store import NullArtifactStore
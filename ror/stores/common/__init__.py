@@ -0,0 +1 @@
+from .i_artifact_store import IArtifactStore
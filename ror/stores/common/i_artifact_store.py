@@ -0,0 +1,97 @@
+# External imports
+from typing import Dict
+
+# Local imports
+from ror.schemas import ArtifactSchema
+
+
+class IArtifactStore:
+    """Interface for the stores which retain the artifacts produced by the
+    controllers, keyed by the `run_id` of a run and the name of the stage which
+    produced the artifact.
+
+    Examples
+    --------
+    >>> from ror.stores import MemoryArtifactStore
+
+    Stores are passed to the controller, which writes the artifacts of each run.
+
+    >>> store = MemoryArtifactStore(max_runs=100)
+    >>> controller = BaseController(data, InitStage, artifact_store=store)
+    """
+
+    # Whether the controller should capture artifacts at all for this store
+    enabled: bool = True
+
+    # Whether writes block on I/O, such stores are written off the event loop
+    blocking: bool = False
+
+    def put(self, run_id: str, stage_name: str, artifact: ArtifactSchema) -> None:
+        """Stores the artifact produced at some stage of a run.
+
+        Parameters
+        ----------
+        run_id : str
+            Id of the run which produced the artifact.
+        stage_name : str
+            Name of the stage which produced the artifact.
+        artifact : ArtifactSchema
+            Artifact to retain.
+        """
+        raise NotImplementedError
+
+    def get(self, run_id: str) -> Dict[str, ArtifactSchema]:
+        """Returns the artifacts retained for some run.
+
+        Parameters
+        ----------
+        run_id : str
+            Id of the run to get the artifacts for.
+
+        Returns
+        -------
+        Dict[str, ArtifactSchema]
+            Stage names mapped to their artifacts, empty if the run is not retained.
+        """
+        raise NotImplementedError
+
+    def evict(self, run_id: str) -> None:
+        """Drops all the artifacts of some run from the store.
+
+        Parameters
+        ----------
+        run_id : str
+            Id of the run to drop.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drops all the artifacts retained in the store."""
+        for run_id in self.run_ids():
+            self.evict(run_id)
+
+    def run_ids(self) -> list:
+        """Returns the ids of the runs currently retained in the store.
+
+        Returns
+        -------
+        list
+            List of run ids.
+        """
+        raise NotImplementedError
+
+    def nbytes(self) -> int:
+        """Returns the estimated number of bytes retained by the store.
+
+        Returns
+        -------
+        int
+            Estimated size in bytes.
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return len(self.run_ids())
+
+    def __contains__(self, run_id: str) -> bool:
+        return run_id in self.run_ids()
@@ -0,0 +1,309 @@
+# External imports
+import os
+import pickle
+import shutil
+import sys
+import threading
+import uuid
+from typing import Dict, Optional
+
+# Local imports
+from ror.schemas import ArtifactSchema
+from ror.utils.paths import check_run_id
+
+from .common import IArtifactStore
+
+# File names within the directory of a stage artifact
+_INDEX_FILE = "index.pkl"
+_ARRAY_SUFFIX = ".bin"
+_PICKLE_SUFFIX = ".pkl"
+
+# Field formats recorded in the index
+_FORMAT_ARRAY = "array"
+_FORMAT_PICKLE = "pickle"
+
+
+def _is_raw_array(value: object) -> bool:
+    """Checks if a value is a NumPy array which can be stored as a raw buffer, NumPy
+    is only looked up if it was already imported as no array could exist otherwise.
+    """
+    numpy = sys.modules.get("numpy")
+
+    return (
+        numpy is not None
+        and isinstance(value, numpy.ndarray)
+        and not value.dtype.hasobject
+        and value.size > 0
+    )
+
+
+class LazyArtifact(ArtifactSchema):
+    """Artifact read back from a `DiskArtifactStore`, the fields are only loaded
+    from disk when accessed. Arrays are memory-mapped read-only and other values
+    are unpickled, each field is loaded at most once.
+    """
+
+    def __init__(self, path: str):
+        """Instantiates a lazy artifact for a stage directory, without reading it.
+
+        Parameters
+        ----------
+        path : str
+            Directory of the stage artifact written by the store.
+        """
+        self.__dict__["_path"] = path
+        self.__dict__["_index"] = None
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            with open(os.path.join(self._path, _INDEX_FILE), "rb") as f:
+                self.__dict__["_index"] = pickle.load(f)
+
+        return self._index
+
+    def _load_field(self, name: str) -> object:
+        fmt, meta = self._load_index()["fields"][name]
+
+        if fmt == _FORMAT_ARRAY:
+            import numpy
+
+            dtype, shape = meta
+            return numpy.memmap(
+                os.path.join(self._path, name + _ARRAY_SUFFIX),
+                dtype=dtype,
+                mode="r",
+                shape=shape,
+            )
+
+        with open(os.path.join(self._path, name + _PICKLE_SUFFIX), "rb") as f:
+            return pickle.load(f)
+
+    def __getattr__(self, name: str) -> object:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        index = self._load_index()
+
+        if name == "source_schema":
+            value = index["source_schema"]
+        elif name in index["fields"]:
+            value = self._load_field(name)
+        else:
+            raise AttributeError(name)
+
+        self.__dict__[name] = value
+
+        return value
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Artifacts read from disk are read-only")
+
+    def __repr__(self) -> str:
+        return f"LazyArtifact(path={self._path!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    __hash__ = object.__hash__
+
+    def __reduce__(self) -> tuple:
+        return LazyArtifact, (self._path,)
+
+    def field_names(self) -> list:
+        """Returns the names of the perishable fields of the artifact.
+
+        Returns
+        -------
+        list
+            List of field names, reads only the index.
+        """
+        return list(self._load_index()["fields"])
+
+    def load(self) -> ArtifactSchema:
+        """Loads all the fields into an instance of the artifact class of the
+        source schema.
+
+        Returns
+        -------
+        ArtifactSchema
+            Fully loaded artifact.
+        """
+        source_schema = self.source_schema
+        values = {name: getattr(self, name) for name in self.field_names()}
+
+        return source_schema._layout.artifact_class(
+            source_schema=source_schema, **values
+        )
+
+
+class DiskArtifactStore(IArtifactStore):
+    """Artifact store which writes the artifacts of each run to a directory per run
+    on local disk, keeping nothing but the paths in memory. NumPy arrays are written
+    as raw buffers which are memory-mapped zero-copy when read, other values are
+    pickled. Reading a run returns `LazyArtifact` instances which only touch the
+    disk when a field is accessed.
+
+    Each artifact is written to a temporary directory without holding the lock of
+    the store, then moved into place, such that concurrent runs do not wait on the
+    disk writes of each other. The run ids are used as directory names and can only
+    have letters, digits, `_`, `.` and `-`.
+
+    Examples
+    --------
+    >>> from ror.stores import DiskArtifactStore
+
+    >>> store = DiskArtifactStore("/tmp/ror-artifacts", max_runs=10_000)
+    >>> controller = BaseController(data, InitStage, artifact_store=store)
+    >>> _, run_id = controller.start()
+    >>> controller.get_artifacts(run_id)["InitStage"].X_std  # memory-mapped
+    """
+
+    blocking = True
+
+    def __init__(self, root: str, max_runs: Optional[int] = None):
+        """Instantiates the store, runs already present in `root` are picked up.
+
+        Parameters
+        ----------
+        root : str
+            Directory under which a directory per run is created.
+        max_runs : Optional[int], optional
+            Maximum number of runs to keep on disk, the oldest are deleted first,
+            by default None
+        """
+        self.root = os.path.abspath(root)
+        self.max_runs = max_runs
+
+        self._runs: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(self.root, exist_ok=True)
+        self._scan()
+
+    def _scan(self) -> None:
+        run_dirs = sorted(
+            (e for e in os.scandir(self.root) if e.is_dir() and e.name[0] != "."),
+            key=lambda e: e.stat().st_mtime,
+        )
+
+        for run_dir in run_dirs:
+            stages = {}
+            for stage_dir in sorted(os.listdir(run_dir.path)):
+                # Temporary directories of interrupted writes
+                if stage_dir.startswith("."):
+                    continue
+
+                path = os.path.join(run_dir.path, stage_dir)
+                # Stage directories without an index were not completely written
+                if os.path.exists(os.path.join(path, _INDEX_FILE)):
+                    stages[stage_dir.split("-", 1)[1]] = path
+
+            self._runs[run_dir.name] = stages
+
+    def _write(self, path: str, artifact: ArtifactSchema) -> None:
+        os.makedirs(path, exist_ok=True)
+        _fields = {}
+
+        for name in artifact.__dataclass_fields__:
+            if name in artifact.get_standard_fields():
+                continue
+
+            value = getattr(artifact, name)
+
+            if _is_raw_array(value):
+                value.tofile(os.path.join(path, name + _ARRAY_SUFFIX))
+                _fields[name] = (_FORMAT_ARRAY, (value.dtype, value.shape))
+            else:
+                with open(os.path.join(path, name + _PICKLE_SUFFIX), "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                _fields[name] = (_FORMAT_PICKLE, None)
+
+        # The index is written last and marks the artifact as complete
+        index = {"source_schema": artifact.source_schema, "fields": _fields}
+        with open(os.path.join(path, _INDEX_FILE), "wb") as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def put(self, run_id: str, stage_name: str, artifact: ArtifactSchema) -> None:
+        check_run_id(run_id)
+
+        with self._lock:
+            self._runs.setdefault(run_id, {})
+
+        # Written out of the run directory, which a concurrent put can evict, and
+        # moved into it under the lock
+        temp_path = os.path.join(self.root, f".tmp-{uuid.uuid4().hex}")
+        try:
+            self._write(temp_path, artifact)
+        except BaseException:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            raise
+
+        deleted = []
+        with self._lock:
+            stages = self._runs.get(run_id)
+
+            # The run was evicted while the artifact was written
+            if stages is None:
+                deleted.append(temp_path)
+            else:
+                run_path = os.path.join(self.root, run_id)
+                os.makedirs(run_path, exist_ok=True)
+
+                path = stages.get(stage_name)
+                if path is None:
+                    path = os.path.join(run_path, f"{len(stages):04d}-{stage_name}")
+                else:
+                    old_path = os.path.join(run_path, f".old-{uuid.uuid4().hex}")
+                    os.replace(path, old_path)
+                    deleted.append(old_path)
+
+                os.replace(temp_path, path)
+                stages[stage_name] = path
+
+            while self.max_runs is not None and len(self._runs) > self.max_runs:
+                deleted.append(self._drop(next(iter(self._runs))))
+
+        for deleted_path in deleted:
+            shutil.rmtree(deleted_path, ignore_errors=True)
+
+    def _drop(self, run_id: str) -> str:
+        """Forgets a run and moves its directory out of the way, returning the path
+        to delete once the lock is released. Called holding the lock.
+        """
+        self._runs.pop(run_id, None)
+        path = os.path.join(self.root, run_id)
+        deleted_path = os.path.join(self.root, f".deleted-{uuid.uuid4().hex}")
+
+        try:
+            os.replace(path, deleted_path)
+        except FileNotFoundError:
+            pass
+
+        return deleted_path
+
+    def get(self, run_id: str) -> Dict[str, ArtifactSchema]:
+        with self._lock:
+            stages = self._runs.get(run_id, {})
+
+            return {name: LazyArtifact(path) for name, path in stages.items()}
+
+    def evict(self, run_id: str) -> None:
+        with self._lock:
+            deleted_path = self._drop(run_id)
+
+        shutil.rmtree(deleted_path, ignore_errors=True)
+
+    def run_ids(self) -> list:
+        with self._lock:
+            return list(self._runs)
+
+    def nbytes(self) -> int:
+        with self._lock:
+            paths = [p for stages in self._runs.values() for p in stages.values()]
+
+        return sum(
+            entry.stat().st_size
+            for path in paths
+            for entry in os.scandir(path)
+            if entry.is_file()
+        )
@@ -0,0 +1,153 @@
+# External imports
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+# Local imports
+from ror.schemas import ArtifactSchema
+from ror.utils.sizeof import deep_sizeof
+
+from .common import IArtifactStore
+
+
+class MemoryArtifactStore(IArtifactStore):
+    """In-memory artifact store with optional bounds on the number of runs, the
+    estimated bytes retained and the age of the runs. When a bound is exceeded the
+    runs are evicted in least-recently-used order, or insertion order if `lru` is
+    disabled, and runs older than `ttl` seconds are expired.
+
+    The artifacts are only sized when they are put if `max_bytes` is set, as sizing
+    walks the whole artifact, otherwise `nbytes` sizes the retained artifacts when
+    it is called.
+
+    Examples
+    --------
+    >>> from ror.stores import MemoryArtifactStore
+
+    Keep at most the 100 last used runs and at most 1GB of artifacts.
+
+    >>> store = MemoryArtifactStore(max_runs=100, max_bytes=1024**3)
+    >>> controller = BaseController(data, InitStage, artifact_store=store)
+    """
+
+    def __init__(
+        self,
+        max_runs: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        lru: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Instantiates the store, all bounds are disabled by default.
+
+        Parameters
+        ----------
+        max_runs : Optional[int], optional
+            Maximum number of runs to retain, by default None
+        max_bytes : Optional[int], optional
+            Maximum estimated bytes to retain, by default None
+        ttl : Optional[float], optional
+            Seconds after the last write of a run before it expires, by default None
+        lru : bool, optional
+            Evict in least-recently-used order, else insertion order, by default True
+        clock : Callable[[], float], optional
+            Monotonic clock in seconds, by default time.monotonic
+        """
+        self.max_runs = max_runs
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.lru = lru
+        self._clock = clock
+
+        self._runs: "OrderedDict[str, Dict[str, ArtifactSchema]]" = OrderedDict()
+        self._run_bytes: Dict[str, int] = {}
+        self._run_times: Dict[str, float] = {}
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def _drop(self, run_id: str) -> None:
+        self._runs.pop(run_id, None)
+        self._run_times.pop(run_id, None)
+        self._nbytes -= self._run_bytes.pop(run_id, 0)
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+
+        deadline = self._clock() - self.ttl
+        expired = [r for r, t in self._run_times.items() if t < deadline]
+
+        for run_id in expired:
+            self._drop(run_id)
+
+    def _enforce(self) -> None:
+        # The most recent run is kept even if it exceeds the bounds on its own
+        while len(self._runs) > 1 and (
+            (self.max_runs is not None and len(self._runs) > self.max_runs)
+            or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+        ):
+            self._drop(next(iter(self._runs)))
+
+    def put(self, run_id: str, stage_name: str, artifact: ArtifactSchema) -> None:
+        sized = self.max_bytes is not None
+        nbytes = deep_sizeof(artifact) if sized else 0
+
+        with self._lock:
+            self._expire()
+
+            run = self._runs.setdefault(run_id, {})
+            if sized and stage_name in run:
+                nbytes -= deep_sizeof(run[stage_name])
+
+            run[stage_name] = artifact
+            self._run_times[run_id] = self._clock()
+
+            if sized:
+                self._run_bytes[run_id] = self._run_bytes.get(run_id, 0) + nbytes
+                self._nbytes += nbytes
+
+            if self.lru:
+                self._runs.move_to_end(run_id)
+
+            self._enforce()
+
+    def get(self, run_id: str) -> Dict[str, ArtifactSchema]:
+        with self._lock:
+            self._expire()
+
+            if run_id not in self._runs:
+                return {}
+
+            if self.lru:
+                self._runs.move_to_end(run_id)
+
+            return dict(self._runs[run_id])
+
+    def evict(self, run_id: str) -> None:
+        with self._lock:
+            self._drop(run_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._runs.clear()
+            self._run_bytes.clear()
+            self._run_times.clear()
+            self._nbytes = 0
+
+    def run_ids(self) -> list:
+        with self._lock:
+            self._expire()
+
+            return list(self._runs)
+
+    def nbytes(self) -> int:
+        with self._lock:
+            self._expire()
+
+            if self.max_bytes is not None:
+                return self._nbytes
+
+            artifacts = [a for run in self._runs.values() for a in run.values()]
+
+        return sum(deep_sizeof(artifact) for artifact in artifacts)
@@ -0,0 +1,35 @@
+# External imports
+from typing import Dict
+
+# Local imports
+from ror.schemas import ArtifactSchema
+
+from .common import IArtifactStore
+
+
+class NullArtifactStore(IArtifactStore):
+    """Artifact store which retains nothing, the controller skips capturing the
+    artifacts entirely when given this store.
+
+    Examples
+    --------
+    >>> from ror.stores import NullArtifactStore
+    >>> controller = BaseController(data, InitStage, artifact_store=NullArtifactStore())
+    """
+
+    enabled = False
+
+    def put(self, run_id: str, stage_name: str, artifact: ArtifactSchema) -> None:
+        pass
+
+    def get(self, run_id: str) -> Dict[str, ArtifactSchema]:
+        return {}
+
+    def evict(self, run_id: str) -> None:
+        pass
+
+    def run_ids(self) -> list:
+        return []
+
+    def nbytes(self) -> int:
+        return 0
@@ -0,0 +1,111 @@
+# External imports
+import dataclasses
+import hashlib
+import pickle
+import sys
+from functools import lru_cache
+
+# Scalar types hashed through their repr, which is stable across processes
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str)
+
+
+def _update(hasher: "hashlib._Hash", obj: object) -> None:
+    """Feeds a type-tagged, order-stable encoding of an object into the hasher."""
+    # Array subclasses (e.g. numpy.memmap) are hashed as plain arrays
+    if _is_array(obj):
+        hasher.update(b"numpy.ndarray:")
+    else:
+        hasher.update(f"{type(obj).__module__}.{type(obj).__qualname__}:".encode())
+
+    if isinstance(obj, _SCALAR_TYPES):
+        hasher.update(repr(obj).encode())
+    elif isinstance(obj, (bytes, bytearray)):
+        hasher.update(obj)
+    elif isinstance(obj, type):
+        hasher.update(f"{obj.__module__}.{obj.__qualname__}".encode())
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(str(len(obj)).encode())
+        for item in obj:
+            _update(hasher, item)
+    elif isinstance(obj, dict):
+        items = sorted((fingerprint(k), v) for k, v in obj.items())
+        hasher.update(str(len(items)).encode())
+        for key, value in items:
+            hasher.update(key.encode())
+            _update(hasher, value)
+    elif isinstance(obj, (set, frozenset)):
+        for item in sorted(fingerprint(item) for item in obj):
+            hasher.update(item.encode())
+    elif dataclasses.is_dataclass(obj):
+        for field in dataclasses.fields(obj):
+            hasher.update(field.name.encode())
+            _update(hasher, getattr(obj, field.name))
+    elif _is_array(obj):
+        hasher.update(f"{obj.dtype.str}{obj.shape}".encode())
+        if obj.dtype.hasobject:
+            _update(hasher, obj.tolist())
+        else:
+            hasher.update(sys.modules["numpy"].ascontiguousarray(obj).data)
+    else:
+        hasher.update(pickle.dumps(obj, protocol=4))
+
+
+def _is_array(obj: object) -> bool:
+    numpy = sys.modules.get("numpy")
+
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def fingerprint(obj: object) -> str:
+    """Computes a stable hash of an object which is the same across processes and
+    runs for equal values. Containers, dataclasses (e.g. BaseSchema instances) and
+    NumPy arrays are hashed by value, other objects through their pickle.
+
+    Parameters
+    ----------
+    obj : object
+        Object to hash.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    _update(hasher, obj)
+
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _source_fingerprint(stage_class: type) -> str:
+    import inspect
+
+    try:
+        source = inspect.getsource(stage_class)
+    except (OSError, TypeError):
+        source = f"{stage_class.__module__}.{stage_class.__qualname__}"
+
+    return fingerprint((stage_class, source))
+
+
+def stage_fingerprint(stage_class: type) -> str:
+    """Computes a hash identifying the version of a stage class, from its `version`
+    attribute if it defines one, else from the source code of the class.
+
+    Parameters
+    ----------
+    stage_class : type
+        Stage class to hash.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    version = getattr(stage_class, "version", None)
+
+    if version is None:
+        return _source_fingerprint(stage_class)
+
+    return fingerprint((stage_class, version))
@@ -0,0 +1,32 @@
+# External imports
+import re
+
+# Names which can be used as a single path component, without separators and not
+# starting with a dot, such that they can not escape the directory they are in
+_SAFE_NAME = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_.\-]{0,199}")
+
+
+def check_run_id(run_id: str) -> str:
+    """Checks that a run id can be used as a file or directory name under the root of
+    a store, e.g. a UUID or a date.
+
+    Parameters
+    ----------
+    run_id : str
+        Run id to check.
+
+    Returns
+    -------
+    str
+        The run id.
+
+    Raises
+    ------
+    ValueError
+        If the run id has characters other than letters, digits, `_`, `.` and `-`,
+        starts with a dot or is longer than 200 characters.
+    """
+    if not isinstance(run_id, str) or _SAFE_NAME.fullmatch(run_id) is None:
+        raise ValueError(f"The run id {run_id!r} can not be used as a file name!")
+
+    return run_id
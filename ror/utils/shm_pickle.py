@@ -0,0 +1,138 @@
+# External imports
+import io
+import pickle
+import sys
+import weakref
+from typing import List, Tuple
+
+# Arrays smaller than this number of bytes are pickled in-band
+DEFAULT_THRESHOLD = 64 * 1024
+
+# Tag of the persistent ids referring to a shared memory segment
+_SHM_TAG = "ror-shm"
+
+
+def _is_shareable(obj: object, threshold: int) -> bool:
+    numpy = sys.modules.get("numpy")
+
+    return (
+        numpy is not None
+        and type(obj) is numpy.ndarray
+        and not obj.dtype.hasobject
+        and obj.nbytes >= threshold
+    )
+
+
+def _attach(name: str, dtype: object, shape: tuple) -> object:
+    """Maps a shared memory segment as an array, the segment stays mapped for as
+    long as the array, or any view of it, is alive.
+    """
+    from multiprocessing import shared_memory
+
+    import numpy
+
+    shm = shared_memory.SharedMemory(name=name)
+    array = numpy.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    weakref.finalize(array, shm.close)
+
+    return array
+
+
+class _SharedMemoryPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, threshold: int):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.threshold = threshold
+        self.segments: List[str] = []
+
+    def persistent_id(self, obj: object) -> object:
+        if not _is_shareable(obj, self.threshold):
+            return None
+
+        from multiprocessing import shared_memory
+
+        import numpy
+
+        shm = shared_memory.SharedMemory(create=True, size=obj.nbytes)
+        numpy.ndarray(obj.shape, dtype=obj.dtype, buffer=shm.buf)[...] = obj
+        shm.close()
+        self.segments.append(shm.name)
+
+        return (_SHM_TAG, shm.name, obj.dtype, obj.shape)
+
+
+class _SharedMemoryUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: object) -> object:
+        tag, name, dtype, shape = pid
+
+        if tag != _SHM_TAG:
+            raise pickle.UnpicklingError(f"Unsupported persistent id {tag}")
+
+        return _attach(name, dtype, shape)
+
+
+def dumps(obj: object, threshold: int = DEFAULT_THRESHOLD) -> Tuple[bytes, List[str]]:
+    """Pickles an object where every NumPy array of at least `threshold` bytes, at
+    any depth, is copied once into a shared memory segment instead of the pickle.
+
+    Parameters
+    ----------
+    obj : object
+        Object to pickle.
+    threshold : int, optional
+        Minimum number of bytes of an array to be shared, by default 64KiB
+
+    Returns
+    -------
+    Tuple[bytes, List[str]]
+        The pickle and the names of the segments created, which have to be unlinked
+        with `unlink` by the receiving side once it is done with them.
+    """
+    file = io.BytesIO()
+    pickler = _SharedMemoryPickler(file, threshold)
+
+    try:
+        pickler.dump(obj)
+    except BaseException:
+        unlink(pickler.segments)
+        raise
+
+    return file.getvalue(), pickler.segments
+
+
+def loads(data: bytes) -> object:
+    """Unpickles an object produced by `dumps`, where the shared arrays are mapped
+    zero-copy from their shared memory segments.
+
+    Parameters
+    ----------
+    data : bytes
+        Pickle produced by `dumps`.
+
+    Returns
+    -------
+    object
+        The unpickled object.
+    """
+    return _SharedMemoryUnpickler(io.BytesIO(data)).load()
+
+
+def unlink(segments: List[str]) -> None:
+    """Removes the names of shared memory segments, the memory is released once
+    every process has unmapped them, arrays already mapped remain valid.
+
+    Parameters
+    ----------
+    segments : List[str]
+        Names of the segments returned by `dumps`.
+    """
+    from multiprocessing import shared_memory
+
+    for name in segments:
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,64 @@
+# External imports
+import sys
+from types import FunctionType, ModuleType
+from typing import Set
+
+# Objects which are shared references and not owned by the measured object
+_SKIP_TYPES = (type, ModuleType, FunctionType)
+
+
+def deep_sizeof(obj: object) -> int:
+    """Estimates the number of bytes retained by an object, including everything
+    it references through containers, dataclass/instance attributes and slots.
+    Objects exposing an integer `nbytes` (e.g. NumPy arrays) count their buffer.
+
+    Parameters
+    ----------
+    obj : object
+        Object to estimate the size of.
+
+    Returns
+    -------
+    int
+        Estimated size in bytes, shared references are only counted once.
+    """
+    seen: Set[int] = set()
+    stack = [obj]
+    size = 0
+
+    while stack:
+        current = stack.pop()
+
+        if id(current) in seen or isinstance(current, _SKIP_TYPES):
+            continue
+        seen.add(id(current))
+
+        nbytes = getattr(current, "nbytes", None)
+        if isinstance(nbytes, int):
+            # Buffer-backed object, views only count their header and the base
+            # which owns the data is measured once
+            base = getattr(current, "base", None)
+            if base is None:
+                size += max(sys.getsizeof(current, 0), nbytes)
+            else:
+                size += sys.getsizeof(current, 0)
+                stack.append(base)
+            continue
+
+        size += sys.getsizeof(current, 0)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, bytearray, int, float, complex)):
+            if hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+            for klass in type(current).__mro__:
+                slots = klass.__dict__.get("__slots__", ())
+                for slot in (slots,) if isinstance(slots, str) else slots:
+                    if slot != "__dict__" and hasattr(current, slot):
+                        stack.append(getattr(current, slot))
+
+    return size
@@ -0,0 +1,53 @@
+# External imports
+import tempfile
+import unittest
+
+# Local imports
+from ror.caches import DiskMemoCache, MemoEntry, MemoKey
+
+
+class StageA:
+    pass
+
+
+class StageB:
+    pass
+
+
+def key(stage: type, input: str) -> MemoKey:
+    return MemoKey(f"{stage.__module__}.{stage.__qualname__}", "v", input)
+
+
+class DiskMemoCacheTestCase(unittest.TestCase):
+    """Test case for the on-disk memo cache"""
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self._cache = DiskMemoCache(self._dir.name)
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_get_put(self):
+        self._cache.put(key(StageA, "a"), MemoEntry(StageB(), {"A": 1}))
+        entry = self._cache.get(key(StageA, "a"))
+
+        self.assertIsInstance(entry.next_stage, StageB)
+        self.assertEqual(entry.output, {"A": 1})
+        self.assertIsNone(self._cache.get(key(StageA, "b")))
+
+    def test_persists(self):
+        self._cache.put(key(StageA, "a"), MemoEntry(None, 1))
+
+        self.assertEqual(DiskMemoCache(self._dir.name).get(key(StageA, "a")).output, 1)
+
+    def test_invalidate(self):
+        self._cache.put(key(StageA, "a"), MemoEntry(None, 1))
+        self._cache.put(key(StageB, "a"), MemoEntry(None, 2))
+        self._cache.invalidate(StageA)
+
+        self.assertIsNone(self._cache.get(key(StageA, "a")))
+        self.assertEqual(len(self._cache), 1)
+
+        self._cache.invalidate()
+        self.assertEqual(len(self._cache), 0)
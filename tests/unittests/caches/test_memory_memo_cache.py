@@ -0,0 +1,50 @@
+# External imports
+import unittest
+
+# Local imports
+from ror.caches import MemoEntry, MemoKey, MemoryMemoCache
+
+
+class StageA:
+    pass
+
+
+class StageB:
+    pass
+
+
+def key(stage: type, input: str) -> MemoKey:
+    return MemoKey(f"{stage.__module__}.{stage.__qualname__}", "v", input)
+
+
+class MemoryMemoCacheTestCase(unittest.TestCase):
+    """Test case for the in-memory memo cache"""
+
+    def setUp(self) -> None:
+        self._cache = MemoryMemoCache(max_entries=2)
+
+    def test_get_put(self):
+        self._cache.put(key(StageA, "a"), MemoEntry(None, "output"))
+
+        self.assertEqual(self._cache.get(key(StageA, "a")).output, "output")
+        self.assertIsNone(self._cache.get(key(StageA, "b")))
+
+    def test_lru(self):
+        self._cache.put(key(StageA, "a"), MemoEntry(None, 1))
+        self._cache.put(key(StageA, "b"), MemoEntry(None, 2))
+        self._cache.get(key(StageA, "a"))
+        self._cache.put(key(StageA, "c"), MemoEntry(None, 3))
+
+        self.assertEqual(len(self._cache), 2)
+        self.assertIsNone(self._cache.get(key(StageA, "b")))
+
+    def test_invalidate(self):
+        self._cache.put(key(StageA, "a"), MemoEntry(None, 1))
+        self._cache.put(key(StageB, "a"), MemoEntry(None, 2))
+        self._cache.invalidate(StageA)
+
+        self.assertIsNone(self._cache.get(key(StageA, "a")))
+        self.assertIsNotNone(self._cache.get(key(StageB, "a")))
+
+        self._cache.invalidate()
+        self.assertEqual(len(self._cache), 0)
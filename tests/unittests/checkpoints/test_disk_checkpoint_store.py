@@ -0,0 +1,94 @@
+# External imports
+import os
+import tempfile
+import unittest
+
+# Local imports
+from ror.checkpoints import Checkpoint, DiskCheckpointStore
+
+
+class StageA:
+    pass
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise TypeError("Not picklable")
+
+
+class DiskCheckpointStoreTestCase(unittest.TestCase):
+    """Test case for the on-disk checkpoint store"""
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self._store = DiskCheckpointStore(self._dir.name)
+
+    def tearDown(self) -> None:
+        self._store.flush()
+        self._dir.cleanup()
+
+    def test_get_put(self):
+        self._store.put("run", Checkpoint("StageA", StageA(), {"A": 1}))
+        checkpoint = self._store.get("run")
+
+        self.assertIsInstance(checkpoint.next_stage, StageA)
+        self.assertEqual(checkpoint.output, {"A": 1})
+        self.assertIsNone(self._store.get("missing"))
+
+    def test_latest(self):
+        for i in range(10):
+            self._store.put("run", Checkpoint("StageA", None, i))
+        self._store.flush()
+
+        self.assertEqual(DiskCheckpointStore(self._dir.name).get("run").output, 9)
+        self.assertEqual(self._store.run_ids(), ["run"])
+
+    def test_foreground(self):
+        store = DiskCheckpointStore(self._dir.name, background=False)
+        store.put("run", Checkpoint("StageA", None, 1))
+
+        self.assertIsNone(store._writer)
+        self.assertIn("run", DiskCheckpointStore(self._dir.name))
+
+    def test_evict(self):
+        self._store.put("run", Checkpoint("StageA", None, 1))
+        self._store.evict("run")
+
+        self.assertNotIn("run", self._store)
+        self.assertEqual(len(self._store), 0)
+
+    def test_pickled_on_put(self):
+        output = {"A": 1}
+        self._store.put("run", Checkpoint("StageA", StageA(), output))
+        output["A"] = 2
+
+        self.assertEqual(self._store.get("run").output, {"A": 1})
+
+        with self.assertRaises(TypeError):
+            self._store.put("run", Checkpoint("StageA", Unpicklable(), 1))
+
+    def test_unsafe_run_id(self):
+        with self.assertRaises(ValueError):
+            self._store.put("../run", Checkpoint("StageA", StageA(), 1))
+
+        self.assertEqual(len(self._store), 0)
+
+    def test_write_error(self):
+        # The checkpoint can not replace a directory
+        os.mkdir(self._store._path("run"))
+        self._store.put("run", Checkpoint("StageA", None, 1))
+
+        with self.assertRaises(OSError):
+            self._store.flush()
+
+        self._store.flush()  # Raised once
+
+    def test_max_completed(self):
+        store = DiskCheckpointStore(self._dir.name, max_completed=2)
+
+        store.put("running", Checkpoint("StageA", StageA(), 0))
+        for i in range(4):
+            store.put(f"run{i}", Checkpoint("StageA", None, i))
+
+        self.assertEqual(sorted(store.run_ids()), ["run2", "run3", "running"])
+        self.assertIsNone(store.get("run0"))
@@ -0,0 +1,197 @@
+# External imports
+import asyncio
+import threading
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.controlers import (
+    AsyncController,
+    BaseController,
+    DagController,
+    ThreadedController,
+)
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IAsyncForwardStage, IInitStage, ITerminalStage
+from ror.stages.common import IAsyncStage
+
+"""=============================== TEST DATA =============================="""
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+    thread: str = field_perishable()
+
+
+class ConcurrencyTracker:
+    """Tracks the maximum number of coroutines awaiting at the same time"""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+
+TRACKER = ConcurrencyTracker()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "thread": threading.current_thread()}
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(**self._output)
+
+
+class AsyncForwardStageTest(
+    IAsyncForwardStage[OutputTest, OutputTest, TerminalStageTest]
+):
+    async def compute(self) -> None:
+        TRACKER.active += 1
+        TRACKER.max_active = max(TRACKER.max_active, TRACKER.active)
+        await asyncio.sleep(0.01)
+        TRACKER.active -= 1
+
+        if self.input.A < 0:
+            raise ValueError("Negative input")
+
+        self._output = {"A": self.input.A * 2, "thread": None}
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, AsyncForwardStageTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "thread": None}
+
+    def get_output(self) -> Tuple[AsyncForwardStageTest, OutputTest]:
+        return AsyncForwardStageTest(), OutputTest(**self._output)
+
+
+class ReusableTerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    reusable = True
+
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(**self._output, thread=None)
+
+
+class ReusableForwardStageTest(
+    IAsyncForwardStage[OutputTest, OutputTest, ReusableTerminalStageTest]
+):
+    reusable = True
+
+    async def compute(self) -> None:
+        # The input is read again after the other runs had the loop
+        await asyncio.sleep(0.01)
+        self._output = {"A": self.input.A * 2}
+
+    def get_output(self) -> Tuple[ReusableTerminalStageTest, OutputTest]:
+        return ReusableTerminalStageTest(), OutputTest(**self._output, thread=None)
+
+
+class ReusableInitStageTest(
+    IInitStage[InputTest, OutputTest, ReusableForwardStageTest]
+):
+    reusable = True
+
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> Tuple[ReusableForwardStageTest, OutputTest]:
+        return ReusableForwardStageTest(), OutputTest(**self._output, thread=None)
+
+
+"""============================== TEST CASES =============================="""
+
+
+class AsyncStageTestCase(unittest.TestCase):
+    """Test the async variants of the stage interfaces"""
+
+    def test_async_interface(self):
+        self.assertIsInstance(AsyncForwardStageTest(), IAsyncStage)
+        self.assertTrue(asyncio.iscoroutinefunction(AsyncForwardStageTest.compute))
+        self.assertEqual(AsyncForwardStageTest().discover(), TerminalStageTest)
+
+    def test_sync_controllers(self):
+        for controller_class in [BaseController, ThreadedController, DagController]:
+            controller = controller_class(InputTest(A=1, B="B"), InitStageTest)
+
+            with self.assertRaisesRegex(TypeError, "AsyncController"):
+                controller.start()
+
+            with self.assertRaisesRegex(TypeError, "AsyncController"):
+                controller.map([InputTest(A=1, B="B")])
+
+
+class AsyncControllerTestCase(unittest.TestCase):
+    """Test that the pipelines run concurrently on the event loop"""
+
+    def setUp(self) -> None:
+        TRACKER.max_active = 0
+        self._controller = AsyncController(
+            InputTest(A=1, B="B"), InitStageTest, concurrency=4
+        )
+
+    def test_start(self):
+        output, run_id = asyncio.run(self._controller.start())
+
+        self.assertEqual(output.A, 2)
+        self.assertIsNot(output.thread, threading.main_thread())
+        self.assertIn("AsyncForwardStageTest", self._controller.get_artifacts(run_id))
+
+    def test_map(self):
+        inputs = [InputTest(A=i, B="B") for i in range(10)]
+        outputs = asyncio.run(self._controller.map(inputs))
+
+        self.assertListEqual([output.A for output in outputs], list(range(0, 20, 2)))
+
+    def test_concurrency_limit(self):
+        inputs = [InputTest(A=i, B="B") for i in range(10)]
+        asyncio.run(self._controller.map(inputs))
+
+        self.assertGreater(TRACKER.max_active, 1)
+        self.assertLessEqual(TRACKER.max_active, 4)
+
+    def test_async_iterable(self):
+        async def inputs():
+            for i in range(3):
+                yield InputTest(A=i, B="B")
+
+        async def consume():
+            return [output.A async for output, _ in self._controller.stream(inputs())]
+
+        self.assertListEqual(asyncio.run(consume()), [0, 2, 4])
+
+    def test_failure(self):
+        inputs = [InputTest(A=i, B="B") for i in (1, -1, 2)]
+
+        with self.assertRaises(ValueError):
+            asyncio.run(self._controller.map(inputs))
+
+    def test_reusable_concurrent_runs(self):
+        controller = AsyncController(None, ReusableInitStageTest, concurrency=8)
+        inputs = [InputTest(A=i, B="B") for i in range(8)]
+        outputs = asyncio.run(controller.map(inputs))
+
+        self.assertListEqual([output.A for output in outputs], list(range(0, 16, 2)))
+
+        # One warm instance per concurrent run, kept for the next runs
+        warm = len(controller.stage_pool)
+        asyncio.run(controller.map(inputs))
+        self.assertEqual(len(controller.stage_pool), warm)
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            AsyncController(None, InitStageTest, concurrency=0)
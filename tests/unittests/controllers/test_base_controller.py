@@ -7,6 +7,7 @@ from ror.controlers.common import BaseController
 from ror.schemas import BaseSchema
 from ror.schemas.fields import field_perishable, field_persistance
 from ror.stages import IForwardStage, IInitStage, ITerminalStage
+from ror.stores import MemoryArtifactStore, NullArtifactStore
 
 """=============================== TEST DATA =============================="""
 
@@ -105,3 +106,29 @@ class CheckArtifactsTestCase(unittest.TestCase):
             - set(["source_schema"]),
             set(),
         )
+
+
+class ArtifactStoreTestCase(unittest.TestCase):
+    """Test that the controller writes to the configured artifact store"""
+
+    def setUp(self) -> None:
+        self._dataclass = InputTest(A="A", B="B")
+
+    def test_bounded_store(self):
+        controller = BaseController(
+            self._dataclass, InitStageTest, artifact_store=MemoryArtifactStore(1)
+        )
+        _, first_run = controller.start()
+        _, second_run = controller.start()
+
+        self.assertEqual(controller.get_artifacts(first_run), {})
+        self.assertIn("InitStageTest", controller.get_artifacts(second_run))
+
+    def test_disabled_store(self):
+        controller = BaseController(
+            self._dataclass, InitStageTest, artifact_store=NullArtifactStore()
+        )
+        output, run_id = controller.start()
+
+        self.assertEqual(output.C, "C")
+        self.assertEqual(controller.get_artifacts(run_id), {})
@@ -0,0 +1,123 @@
+# External imports
+import unittest
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Local imports
+from ror.controlers.common import BaseController
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IBatchStage, IForwardStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_perishable()
+    C: int = field_persistance()
+
+
+@dataclass
+class TerminalOutputTest(BaseSchema):
+    C: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, TerminalOutputTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> TerminalOutputTest:
+        return TerminalOutputTest(**self._output)
+
+
+class BatchForwardStageTest(
+    IForwardStage[OutputTest, OutputTest, TerminalStageTest], IBatchStage
+):
+    batch_sizes = []
+
+    def compute_batch(self) -> None:
+        self.batch_sizes.append(len(self.inputs))
+        self._outputs = [{**input.__dict__, "C": input.C * 2} for input in self.inputs]
+
+    def get_batch_output(self) -> Tuple[TerminalStageTest, List[OutputTest]]:
+        return TerminalStageTest(), [OutputTest(**o) for o in self._outputs]
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, BatchForwardStageTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "C": self.input.A}
+
+    def get_output(self) -> Tuple[BatchForwardStageTest, OutputTest]:
+        return BatchForwardStageTest(), OutputTest(**self._output)
+
+
+class RoutingInitStageTest(IInitStage[InputTest, OutputTest, BatchForwardStageTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "C": self.input.A}
+
+    def get_output(self) -> Tuple[IForwardStage, OutputTest]:
+        if self.input.A % 2:
+            return TerminalStageTest(), OutputTest(**self._output)
+
+        return BatchForwardStageTest(), OutputTest(**self._output)
+
+
+"""============================== TEST CASES =============================="""
+
+
+class StartBatchTestCase(unittest.TestCase):
+    """Test that a batch of inputs is computed through the pipeline"""
+
+    def setUp(self) -> None:
+        BatchForwardStageTest.batch_sizes = []
+        self._inputs = [InputTest(A=i, B="B") for i in range(5)]
+        self._controller = BaseController(None, InitStageTest)
+
+    def test_outputs(self):
+        results = self._controller.start_batch(self._inputs)
+
+        self.assertListEqual([output.C for output, _ in results], [0, 2, 4, 6, 8])
+        self.assertEqual(len(set(run_id for _, run_id in results)), 5)
+
+    def test_single_batch_call(self):
+        self._controller.start_batch(self._inputs)
+
+        self.assertListEqual(BatchForwardStageTest.batch_sizes, [5])
+
+    def test_map(self):
+        outputs = self._controller.map(self._inputs)
+
+        self.assertTrue(all(isinstance(o, TerminalOutputTest) for o in outputs))
+
+    def test_artifacts(self):
+        results = self._controller.start_batch(self._inputs)
+        artifacts = self._controller.get_artifacts(results[3][1])
+
+        self.assertEqual(artifacts["InitStageTest"].B, "B")
+        self.assertEqual(artifacts["BatchForwardStageTest"].A, 3)
+        self.assertIn("TerminalStageTest", artifacts)
+
+    def test_empty(self):
+        self.assertListEqual(self._controller.start_batch([]), [])
+
+
+class RoutingBatchTestCase(unittest.TestCase):
+    """Test that records routed to different stages are grouped by stage"""
+
+    def setUp(self) -> None:
+        BatchForwardStageTest.batch_sizes = []
+        self._inputs = [InputTest(A=i, B="B") for i in range(5)]
+        self._controller = BaseController(None, RoutingInitStageTest)
+
+    def test_routing(self):
+        outputs = self._controller.map(self._inputs)
+
+        self.assertListEqual([output.C for output in outputs], [0, 1, 4, 3, 8])
+        self.assertListEqual(BatchForwardStageTest.batch_sizes, [3])
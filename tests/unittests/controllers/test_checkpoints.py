@@ -0,0 +1,192 @@
+# External imports
+import tempfile
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.checkpoints import DiskCheckpointStore, MemoryCheckpointStore
+from ror.controlers import BaseController, DagController
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IForwardStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+# Stage classes in the order they computed, and whether the forward stage fails
+COMPUTED = []
+FAIL = {"forward": False}
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(A=self.input.A + 1)
+
+
+class ForwardStageTest(IForwardStage[OutputTest, OutputTest, TerminalStageTest]):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+        if FAIL["forward"]:
+            raise RuntimeError("Crashed")
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(A=self.input.A * 10)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, ForwardStageTest]):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+
+    def get_output(self) -> Tuple[ForwardStageTest, OutputTest]:
+        return ForwardStageTest(), OutputTest(**self.input.get_carry())
+
+
+class MutatingForwardStageTest(ForwardStageTest):
+    def compute(self) -> None:
+        # Mutates its input in place before failing
+        self.input.A += 100
+        super().compute()
+
+
+class MutatingInitStageTest(
+    IInitStage[InputTest, OutputTest, MutatingForwardStageTest]
+):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+
+    def get_output(self) -> Tuple[MutatingForwardStageTest, OutputTest]:
+        return MutatingForwardStageTest(), OutputTest(**self.input.get_carry())
+
+
+class CheapForwardStageTest(ForwardStageTest):
+    checkpoint = False
+
+
+class CheapInitStageTest(IInitStage[InputTest, OutputTest, CheapForwardStageTest]):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+
+    def get_output(self) -> Tuple[CheapForwardStageTest, OutputTest]:
+        return CheapForwardStageTest(), OutputTest(**self.input.get_carry())
+
+
+"""============================== TEST CASES =============================="""
+
+
+class CheckpointTestCase(unittest.TestCase):
+    """Test case for resuming runs from the checkpoint of their last stage"""
+
+    def setUp(self) -> None:
+        COMPUTED.clear()
+        FAIL["forward"] = False
+
+        self._dir = tempfile.TemporaryDirectory()
+        self._store = DiskCheckpointStore(self._dir.name)
+        self._data = InputTest(A=2, B="B")
+
+    def tearDown(self) -> None:
+        self._store.flush()
+        self._dir.cleanup()
+
+    def test_resume_after_failure(self):
+        controller = BaseController(
+            self._data, InitStageTest, checkpoint_store=self._store
+        )
+        FAIL["forward"] = True
+
+        with self.assertRaises(RuntimeError):
+            controller.start(run_id="run")
+
+        # A new process resumes from the stage which failed
+        FAIL["forward"] = False
+        COMPUTED.clear()
+        store = DiskCheckpointStore(self._dir.name)
+        controller = BaseController(None, InitStageTest, checkpoint_store=store)
+        output, run_id = controller.resume("run")
+        store.flush()
+
+        self.assertEqual(output, OutputTest(A=21))
+        self.assertEqual(run_id, "run")
+        self.assertEqual(COMPUTED, [ForwardStageTest, TerminalStageTest])
+        self.assertIsNone(store.get("run").next_stage)
+
+    def test_resume_completed(self):
+        controller = BaseController(
+            self._data, InitStageTest, checkpoint_store=self._store
+        )
+        _, run_id = controller.start()
+        COMPUTED.clear()
+
+        self.assertEqual(controller.resume(run_id)[0], OutputTest(A=21))
+        self.assertEqual(COMPUTED, [])
+
+    def test_input_mutated_in_place(self):
+        for store in (self._store, MemoryCheckpointStore()):
+            controller = BaseController(
+                self._data, MutatingInitStageTest, checkpoint_store=store
+            )
+            FAIL["forward"] = True
+
+            with self.assertRaises(RuntimeError):
+                controller.start(run_id="mutated")
+
+            # The checkpoint has the output as the init stage returned it
+            FAIL["forward"] = False
+            self.assertEqual(controller.resume("mutated")[0], OutputTest(A=1021))
+
+    def test_completed_runs_bounded(self):
+        store = MemoryCheckpointStore(max_completed=1)
+        controller = BaseController(self._data, InitStageTest, checkpoint_store=store)
+
+        controller.start(run_id="first")
+        controller.start(run_id="second")
+
+        self.assertEqual(store.run_ids(), ["second"])
+
+    def test_opt_out(self):
+        store = MemoryCheckpointStore()
+        controller = BaseController(
+            self._data, CheapInitStageTest, checkpoint_store=store
+        )
+        FAIL["forward"] = True
+
+        with self.assertRaises(RuntimeError):
+            controller.start(run_id="run")
+
+        self.assertEqual(store.get("run").stage, "CheapInitStageTest")
+
+        FAIL["forward"] = False
+        controller.start(run_id="run")
+
+        # The cheap stage is not checkpointed, only the terminal stage after it
+        checkpoint = store.get("run")
+        self.assertEqual(checkpoint.stage, "TerminalStageTest")
+        self.assertIsNone(checkpoint.next_stage)
+
+    def test_resume_errors(self):
+        with self.assertRaises(ValueError):
+            BaseController(self._data, InitStageTest).resume("run")
+
+        controller = BaseController(
+            self._data, InitStageTest, checkpoint_store=self._store
+        )
+        with self.assertRaises(ValueError):
+            controller.resume("missing")
+
+    def test_dag_controller(self):
+        with self.assertRaises(ValueError):
+            DagController(self._data, InitStageTest, checkpoint_store=self._store)
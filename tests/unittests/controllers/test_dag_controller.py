@@ -0,0 +1,266 @@
+# External imports
+import time
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.caches import MemoryMemoCache
+from ror.controlers import DagController
+from ror.controlers.common import DagPlan
+from ror.profilers import MemoryProfiler
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import (
+    IFanOutStage,
+    IForwardStage,
+    IInitStage,
+    IJoinStage,
+    ITerminalStage,
+)
+
+"""=============================== TEST DATA =============================="""
+
+# Seconds each branch stage sleeps for, which releases the GIL
+BRANCH_SLEEP = 0.1
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class SquareTest(BaseSchema):
+    A: int = field_persistance()
+    S: int = field_persistance()
+
+
+@dataclass
+class DoubleTest(BaseSchema):
+    A: int = field_persistance()
+    D: int = field_persistance()
+
+
+@dataclass
+class JoinedTest(BaseSchema):
+    A: int = field_persistance()
+    S: int = field_persistance()
+    D: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[JoinedTest, JoinedTest]):
+    def get_output(self) -> JoinedTest:
+        return self.input
+
+
+class JoinStageTest(
+    IJoinStage[Tuple[SquareTest, DoubleTest], JoinedTest, TerminalStageTest]
+):
+    def get_output(self) -> Tuple[TerminalStageTest, JoinedTest]:
+        square, double = self.input
+
+        return TerminalStageTest(), square.carry_to(JoinedTest, D=double.D)
+
+
+class DoubleStageTest(IForwardStage[InputTest, DoubleTest, JoinStageTest]):
+    def compute(self) -> None:
+        time.sleep(BRANCH_SLEEP)
+
+    def get_output(self) -> Tuple[JoinStageTest, DoubleTest]:
+        return JoinStageTest(), DoubleTest(A=self.input.A, D=self.input.A * 2)
+
+
+class SquareStageTest(IForwardStage[InputTest, SquareTest, JoinStageTest]):
+    def compute(self) -> None:
+        time.sleep(BRANCH_SLEEP)
+
+    def get_output(self) -> Tuple[JoinStageTest, SquareTest]:
+        return JoinStageTest(), SquareTest(A=self.input.A, S=self.input.A**2)
+
+
+class FanOutStageTest(
+    IFanOutStage[InputTest, InputTest, Tuple[DoubleStageTest, SquareStageTest]]
+):
+    def get_output(self) -> Tuple[Tuple, InputTest]:
+        return (DoubleStageTest(), SquareStageTest()), self.input
+
+
+class WrongFanOutStageTest(
+    IFanOutStage[InputTest, InputTest, Tuple[DoubleStageTest, SquareStageTest]]
+):
+    def get_output(self) -> Tuple[Tuple, InputTest]:
+        return (DoubleStageTest(),), self.input
+
+
+class InitStageTest(IInitStage[InputTest, InputTest, FanOutStageTest]):
+    def get_output(self) -> Tuple[FanOutStageTest, InputTest]:
+        return FanOutStageTest(), self.input
+
+
+# A join with a previous stage of the wrong output schema
+class BadJoinStageTest(
+    IJoinStage[Tuple[SquareTest, SquareTest], JoinedTest, TerminalStageTest]
+):
+    ...
+
+
+class BadBranchStageTest(IForwardStage[InputTest, SquareTest, BadJoinStageTest]):
+    ...
+
+
+class OtherBadBranchStageTest(IForwardStage[InputTest, DoubleTest, BadJoinStageTest]):
+    ...
+
+
+class BadFanOutStageTest(
+    IFanOutStage[
+        InputTest, InputTest, Tuple[BadBranchStageTest, OtherBadBranchStageTest]
+    ]
+):
+    ...
+
+
+# A stage which is not a join reached from two branches
+class MergeStageTest(IForwardStage[SquareTest, JoinedTest, TerminalStageTest]):
+    ...
+
+
+class LeftStageTest(IForwardStage[InputTest, SquareTest, MergeStageTest]):
+    ...
+
+
+class RightStageTest(IForwardStage[InputTest, SquareTest, MergeStageTest]):
+    ...
+
+
+class MergeFanOutStageTest(
+    IFanOutStage[InputTest, InputTest, Tuple[LeftStageTest, RightStageTest]]
+):
+    ...
+
+
+"""============================== TEST CASES =============================="""
+
+
+class DagPlanTestCase(unittest.TestCase):
+    """Test case for the compilation of DAG pipelines"""
+
+    def test_topological_order(self):
+        plan = DagPlan.compile(InitStageTest)
+        names = [step.name for step in plan]
+
+        self.assertEqual(len(plan), 6)
+        self.assertEqual(names[:2], ["InitStageTest", "FanOutStageTest"])
+        self.assertEqual(names[-2:], ["JoinStageTest", "TerminalStageTest"])
+        self.assertTrue(plan.terminal_step.terminal)
+
+    def test_links(self):
+        plan = DagPlan.compile(InitStageTest)
+        join = plan.step(JoinStageTest)
+
+        self.assertEqual(
+            plan.step(FanOutStageTest).next_stages, (DoubleStageTest, SquareStageTest)
+        )
+        self.assertTrue(join.join)
+        self.assertEqual(join.previous_stages, (SquareStageTest, DoubleStageTest))
+        self.assertIn("DoubleStageTest, SquareStageTest", str(plan))
+
+    def test_join_mismatch(self):
+        with self.assertRaises(ValueError):
+            DagPlan.compile(BadFanOutStageTest)
+
+    def test_merge_without_join(self):
+        with self.assertRaises(ValueError):
+            DagPlan.compile(MergeFanOutStageTest)
+
+
+class DagControllerTestCase(unittest.TestCase):
+    """Test case for running DAG pipelines with concurrent branches"""
+
+    def setUp(self) -> None:
+        self._controller = DagController(InputTest(A=3, B="B"), InitStageTest)
+
+    def tearDown(self) -> None:
+        self._controller.close()
+
+    def test_start(self):
+        output, run_id = self._controller.start()
+        artifacts = self._controller.get_artifacts(run_id)
+
+        self.assertEqual(output, JoinedTest(A=3, S=9, D=6))
+        self.assertIn("JoinStageTest[SquareStageTest]", artifacts)
+        self.assertIn("DoubleStageTest", artifacts)
+
+    def test_map(self):
+        outputs = self._controller.map(InputTest(A=i, B="B") for i in range(5))
+
+        self.assertEqual([output.S for output in outputs], [0, 1, 4, 9, 16])
+        self.assertEqual([output.D for output in outputs], [0, 2, 4, 6, 8])
+
+    def test_stream(self):
+        inputs = (InputTest(A=i, B="B") for i in range(5))
+        outputs = list(self._controller.stream(inputs, chunk_size=2))
+
+        self.assertEqual([output.D for output, _ in outputs], [0, 2, 4, 6, 8])
+
+    def test_concurrent_branches(self):
+        start = time.perf_counter()
+        self._controller.start()
+        wall = time.perf_counter() - start
+
+        # The two branches sleep at the same time
+        self.assertLess(wall, 2 * BRANCH_SLEEP)
+
+    def test_single_worker(self):
+        with DagController(InputTest(A=3, B="B"), InitStageTest, max_workers=1) as c:
+            start = time.perf_counter()
+            output, _ = c.start()
+            wall = time.perf_counter() - start
+
+        self.assertEqual(output.D, 6)
+        self.assertGreaterEqual(wall, 2 * BRANCH_SLEEP)
+
+    def test_wrong_next_stages(self):
+        controller = DagController(InputTest(A=3, B="B"), WrongFanOutStageTest)
+
+        with self.assertRaises(TypeError):
+            controller.start()
+
+    def test_memory_profiler(self):
+        profiler = MemoryProfiler()
+        controller = DagController(
+            InputTest(A=3, B="B"), InitStageTest, memory_profiler=profiler
+        )
+
+        with controller:
+            controller.start()
+
+        self.assertIsNotNone(profiler.stage(JoinStageTest))
+
+    def test_incremental(self):
+        cache = MemoryMemoCache()
+        inputs = [InputTest(A=i, B="B") for i in range(2)]
+        controller = DagController(
+            None, InitStageTest, memo_cache=cache, incremental=True
+        )
+
+        with controller:
+            controller.map(inputs)
+            self.assertEqual(len(cache._entries), 6 * len(inputs))
+
+            controller.map(inputs)
+            self.assertEqual(len(cache._entries), 6 * len(inputs))
+
+            # Only the changed branch, the join and the stages after it are new
+            DoubleStageTest.version = "changed"
+            self.addCleanup(delattr, DoubleStageTest, "version")
+            outputs = controller.map(inputs)
+
+        self.assertEqual(len(cache._entries), 9 * len(inputs))
+        self.assertEqual([output.D for output in outputs], [0, 2])
+
+    def test_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            DagController(None, InitStageTest, max_workers=0)
@@ -0,0 +1,278 @@
+# External imports
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from io import StringIO
+from multiprocessing.connection import AuthenticationError
+from typing import Tuple
+from unittest import mock
+
+# Local imports
+from ror.caches.common import stage_path
+from ror.controlers import DistributedController
+from ror.distributed import Coordinator, StageWorker, stage_worker
+from ror.distributed.stage_worker import _import_stage, _parse_address
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IForwardStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+AUTHKEY = b"ror-test"
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: object = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: object = field_persistance()
+    feature_pid: int = field_persistance(default=0)
+    model_pid: int = field_persistance(default=0)
+    terminal_pid: int = field_persistance(default=0)
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def get_output(self) -> OutputTest:
+        return self.input.carry_to(OutputTest, terminal_pid=os.getpid())
+
+
+class ModelStageTest(IForwardStage[OutputTest, OutputTest, TerminalStageTest]):
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), self.input.carry_to(
+            OutputTest, model_pid=os.getpid()
+        )
+
+
+class FeatureStageTest(IForwardStage[OutputTest, OutputTest, ModelStageTest]):
+    def compute(self) -> None:
+        if self.input.A == "fail":
+            raise ValueError("Failing input")
+
+        # Keeps the chunk in flight while the next one is routed
+        time.sleep(0.02)
+
+    def get_output(self) -> Tuple[ModelStageTest, OutputTest]:
+        output = self.input.carry_to(OutputTest, feature_pid=os.getpid())
+        return ModelStageTest(), output
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, FeatureStageTest]):
+    def get_output(self) -> Tuple[FeatureStageTest, OutputTest]:
+        return FeatureStageTest(), OutputTest(A=self.input.A)
+
+
+def load_in_controller() -> "Unloadable":
+    if multiprocessing.parent_process() is not None:
+        raise AttributeError("Unloadable can not be loaded by the workers")
+
+    return Unloadable()
+
+
+class Unloadable:
+    """Value which the worker processes fail to unpickle"""
+
+    def __reduce__(self) -> tuple:
+        return load_in_controller, ()
+
+
+def serve(stages: list, address: object, ready: multiprocessing.Queue) -> None:
+    """Runs a stage worker in a local process, sending back its address"""
+    worker = StageWorker(stages, address, authkey=AUTHKEY)
+    ready.put(worker.address)
+    worker.serve_forever()
+
+
+def start_workers(*workers: tuple) -> Tuple[list, list]:
+    """Starts local worker processes from (stages, address) pairs"""
+    ready = multiprocessing.Queue()
+    processes = []
+
+    for stages, address in workers:
+        process = multiprocessing.Process(
+            target=serve, args=(stages, address, ready), daemon=True
+        )
+        process.start()
+        processes.append(process)
+
+    # Workers listening on a free port report it
+    addresses = [ready.get(timeout=30) for _ in workers]
+
+    return processes, addresses
+
+
+"""============================== TEST CASES =============================="""
+
+
+class DistributedControllerTestCase(unittest.TestCase):
+    """Test case for computing stages on local worker processes"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._dir = tempfile.TemporaryDirectory()
+        cls._processes, addresses = start_workers(
+            ([FeatureStageTest], os.path.join(cls._dir.name, "feature-1.sock")),
+            ([FeatureStageTest], os.path.join(cls._dir.name, "feature-2.sock")),
+            ([ModelStageTest], ("127.0.0.1", 0)),
+        )
+        cls._coordinator = Coordinator(addresses, authkey=AUTHKEY)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._coordinator.close()
+        for process in cls._processes:
+            process.terminate()
+            process.join()
+        cls._dir.cleanup()
+
+    def test_start(self):
+        controller = DistributedController(
+            InputTest(A=1, B="B"), InitStageTest, self._coordinator
+        )
+        output, run_id = controller.start()
+
+        self.assertEqual(output.A, 1)
+        self.assertNotIn(output.feature_pid, (0, os.getpid()))
+        self.assertNotIn(output.model_pid, (0, os.getpid(), output.feature_pid))
+        self.assertEqual(output.terminal_pid, os.getpid())
+        self.assertIn("ModelStageTest", controller.get_artifacts(run_id))
+
+    def test_map(self):
+        controller = DistributedController(None, InitStageTest, self._coordinator)
+        outputs = controller.map(InputTest(A=i, B="B") for i in range(8))
+
+        self.assertEqual([output.A for output in outputs], list(range(8)))
+        self.assertEqual(len({output.feature_pid for output in outputs}), 2)
+        self.assertEqual(len({output.model_pid for output in outputs}), 1)
+
+    def test_workers(self):
+        workers = self._coordinator.workers()
+
+        self.assertEqual(workers[0].stages, (stage_path(FeatureStageTest),))
+        self.assertTrue(all(worker.alive for worker in workers))
+        self.assertTrue(self._coordinator.hosts(ModelStageTest))
+        self.assertFalse(self._coordinator.hosts(InitStageTest))
+
+    def test_least_loaded(self):
+        self._coordinator.connect()
+        busy, idle = self._coordinator._workers[:2]
+        path = stage_path(FeatureStageTest)
+
+        busy.in_flight += 100
+        try:
+            self.assertIs(self._coordinator._route(path, 1), idle)
+            idle.in_flight -= 1
+            idle.routed -= 1
+        finally:
+            busy.in_flight -= 100
+
+    def test_remote_error(self):
+        controller = DistributedController(None, InitStageTest, self._coordinator)
+
+        with self.assertRaises(ValueError):
+            controller.map([InputTest(A=1, B="B"), InputTest(A="fail", B="B")])
+
+    def test_unloadable_request(self):
+        controller = DistributedController(None, InitStageTest, self._coordinator)
+
+        with self.assertRaises(AttributeError):
+            controller.map([InputTest(A=Unloadable(), B="B")])
+
+        # The workers answered the request and are still used
+        self.assertTrue(all(worker.alive for worker in self._coordinator.workers()))
+        self.assertEqual(len(controller.map([InputTest(A=1, B="B")])), 1)
+
+    def test_authkey(self):
+        coordinator = Coordinator(self._coordinator.addresses[:1], authkey=b"wrong")
+
+        with self.assertRaises(AuthenticationError):
+            coordinator.connect()
+
+
+class WorkerFailureTestCase(unittest.TestCase):
+    """Test case for the chunks of a worker which went down"""
+
+    def test_worker_down(self):
+        with tempfile.TemporaryDirectory() as root:
+            processes, addresses = start_workers(
+                ([FeatureStageTest, ModelStageTest], os.path.join(root, "1.sock")),
+                ([FeatureStageTest, ModelStageTest], os.path.join(root, "2.sock")),
+            )
+
+            try:
+                with Coordinator(addresses, authkey=AUTHKEY) as coordinator:
+                    coordinator.connect()
+                    processes[0].terminate()
+                    processes[0].join()
+
+                    controller = DistributedController(None, InitStageTest, coordinator)
+                    outputs = controller.map(InputTest(A=i, B="B") for i in range(4))
+
+                    self.assertEqual([output.A for output in outputs], list(range(4)))
+                    self.assertEqual(
+                        {output.feature_pid for output in outputs}, {processes[1].pid}
+                    )
+                    self.assertFalse(coordinator.workers()[0].alive)
+            finally:
+                for process in processes:
+                    process.terminate()
+                    process.join()
+
+
+class StageWorkerTestCase(unittest.TestCase):
+    """Test case for the lifecycle of a stage worker"""
+
+    def test_close(self):
+        worker = StageWorker([FeatureStageTest], ("127.0.0.1", 0))
+        thread = threading.Thread(target=worker.serve_forever)
+        thread.start()
+
+        with Coordinator([worker.address]) as coordinator:
+            self.assertTrue(coordinator.hosts(FeatureStageTest))
+
+        worker.close()
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+
+    def test_command_line(self):
+        self.assertEqual(_parse_address("0.0.0.0:7100"), ("0.0.0.0", 7100))
+        self.assertEqual(_parse_address("/tmp/ror.sock"), "/tmp/ror.sock")
+        self.assertIs(_import_stage(stage_path(FeatureStageTest)), FeatureStageTest)
+
+    def test_authkey_required(self):
+        for address in [("0.0.0.0", 0), ("", 0), ("example.com", 0)]:
+            with self.assertRaises(ValueError):
+                StageWorker([FeatureStageTest], address)
+
+        worker = StageWorker([FeatureStageTest], ("0.0.0.0", 0), authkey=AUTHKEY)
+        worker.close()
+
+        with self.assertRaises(ValueError):
+            Coordinator([("10.0.0.1", 7100)])
+
+        Coordinator([("10.0.0.1", 7100)], authkey=AUTHKEY).close()
+
+        for address in [("localhost", 0), ("::1", 0)]:
+            self.assertTrue(stage_worker._is_local(address))
+
+    def test_generated_authkey(self):
+        argv = ["ror.distributed", "0.0.0.0:7100", stage_path(FeatureStageTest)]
+        stdout = StringIO()
+
+        with mock.patch.object(stage_worker, "StageWorker") as worker, mock.patch(
+            "sys.argv", argv
+        ), mock.patch.dict(os.environ, clear=True), redirect_stdout(stdout):
+            stage_worker.main()
+
+        authkey = worker.call_args.kwargs["authkey"]
+        self.assertEqual(len(authkey), 32)
+        self.assertIn(authkey.decode(), stdout.getvalue())
@@ -0,0 +1,266 @@
+# External imports
+import gc
+import unittest
+import weakref
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.caches import MemoryMemoCache
+from ror.controlers import BaseController, ThreadedController
+from ror.controlers.common import PipelinePlan
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IForwardStage, IInitStage, IMemoizedStage, ITerminalStage
+from ror.stores import NullArtifactStore
+
+"""=============================== TEST DATA =============================="""
+
+# Whether the blob was still alive when the terminal stage was computed
+ALIVE = []
+
+
+class Blob:
+    pass
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+    X: Blob = field_persistance(perish_stage="ForwardStageTest")
+
+
+@dataclass
+class ResultTest(BaseSchema):
+    A: int = field_persistance()
+
+
+@dataclass
+class UnknownStageTest(BaseSchema):
+    A: int = field_persistance(perish_stage="MissingStage")
+
+
+class TerminalStageTest(ITerminalStage[ResultTest, ResultTest]):
+    def compute(self) -> None:
+        gc.collect()
+        blob = BLOBS[self.input.A - 1]
+        ALIVE.append(self.input.X is not None or blob() is not None)
+        self._output = {"A": self.input.A}
+
+    def get_output(self) -> ResultTest:
+        return ResultTest(**self._output)
+
+
+class ForwardStageTest(IForwardStage[OutputTest, OutputTest, TerminalStageTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "A": self.input.A + 1}
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+# Weak references to the blobs keyed by the input of the init stage
+BLOBS = {}
+
+
+class InitStageTest(
+    IInitStage[InputTest, OutputTest, ForwardStageTest], IMemoizedStage
+):
+    def compute(self) -> None:
+        blob = Blob()
+        BLOBS[self.input.A] = weakref.ref(blob)
+        self._output = {"A": self.input.A, "X": blob}
+
+    def get_output(self) -> Tuple[ForwardStageTest, OutputTest]:
+        return ForwardStageTest(), OutputTest(**self._output)
+
+
+class BadInitStageTest(IInitStage[InputTest, UnknownStageTest, TerminalStageTest]):
+    pass
+
+
+@dataclass
+class PerishedTest(BaseSchema):
+    A: int = field_persistance()
+    X: int = field_persistance(perish_stage="CarryStageTest")
+
+
+@dataclass
+class CarriedTest(BaseSchema):
+    A: int = field_persistance()
+    X: int = field_persistance()
+
+
+class ReusedTerminalStageTest(ITerminalStage[CarriedTest, CarriedTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> CarriedTest:
+        return CarriedTest(**self._output)
+
+
+class RecomputeStageTest(
+    IForwardStage[CarriedTest, CarriedTest, ReusedTerminalStageTest]
+):
+    def compute(self) -> None:
+        # Computes a new value of the field which perished before this stage
+        self._output = {"A": self.input.A, "X": self.input.A * 10}
+
+    def get_output(self) -> Tuple[ReusedTerminalStageTest, CarriedTest]:
+        return ReusedTerminalStageTest(), CarriedTest(**self._output)
+
+
+class CarryStageTest(IForwardStage[PerishedTest, CarriedTest, RecomputeStageTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> Tuple[RecomputeStageTest, CarriedTest]:
+        return RecomputeStageTest(), CarriedTest(**self._output)
+
+
+class ReusedInitStageTest(IInitStage[InputTest, PerishedTest, CarryStageTest]):
+    def compute(self) -> None:
+        self._output = {"A": self.input.A, "X": -1}
+
+    def get_output(self) -> Tuple[CarryStageTest, PerishedTest]:
+        return CarryStageTest(), PerishedTest(**self._output)
+
+
+@dataclass
+class PerishAtTest(BaseSchema):
+    A: int = field_persistance()
+    X: int = field_persistance(perish_stage="IncrementStageTest")
+
+
+class IncrementStageTest(
+    IForwardStage[PerishAtTest, CarriedTest, ReusedTerminalStageTest]
+):
+    def compute(self) -> None:
+        # Reads the field at the stage it perishes at and outputs a new value of it
+        self._output = {"A": self.input.A, "X": self.input.X + 100}
+
+    def get_output(self) -> Tuple[ReusedTerminalStageTest, CarriedTest]:
+        return ReusedTerminalStageTest(), CarriedTest(**self._output)
+
+
+class IncrementInitStageTest(IInitStage[InputTest, PerishAtTest, IncrementStageTest]):
+    def compute(self) -> None:
+        self._output = {"A": self.input.A, "X": 1}
+
+    def get_output(self) -> Tuple[IncrementStageTest, PerishAtTest]:
+        return IncrementStageTest(), PerishAtTest(**self._output)
+
+
+"""============================== TEST CASES =============================="""
+
+
+class LivenessAnalysisTestCase(unittest.TestCase):
+    """Test case for the last stage reading each field"""
+
+    def setUp(self) -> None:
+        self._plan = PipelinePlan.compile(InitStageTest)
+
+    def test_last_reader(self):
+        self.assertIs(self._plan.last_reader("X").stage_class, ForwardStageTest)
+        self.assertIs(self._plan.last_reader("A").stage_class, TerminalStageTest)
+        self.assertIsNone(self._plan.last_reader("Y"))
+
+    def test_dead_fields(self):
+        self.assertEqual([step.dead_fields for step in self._plan], [(), ("X",), ()])
+
+    def test_reused_field_name(self):
+        plan = PipelinePlan.compile(ReusedInitStageTest)
+
+        # The perish stage of the first X does not apply to the recomputed X
+        self.assertEqual([step.dead_fields for step in plan], [(), (), (), ()])
+        self.assertIs(plan.last_reader("X").stage_class, ReusedTerminalStageTest)
+
+    def test_output_of_perish_stage(self):
+        plan = PipelinePlan.compile(IncrementInitStageTest)
+
+        # The X output by the stage the first X perishes at is a new value
+        self.assertEqual([step.dead_fields for step in plan], [(), (), ()])
+        self.assertIs(plan.last_reader("X").stage_class, ReusedTerminalStageTest)
+
+    def test_unknown_perish_stage(self):
+        with self.assertRaises(ValueError):
+            PipelinePlan.compile(BadInitStageTest)
+
+
+class EarlyReleaseTestCase(unittest.TestCase):
+    """Test case for the release of the dead fields at runtime"""
+
+    def setUp(self) -> None:
+        ALIVE.clear()
+        BLOBS.clear()
+
+    def test_released(self):
+        controller = BaseController(
+            InputTest(A=1), InitStageTest, artifact_store=NullArtifactStore()
+        )
+        output, _ = controller.start()
+
+        self.assertEqual(ALIVE, [False])
+        self.assertEqual(output, ResultTest(A=2))
+
+    def test_kept_with_artifacts(self):
+        output, _ = BaseController(InputTest(A=1), InitStageTest).start()
+
+        self.assertEqual(ALIVE, [True])
+        self.assertEqual(output, ResultTest(A=2))
+
+    def test_batch_and_threaded(self):
+        inputs = [InputTest(A=i) for i in range(3)]
+        store = NullArtifactStore()
+
+        BaseController(None, InitStageTest, artifact_store=store).map(inputs)
+        ThreadedController(None, InitStageTest, artifact_store=store).map(inputs)
+
+        self.assertEqual(ALIVE, [False] * 6)
+
+    def test_reused_field_name(self):
+        controller = BaseController(
+            InputTest(A=2), ReusedInitStageTest, artifact_store=NullArtifactStore()
+        )
+        output, _ = controller.start()
+
+        self.assertEqual(output.X, 20)
+
+    def test_output_of_perish_stage(self):
+        controller = BaseController(
+            InputTest(A=1), IncrementInitStageTest, artifact_store=NullArtifactStore()
+        )
+        output, _ = controller.start()
+
+        self.assertEqual(output, CarriedTest(A=1, X=101))
+        self.assertEqual(
+            output, BaseController(InputTest(A=1), IncrementInitStageTest).start()[0]
+        )
+
+    def test_stage_cleared(self):
+        stage = InitStageTest()
+        stage.set_input(InputTest(A=1))
+        stage.compute()
+        stage.clear()
+
+        self.assertFalse(hasattr(stage, "input"))
+        self.assertFalse(hasattr(stage, "_output"))
+
+    def test_memoized_output_untouched(self):
+        cache = MemoryMemoCache()
+        controller = BaseController(
+            InputTest(A=1),
+            InitStageTest,
+            artifact_store=NullArtifactStore(),
+            memo_cache=cache,
+        )
+        controller.start()
+        controller.start()
+
+        (entry,) = cache._entries.values()
+        self.assertIsInstance(entry.output.X, Blob)
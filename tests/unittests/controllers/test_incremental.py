@@ -0,0 +1,170 @@
+# External imports
+import asyncio
+import tempfile
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.caches import DiskMemoCache, MemoryMemoCache
+from ror.controlers import (
+    AsyncController,
+    BaseController,
+    DagController,
+    ThreadedController,
+)
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IForwardStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+COMPUTED = []
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(A=self.input.A + 1)
+
+
+class ForwardStageTest(IForwardStage[OutputTest, OutputTest, TerminalStageTest]):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(A=self.input.A * 10)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, ForwardStageTest]):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+
+    def get_output(self) -> Tuple[ForwardStageTest, OutputTest]:
+        return ForwardStageTest(), OutputTest(**self.input.get_carry())
+
+
+def change_version(test: unittest.TestCase, stage_class: type) -> None:
+    """Changes the version of a stage class as an edit of its code would"""
+    stage_class.version = "changed"
+    test.addCleanup(delattr, stage_class, "version")
+
+
+"""============================== TEST CASES =============================="""
+
+
+class IncrementalTestCase(unittest.TestCase):
+    """Test case for rerunning only the stages downstream of a changed stage"""
+
+    def setUp(self) -> None:
+        COMPUTED.clear()
+        self._cache = MemoryMemoCache()
+        self._controller = BaseController(
+            InputTest(A=2, B="B"),
+            InitStageTest,
+            memo_cache=self._cache,
+            incremental=True,
+        )
+
+    def test_unchanged(self):
+        first, _ = self._controller.start()
+        COMPUTED.clear()
+        second, _ = self._controller.start()
+
+        self.assertEqual(first, second)
+        self.assertEqual(COMPUTED, [])
+
+    def test_changed_stage(self):
+        self._controller.start()
+        COMPUTED.clear()
+        change_version(self, ForwardStageTest)
+        output, _ = self._controller.start()
+
+        self.assertEqual(output, OutputTest(A=21))
+        self.assertEqual(COMPUTED, [ForwardStageTest, TerminalStageTest])
+
+    def test_changed_terminal_stage(self):
+        self._controller.start()
+        COMPUTED.clear()
+        change_version(self, TerminalStageTest)
+        self._controller.start()
+
+        self.assertEqual(COMPUTED, [TerminalStageTest])
+
+    def test_changed_input(self):
+        self._controller.start()
+        COMPUTED.clear()
+        self._controller.init_data = InputTest(A=3, B="B")
+        output, _ = self._controller.start()
+
+        self.assertEqual(output, OutputTest(A=31))
+        self.assertEqual(len(COMPUTED), 3)
+
+    def test_batch(self):
+        inputs = [InputTest(A=i, B="B") for i in range(3)]
+        self._controller.map(inputs)
+        COMPUTED.clear()
+        change_version(self, ForwardStageTest)
+        outputs = self._controller.map(inputs + [InputTest(A=3, B="B")])
+
+        self.assertEqual([output.A for output in outputs], [1, 11, 21, 31])
+        self.assertEqual(COMPUTED.count(InitStageTest), 1)
+        self.assertEqual(COMPUTED.count(ForwardStageTest), 4)
+
+    def test_threaded(self):
+        controller = ThreadedController(
+            None, InitStageTest, memo_cache=self._cache, incremental=True
+        )
+        controller.map([InputTest(A=1, B="B")])
+        COMPUTED.clear()
+        controller.map([InputTest(A=1, B="B")])
+
+        self.assertEqual(COMPUTED, [])
+
+    def test_lineage_across_controllers(self):
+        inputs = [InputTest(A=i, B="B") for i in range(3)]
+        expected = self._controller.map(inputs)
+
+        # Every controller keys the results of the stages by the same lineage
+        for controller_class in [ThreadedController, DagController, AsyncController]:
+            COMPUTED.clear()
+            controller = controller_class(
+                None, InitStageTest, memo_cache=self._cache, incremental=True
+            )
+            outputs = controller.map(inputs)
+            if controller_class is AsyncController:
+                outputs = asyncio.run(outputs)
+
+            self.assertEqual(outputs, expected)
+            self.assertEqual(COMPUTED, [], controller_class.__name__)
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as root:
+            for _ in range(2):
+                COMPUTED.clear()
+                controller = BaseController(
+                    InputTest(A=2, B="B"),
+                    InitStageTest,
+                    memo_cache=DiskMemoCache(root),
+                    incremental=True,
+                )
+                controller.start()
+
+        self.assertEqual(COMPUTED, [])
+
+    def test_no_memo_cache(self):
+        with self.assertRaises(ValueError):
+            BaseController(None, InitStageTest, incremental=True)
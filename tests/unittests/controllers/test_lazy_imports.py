@@ -0,0 +1,46 @@
+# External imports
+import subprocess
+import sys
+import unittest
+
+"""=============================== TEST DATA =============================="""
+
+# Modules which importing the controllers should not import
+LAZY_MODULES = ("rich", "asyncio", "concurrent.futures", "multiprocessing")
+
+
+def imported_modules(statement: str) -> list:
+    """Returns the lazy modules imported by a statement in a fresh interpreter."""
+    check = (
+        f"{statement}; import sys; "
+        f"print(*[m for m in {LAZY_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+
+    return result.stdout.split()
+
+
+"""============================== TEST CASES =============================="""
+
+
+class LazyImportsTestCase(unittest.TestCase):
+    """Test case for the heavy dependencies only imported when used"""
+
+    def test_import_controllers(self):
+        self.assertEqual(imported_modules("import ror.controlers"), [])
+
+    def test_import_ror(self):
+        statement = "import ror.schemas, ror.stages, ror.stores, ror.caches"
+        self.assertEqual(imported_modules(statement), [])
+
+    def test_async_controller_on_use(self):
+        statement = "from ror.controlers import AsyncController"
+        self.assertIn("asyncio", imported_modules(statement))
+
+    def test_unknown_attribute(self):
+        import ror.controlers
+
+        with self.assertRaises(AttributeError):
+            ror.controlers.MissingController
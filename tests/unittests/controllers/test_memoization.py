@@ -0,0 +1,148 @@
+# External imports
+import asyncio
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.caches import MemoryMemoCache
+from ror.controlers import AsyncController, BaseController
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IAsyncTerminalStage, IInitStage, IMemoizedStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+COMPUTED = []
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest], IMemoizedStage):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(**self._output)
+
+
+class InitStageTest(
+    IInitStage[InputTest, OutputTest, TerminalStageTest], IMemoizedStage
+):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+        self._output = {"A": self.input.A * 2}
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+class AsyncTerminalStageTest(
+    IAsyncTerminalStage[OutputTest, OutputTest], IMemoizedStage
+):
+    async def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(**self._output)
+
+
+class AsyncInitStageTest(
+    IInitStage[InputTest, OutputTest, AsyncTerminalStageTest], IMemoizedStage
+):
+    def compute(self) -> None:
+        COMPUTED.append(self.__class__)
+        self._output = {"A": self.input.A * 2}
+
+    def get_output(self) -> Tuple[AsyncTerminalStageTest, OutputTest]:
+        return AsyncTerminalStageTest(), OutputTest(**self._output)
+
+
+"""=============================== TEST CASES =============================="""
+
+
+class MemoizationTestCase(unittest.TestCase):
+    """Test case for the memoization of stage results"""
+
+    def setUp(self) -> None:
+        COMPUTED.clear()
+        self._cache = MemoryMemoCache()
+
+    def _run(self, data: InputTest) -> OutputTest:
+        controller = BaseController(data, InitStageTest, memo_cache=self._cache)
+        output, _ = controller.start()
+        return output
+
+    def test_cache_hit(self):
+        first = self._run(InputTest(A=1, B="B"))
+        second = self._run(InputTest(A=1, B="B"))
+
+        self.assertEqual(first, second)
+        self.assertEqual(COMPUTED, [InitStageTest, TerminalStageTest])
+
+    def test_cache_miss(self):
+        self._run(InputTest(A=1, B="B"))
+        output = self._run(InputTest(A=2, B="B"))
+
+        self.assertEqual(output.A, 4)
+        self.assertEqual(len(COMPUTED), 4)
+
+    def test_downstream_hit(self):
+        # Only B changes, the terminal input is the same
+        self._run(InputTest(A=1, B="B"))
+        self._run(InputTest(A=1, B="C"))
+
+        self.assertEqual(COMPUTED, [InitStageTest, TerminalStageTest, InitStageTest])
+
+    def test_invalidate(self):
+        self._run(InputTest(A=1, B="B"))
+        self._cache.invalidate(TerminalStageTest)
+        self._run(InputTest(A=1, B="B"))
+
+        self.assertEqual(
+            COMPUTED, [InitStageTest, TerminalStageTest, TerminalStageTest]
+        )
+
+    def test_version(self):
+        self._run(InputTest(A=1, B="B"))
+        TerminalStageTest.version = "2"
+        try:
+            self._run(InputTest(A=1, B="B"))
+        finally:
+            del TerminalStageTest.version
+
+        self.assertEqual(
+            COMPUTED, [InitStageTest, TerminalStageTest, TerminalStageTest]
+        )
+
+    def test_batch(self):
+        inputs = [InputTest(A=1, B="B"), InputTest(A=1, B="B")]
+        controller = BaseController(inputs[0], InitStageTest, memo_cache=self._cache)
+        controller.start()
+        outputs = controller.start_batch(inputs)
+
+        self.assertEqual([output.A for output, _ in outputs], [2, 2])
+        self.assertEqual(COMPUTED, [InitStageTest, TerminalStageTest])
+
+    def test_async(self):
+        async def run():
+            controller = AsyncController(
+                InputTest(A=1, B="B"), AsyncInitStageTest, memo_cache=self._cache
+            )
+            return [await controller.start(), await controller.start()]
+
+        outputs = asyncio.run(run())
+
+        self.assertEqual([output.A for output, _ in outputs], [2, 2])
+        self.assertEqual(COMPUTED, [AsyncInitStageTest, AsyncTerminalStageTest])
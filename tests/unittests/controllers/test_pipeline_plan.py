@@ -0,0 +1,139 @@
+# External imports
+import unittest
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Tuple
+
+# Local imports
+from ror.controlers.common import BaseController, PipelinePlan
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IForwardStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: str = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: str = field_perishable()
+    C: str = field_persistance()
+
+
+@dataclass
+class TerminalOutputTest(BaseSchema):
+    C: str = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, TerminalOutputTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> TerminalOutputTest:
+        return TerminalOutputTest(**self._output)
+
+
+class ForwardStageTest(IForwardStage[OutputTest, OutputTest, "TerminalStageTest"]):
+    def compute(self) -> None:
+        self._output = self.input.__dict__
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, ForwardStageTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "C": "C"}
+
+    def get_output(self) -> Tuple[ForwardStageTest, OutputTest]:
+        return ForwardStageTest(), OutputTest(**self._output)
+
+
+class UndeclaredStageTest(IInitStage[InputTest, OutputTest, ForwardStageTest]):
+    def get_output(self) -> Tuple[InitStageTest, OutputTest]:
+        return InitStageTest(), OutputTest(A="A", C="C")
+
+
+class CyclicStageTest(IForwardStage[OutputTest, OutputTest, "CyclicStageTest"]):
+    pass
+
+
+"""============================== TEST CASES =============================="""
+
+
+class PipelinePlanTestCase(unittest.TestCase):
+    """Test case for the compilation of the stage chain"""
+
+    def setUp(self) -> None:
+        self._plan = PipelinePlan.compile(InitStageTest)
+
+    def test_steps(self):
+        self.assertEqual(
+            [step.stage_class for step in self._plan],
+            [InitStageTest, ForwardStageTest, TerminalStageTest],
+        )
+        self.assertEqual([step.terminal for step in self._plan], [False, False, True])
+        self.assertEqual(self._plan.init_stage, InitStageTest)
+
+    def test_schemas(self):
+        step = self._plan.step(TerminalStageTest)
+
+        self.assertIs(step.input_schema, OutputTest)
+        self.assertIs(step.output_schema, TerminalOutputTest)
+        self.assertIsNone(step.next_stage)
+
+    def test_forward_reference(self):
+        self.assertIs(self._plan.step(ForwardStageTest).next_stage, TerminalStageTest)
+
+    def test_field_mappings(self):
+        step = self._plan.step(InitStageTest)
+
+        self.assertEqual(step.artifact_fields, ("B",))
+        self.assertEqual(step.carried_fields, ("A",))
+        self.assertEqual(step.computed_fields, ("C",))
+
+    def test_immutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            self._plan.steps = ()
+
+        with self.assertRaises(FrozenInstanceError):
+            self._plan.steps[0].name = "Other"
+
+    def test_unknown_stage(self):
+        self.assertNotIn(UndeclaredStageTest, self._plan)
+
+        with self.assertRaises(TypeError):
+            self._plan.step(UndeclaredStageTest)
+
+    def test_cycle(self):
+        with self.assertRaises(ValueError):
+            PipelinePlan.compile(CyclicStageTest)
+
+    def test_str(self):
+        text = str(self._plan)
+
+        self.assertIn(
+            "0: InitStageTest [InputTest -> OutputTest] -> ForwardStageTest", text
+        )
+        self.assertIn("carried:  A", text)
+
+
+class ControllerPlanTestCase(unittest.TestCase):
+    """Test case for the plan compiled by the controller"""
+
+    def test_compiled_once(self):
+        controller = BaseController(InputTest(A="A", B="B"), InitStageTest)
+        plan = controller.compile()
+        controller.start()
+
+        self.assertIs(controller.compile(), plan)
+
+    def test_undeclared_stage(self):
+        controller = BaseController(InputTest(A="A", B="B"), UndeclaredStageTest)
+
+        with self.assertRaises(TypeError):
+            controller.start()
@@ -0,0 +1,144 @@
+# External imports
+import os
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.controlers import ThreadedController
+from ror.controlers.common import BaseController, ProcessStagePool
+from ror.controlers.common.process_stage_pool import _WORKER_STAGES, _compute_in_worker
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IForwardStage, IInitStage, IProcessStage, ITerminalStage
+from ror.utils import shm_pickle
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+"""=============================== TEST DATA =============================="""
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: object = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: object = field_persistance()
+    pid: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(**self._output)
+
+
+class ProcessStageTest(
+    IForwardStage[OutputTest, OutputTest, TerminalStageTest], IProcessStage
+):
+    def compute(self) -> None:
+        if isinstance(self.input.A, str) and self.input.A == "fail":
+            raise ValueError("Failing input")
+
+        self._output = {"A": self.input.A * 2, "pid": os.getpid()}
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, ProcessStageTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "pid": os.getpid()}
+
+    def get_output(self) -> Tuple[ProcessStageTest, OutputTest]:
+        return ProcessStageTest(), OutputTest(**self._output)
+
+
+"""============================== TEST CASES =============================="""
+
+
+class ProcessPoolTestCase(unittest.TestCase):
+    """Test that process stages are computed in the worker processes"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._pool = ProcessStagePool(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._pool.shutdown()
+
+    def test_start(self):
+        controller = BaseController(
+            InputTest(A=1, B="B"), InitStageTest, process_pool=self._pool
+        )
+        output, run_id = controller.start()
+
+        self.assertEqual(output.A, 2)
+        self.assertNotEqual(output.pid, os.getpid())
+        self.assertIn("ProcessStageTest", controller.get_artifacts(run_id))
+
+    def test_map(self):
+        controller = BaseController(None, InitStageTest, process_pool=self._pool)
+        outputs = controller.map(InputTest(A=i, B="B") for i in range(8))
+
+        self.assertListEqual([output.A for output in outputs], list(range(0, 16, 2)))
+        self.assertNotIn(os.getpid(), [output.pid for output in outputs])
+
+    def test_threaded(self):
+        controller = ThreadedController(None, InitStageTest, process_pool=self._pool)
+        outputs = controller.map(InputTest(A=i, B="B") for i in range(8))
+
+        self.assertListEqual([output.A for output in outputs], list(range(0, 16, 2)))
+
+    def test_failure(self):
+        controller = BaseController(None, InitStageTest, process_pool=self._pool)
+
+        with self.assertRaises(ValueError):
+            controller.map([InputTest(A=1, B="B"), InputTest(A="fail", B="B")])
+
+    def test_worker_stage_cleared(self):
+        self.addCleanup(_WORKER_STAGES.pop, ProcessStageTest, None)
+
+        for A in [1, "fail"]:
+            payload, _ = shm_pickle.dumps([OutputTest(A=A, pid=0)])
+            try:
+                _compute_in_worker(
+                    ProcessStageTest, payload, shm_pickle.DEFAULT_THRESHOLD
+                )
+            except ValueError:
+                pass
+
+            # The chunk is not kept by the stage instance of the worker
+            stage = _WORKER_STAGES[ProcessStageTest]
+            self.assertFalse(hasattr(stage, "input"))
+            self.assertFalse(hasattr(stage, "_output"))
+
+    def test_without_pool(self):
+        controller = BaseController(InputTest(A=1, B="B"), InitStageTest)
+        output, _ = controller.start()
+
+        self.assertEqual(output.pid, os.getpid())
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class ProcessPoolArrayTestCase(unittest.TestCase):
+    """Test that large arrays are handed over to the workers"""
+
+    def test_arrays(self):
+        inputs = [InputTest(A=numpy.full(100_000, i), B="B") for i in range(4)]
+
+        with ProcessStagePool(max_workers=2, threshold=1024) as pool:
+            controller = BaseController(None, InitStageTest, process_pool=pool)
+            outputs = controller.map(inputs)
+
+        for i, output in enumerate(outputs):
+            numpy.testing.assert_array_equal(output.A, numpy.full(100_000, 2 * i))
@@ -0,0 +1,157 @@
+# External imports
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.controlers import BaseController, ThreadedController
+from ror.controlers.common import StagePool
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_persistance
+from ror.stages import IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+EVENTS = []
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def setup(self) -> None:
+        EVENTS.append(("setup", self.__class__))
+
+    def teardown(self) -> None:
+        EVENTS.append(("teardown", self.__class__))
+
+    def compute(self) -> None:
+        if self.input.A < 0:
+            raise ValueError("Negative input")
+
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(**self._output)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, TerminalStageTest]):
+    reusable = True
+
+    def setup(self) -> None:
+        EVENTS.append(("setup", self.__class__))
+
+    def teardown(self) -> None:
+        EVENTS.append(("teardown", self.__class__))
+
+    def compute(self) -> None:
+        self._output = {"A": self.input.A * 2}
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+def count(event: str, stage_class: type) -> int:
+    return EVENTS.count((event, stage_class))
+
+
+"""============================== TEST CASES =============================="""
+
+
+class StagePoolTestCase(unittest.TestCase):
+    """Test case for the pool of warm stage instances"""
+
+    def setUp(self) -> None:
+        EVENTS.clear()
+        self._pool = StagePool()
+
+    def test_reusable(self):
+        stage = self._pool.acquire(InitStageTest)
+        self._pool.release(stage)
+
+        self.assertIs(self._pool.acquire(InitStageTest()), stage)
+        self.assertIn(InitStageTest, self._pool)
+        self.assertEqual(EVENTS, [("setup", InitStageTest)])
+
+        self._pool.close()
+        self.assertEqual(len(self._pool), 0)
+        self.assertEqual(count("teardown", InitStageTest), 1)
+
+    def test_concurrent_runs(self):
+        first = self._pool.acquire(InitStageTest)
+        second = self._pool.acquire(InitStageTest)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(count("setup", InitStageTest), 2)
+
+        self._pool.release(first)
+        self.assertIs(self._pool.acquire(InitStageTest), first)
+        self.assertEqual(len(self._pool), 2)
+
+    def test_fresh(self):
+        stage = TerminalStageTest()
+
+        self.assertIs(self._pool.acquire(stage), stage)
+        self._pool.release(stage)
+
+        self.assertNotIn(TerminalStageTest, self._pool)
+        self.assertEqual(
+            EVENTS, [("setup", TerminalStageTest), ("teardown", TerminalStageTest)]
+        )
+
+
+class ControllerLifecycleTestCase(unittest.TestCase):
+    """Test case for the lifecycle of the stages of a controller"""
+
+    def setUp(self) -> None:
+        EVENTS.clear()
+
+    def test_warm_across_runs(self):
+        with BaseController(InputTest(A=1), InitStageTest) as controller:
+            outputs = [controller.start()[0].A for _ in range(3)]
+
+            self.assertEqual(outputs, [2, 2, 2])
+            self.assertEqual(count("setup", InitStageTest), 1)
+            self.assertEqual(count("teardown", InitStageTest), 0)
+            self.assertEqual(count("setup", TerminalStageTest), 3)
+            self.assertEqual(count("teardown", TerminalStageTest), 3)
+
+        self.assertEqual(count("teardown", InitStageTest), 1)
+
+    def test_warmup(self):
+        controller = BaseController(InputTest(A=1), InitStageTest)
+        controller.warmup()
+
+        self.assertEqual(EVENTS, [("setup", InitStageTest)])
+
+    def test_teardown_on_failure(self):
+        controller = BaseController(InputTest(A=-1), InitStageTest)
+
+        with self.assertRaises(ValueError):
+            controller.start()
+
+        self.assertEqual(count("teardown", TerminalStageTest), 1)
+
+    def test_batch(self):
+        controller = BaseController(None, InitStageTest)
+        controller.map([InputTest(A=i) for i in range(4)])
+
+        self.assertEqual(count("setup", TerminalStageTest), 1)
+        self.assertEqual(count("teardown", TerminalStageTest), 1)
+
+    def test_threaded(self):
+        controller = ThreadedController(None, InitStageTest)
+        outputs = controller.map([InputTest(A=i) for i in range(4)])
+        controller.map([InputTest(A=i) for i in range(4)])
+
+        self.assertEqual([output.A for output in outputs], [0, 2, 4, 6])
+        self.assertEqual(count("setup", InitStageTest), 1)
+        self.assertEqual(count("setup", TerminalStageTest), 2)
+        self.assertEqual(count("teardown", TerminalStageTest), 2)
@@ -0,0 +1,133 @@
+# External imports
+import itertools
+import unittest
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Local imports
+from ror.controlers.common import BaseController
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IBatchStage, IInitStage, ITerminalStage
+from ror.stores import MemoryArtifactStore
+
+"""=============================== TEST DATA =============================="""
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_perishable()
+    C: int = field_persistance()
+
+
+@dataclass
+class TerminalOutputTest(BaseSchema):
+    C: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, TerminalOutputTest], IBatchStage):
+    batch_sizes = []
+
+    def compute_batch(self) -> None:
+        self.batch_sizes.append(len(self.inputs))
+
+    def get_batch_output(self) -> List[TerminalOutputTest]:
+        return [TerminalOutputTest(**input.get_carry()) for input in self.inputs]
+
+
+class StatefulInitStageTest(IInitStage[InputTest, OutputTest, TerminalStageTest]):
+    instances = 0
+
+    def __init__(self):
+        # Stands in for some expensive setup such as loading a model
+        StatefulInitStageTest.instances += 1
+        self._seen = 0
+
+    def compute(self) -> None:
+        self._seen += 1
+        self._output = {"A": self.input.A, "C": self._seen}
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+"""============================== TEST CASES =============================="""
+
+
+class StreamTestCase(unittest.TestCase):
+    """Test that the stream lazily yields the terminal outputs"""
+
+    def setUp(self) -> None:
+        StatefulInitStageTest.instances = 0
+        TerminalStageTest.batch_sizes = []
+        self._controller = BaseController(None, StatefulInitStageTest)
+
+    def test_outputs(self):
+        inputs = (InputTest(A=i) for i in range(4))
+        outputs = [output for output, _ in self._controller.stream(inputs)]
+
+        self.assertListEqual([output.C for output in outputs], [1, 2, 3, 4])
+
+    def test_stage_state_reused(self):
+        list(self._controller.stream(InputTest(A=i) for i in range(4)))
+
+        self.assertEqual(StatefulInitStageTest.instances, 1)
+
+    def test_lazy_pull(self):
+        pulled = []
+
+        def inputs():
+            for i in itertools.count():
+                pulled.append(i)
+                yield InputTest(A=i)
+
+        stream = self._controller.stream(inputs(), chunk_size=2)
+        first = list(itertools.islice(stream, 3))
+
+        self.assertEqual(len(first), 3)
+        self.assertListEqual(pulled, [0, 1, 2, 3])
+
+    def test_chunks(self):
+        inputs = (InputTest(A=i) for i in range(5))
+        list(self._controller.stream(inputs, chunk_size=2))
+
+        self.assertListEqual(TerminalStageTest.batch_sizes, [2, 2, 1])
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            next(self._controller.stream([], chunk_size=0))
+
+
+class StreamArtifactsTestCase(unittest.TestCase):
+    """Test that the stream only captures artifacts when asked to"""
+
+    def setUp(self) -> None:
+        self._store = MemoryArtifactStore()
+        self._controller = BaseController(
+            None, StatefulInitStageTest, artifact_store=self._store
+        )
+
+    def test_no_capture(self):
+        list(self._controller.stream(InputTest(A=i) for i in range(3)))
+
+        self.assertEqual(len(self._store), 0)
+
+    def test_capture(self):
+        results = list(
+            self._controller.stream(
+                (InputTest(A=i) for i in range(3)), capture_artifacts=True
+            )
+        )
+
+        self.assertEqual(len(self._store), 3)
+
+        artifacts = self._controller.get_artifacts(results[1][1])
+        self.assertEqual(
+            artifacts["TerminalStageTest"].source_schema, TerminalOutputTest
+        )
+        self.assertEqual(artifacts["StatefulInitStageTest"].source_schema, InputTest)
@@ -0,0 +1,136 @@
+# External imports
+import itertools
+import threading
+import time
+import unittest
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Local imports
+from ror.controlers import ThreadedController
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IBatchStage, IForwardStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+class ActivityTracker:
+    """Tracks the maximum number of stages computing at the same time"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def __enter__(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def __exit__(self, *args):
+        with self._lock:
+            self.active -= 1
+
+
+TRACKER = ActivityTracker()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest], IBatchStage):
+    def compute_batch(self) -> None:
+        with TRACKER:
+            time.sleep(0.01)
+
+    def get_batch_output(self) -> List[OutputTest]:
+        return [OutputTest(**input.get_carry()) for input in self.inputs]
+
+
+class ForwardStageTest(IForwardStage[OutputTest, OutputTest, TerminalStageTest]):
+    def compute(self) -> None:
+        with TRACKER:
+            time.sleep(0.01)
+        if self.input.A < 0:
+            raise ValueError("Negative input")
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(A=self.input.A * 2)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, ForwardStageTest]):
+    def compute(self) -> None:
+        with TRACKER:
+            time.sleep(0.01)
+
+    def get_output(self) -> Tuple[ForwardStageTest, OutputTest]:
+        return ForwardStageTest(), OutputTest(**self.input.get_carry())
+
+
+"""============================== TEST CASES =============================="""
+
+
+class ThreadedStreamTestCase(unittest.TestCase):
+    """Test that the stages are pipelined across worker threads"""
+
+    def setUp(self) -> None:
+        TRACKER.max_active = 0
+        self._controller = ThreadedController(None, InitStageTest, queue_size=2)
+
+    def test_ordered_outputs(self):
+        outputs = self._controller.map(InputTest(A=i, B="B") for i in range(10))
+
+        self.assertListEqual([output.A for output in outputs], list(range(0, 20, 2)))
+
+    def test_unordered_outputs(self):
+        results = self._controller.stream(
+            (InputTest(A=i, B="B") for i in range(10)), ordered=False
+        )
+
+        self.assertListEqual(
+            sorted(output.A for output, _ in results), list(range(0, 20, 2))
+        )
+
+    def test_stages_overlap(self):
+        self._controller.map(InputTest(A=i, B="B") for i in range(10))
+
+        self.assertGreater(TRACKER.max_active, 1)
+
+    def test_artifacts(self):
+        results = self._controller.start_batch([InputTest(A=1, B="B")])
+        artifacts = self._controller.get_artifacts(results[0][1])
+
+        self.assertEqual(artifacts["InitStageTest"].B, "B")
+        self.assertIn("TerminalStageTest", artifacts)
+
+    def test_unbounded_input(self):
+        inputs = (InputTest(A=i, B="B") for i in itertools.count())
+        stream = self._controller.stream(inputs)
+
+        self.assertEqual(len(list(itertools.islice(stream, 5))), 5)
+        stream.close()
+
+        self.assertFalse(any(w.is_alive() for w in self._controller._workers.values()))
+
+
+class ThreadedFailureTestCase(unittest.TestCase):
+    """Test that an exception in a stage is raised to the caller"""
+
+    def test_failure(self):
+        controller = ThreadedController(None, InitStageTest)
+        inputs = [InputTest(A=i, B="B") for i in (1, -1, 2)]
+
+        with self.assertRaises(ValueError):
+            controller.map(inputs)
+
+        self.assertFalse(any(w.is_alive() for w in controller._workers.values()))
+        self.assertEqual(controller.map([InputTest(A=1, B="B")])[0].A, 2)
@@ -0,0 +1,54 @@
+# External imports
+import random
+import unittest
+
+# Local imports
+from ror.profilers.common import LogHistogram
+
+
+class LogHistogramTestCase(unittest.TestCase):
+    """Test case for the log-linear histogram"""
+
+    def setUp(self) -> None:
+        self._histogram = LogHistogram()
+
+    def test_empty(self):
+        self.assertEqual(self._histogram.count, 0)
+        self.assertEqual(self._histogram.quantile(0.5), 0.0)
+
+    def test_small_values(self):
+        for value in range(8):
+            self._histogram.add(value)
+
+        self.assertEqual(self._histogram.quantile(0), 0)
+        self.assertEqual(self._histogram.quantile(1), 7)
+
+    def test_relative_error(self):
+        values = [random.randint(1_000, 10_000_000) for _ in range(10_000)]
+        for value in values:
+            self._histogram.add(value)
+
+        values.sort()
+        for q in (0.5, 0.95, 0.99):
+            exact = values[round(q * len(values)) - 1]
+            self.assertAlmostEqual(self._histogram.quantile(q) / exact, 1, delta=0.125)
+
+        self.assertEqual(self._histogram.min, values[0])
+        self.assertEqual(self._histogram.max, values[-1])
+
+    def test_invalid_quantile(self):
+        with self.assertRaises(ValueError):
+            self._histogram.quantile(1.5)
+
+    def test_merge(self):
+        other = LogHistogram()
+        for value in (10, 20):
+            self._histogram.add(value)
+        for value in (5, 1_000):
+            other.add(value)
+
+        self._histogram.merge(other)
+
+        self.assertEqual(self._histogram.count, 4)
+        self.assertEqual(self._histogram.min, 5)
+        self.assertEqual(self._histogram.max, 1_000)
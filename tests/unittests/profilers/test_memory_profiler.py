@@ -0,0 +1,130 @@
+# External imports
+import tracemalloc
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+from unittest import mock
+
+# Local imports
+from ror.controlers import BaseController
+from ror.profilers import MemoryProfiler
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IForwardStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+LARGE = 64 * 1024
+
+
+@dataclass
+class InputTest(BaseSchema):
+    X: bytes = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    X: bytes = field_persistance()
+    Y: list = field_perishable()
+
+
+@dataclass
+class TerminalOutputTest(BaseSchema):
+    X: bytes = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, TerminalOutputTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> TerminalOutputTest:
+        return TerminalOutputTest(**self._output)
+
+
+class ForwardStageTest(IForwardStage[OutputTest, OutputTest, TerminalStageTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "Y": list(range(1000))}
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, ForwardStageTest]):
+    def compute(self) -> None:
+        self._output = {**self.input.get_carry(), "Y": []}
+
+    def get_output(self) -> Tuple[ForwardStageTest, OutputTest]:
+        return ForwardStageTest(), OutputTest(**self._output)
+
+
+"""============================== TEST CASES =============================="""
+
+
+class MemoryProfilerTestCase(unittest.TestCase):
+    """Test case for the memory attributed to the stages and fields"""
+
+    def setUp(self) -> None:
+        self._profiler = MemoryProfiler(large_field=LARGE, min_stages=3)
+        self._controller = BaseController(
+            InputTest(X=bytes(LARGE), B="B"),
+            InitStageTest,
+            memory_profiler=self._profiler,
+        )
+        self._controller.start()
+
+    def tearDown(self) -> None:
+        self._controller.close()
+
+    def test_stages(self):
+        stages = [memory.stage for memory in self._profiler.stages()]
+
+        self.assertEqual(stages, [InitStageTest, ForwardStageTest, TerminalStageTest])
+        self.assertEqual(self._profiler.stage(ForwardStageTest).records, 1)
+        self.assertGreater(self._profiler.stage(ForwardStageTest).peak, 0)
+
+    def test_peak_without_reset_peak(self):
+        # Python 3.8 has no `tracemalloc.reset_peak`
+        profiler = MemoryProfiler()
+        controller = BaseController(
+            InputTest(X=bytes(LARGE), B="B"), InitStageTest, memory_profiler=profiler
+        )
+
+        with mock.patch.object(tracemalloc, "reset_peak", None):
+            controller.start()
+        controller.close()
+
+        self.assertGreater(profiler.stage(ForwardStageTest).peak, 0)
+        self.assertGreater(profiler.stage(ForwardStageTest).allocated, 0)
+
+    def test_top_fields(self):
+        top = self._profiler.top_fields(3)
+
+        self.assertEqual([field.name for field in top], ["X", "X", "X"])
+        self.assertTrue(all(field.persistent for field in top))
+        self.assertGreaterEqual(top[0].max, LARGE)
+
+    def test_artifact_fields(self):
+        fields = {
+            (field.stage, field.name)
+            for field in self._profiler.top_fields(None)
+            if field.role == "artifact"
+        }
+
+        self.assertIn((InitStageTest, "B"), fields)
+        self.assertIn((ForwardStageTest, "Y"), fields)
+
+    def test_large_persistent_fields(self):
+        self.assertEqual(
+            self._profiler.large_persistent_fields(),
+            {"X": ["InitStageTest", "ForwardStageTest", "TerminalStageTest"]},
+        )
+
+    def test_tables(self):
+        self.assertEqual(self._profiler.to_table().row_count, 3)
+        self.assertEqual(self._profiler.fields_table(5).row_count, 5)
+
+    def test_close(self):
+        self._controller.close()
+
+        self.assertFalse(tracemalloc.is_tracing())
@@ -0,0 +1,96 @@
+# External imports
+import unittest
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Local imports
+from ror.controlers import BaseController
+from ror.profilers import TimingProfiler
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IBatchStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest], IBatchStage):
+    def compute_batch(self) -> None:
+        self._outputs = [input.get_carry() for input in self.inputs]
+
+    def get_batch_output(self) -> List[OutputTest]:
+        return [OutputTest(**output) for output in self._outputs]
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, TerminalStageTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+"""============================== TEST CASES =============================="""
+
+
+class TimingProfilerTestCase(unittest.TestCase):
+    """Test case for the timings recorded by a controller"""
+
+    def setUp(self) -> None:
+        self._profiler = TimingProfiler(buffer_size=2)
+        self._controller = BaseController(
+            InputTest(A=1, B="B"), InitStageTest, profiler=self._profiler
+        )
+
+    def test_start(self):
+        self._controller.start()
+        self._controller.start()
+
+        for phase in ("set_input", "compute", "get_output", "artifact"):
+            timings = self._profiler.timings(InitStageTest, phase)
+
+            self.assertEqual(timings.calls, 2)
+            self.assertEqual(timings.records, 2)
+            self.assertGreaterEqual(timings.wall, 0)
+            self.assertLessEqual(timings.p50, timings.p99)
+
+    def test_batch(self):
+        self._controller.map([InputTest(A=i, B="B") for i in range(5)])
+        timings = self._profiler.timings(TerminalStageTest, "compute")
+
+        self.assertEqual(timings.calls, 1)
+        self.assertEqual(timings.records, 5)
+        self.assertEqual(self._profiler.stages(), [InitStageTest, TerminalStageTest])
+
+    def test_summary(self):
+        self._controller.start()
+        summary = self._profiler.summary()
+
+        self.assertEqual(list(summary), ["InitStageTest", "TerminalStageTest"])
+        self.assertEqual(summary["InitStageTest"]["compute"]["calls"], 1)
+        self.assertIn("p99", summary["TerminalStageTest"]["get_output"])
+
+    def test_reset(self):
+        self._controller.start()
+        self._profiler.reset()
+
+        self.assertEqual(self._profiler.stages(), [])
+
+    def test_table(self):
+        self._controller.start()
+
+        self.assertEqual(self._profiler.to_table().row_count, 8)
+
+    def test_report_without_profiler(self):
+        with self.assertRaises(ValueError):
+            BaseController(InputTest(A=1, B="B"), InitStageTest).report()
@@ -0,0 +1,178 @@
+# External imports
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.controlers import AsyncController, BaseController, ThreadedController
+from ror.profilers import TraceProfiler
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IAsyncForwardStage, IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: int = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> OutputTest:
+        return OutputTest(**self._output)
+
+
+class AsyncForwardStageTest(
+    IAsyncForwardStage[OutputTest, OutputTest, TerminalStageTest]
+):
+    async def compute(self) -> None:
+        await asyncio.sleep(0.01)
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+class InitStageTest(IInitStage[InputTest, OutputTest, TerminalStageTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), OutputTest(**self._output)
+
+
+class AsyncInitStageTest(IInitStage[InputTest, OutputTest, AsyncForwardStageTest]):
+    def compute(self) -> None:
+        self._output = self.input.get_carry()
+
+    def get_output(self) -> Tuple[AsyncForwardStageTest, OutputTest]:
+        return AsyncForwardStageTest(), OutputTest(**self._output)
+
+
+def spans(tracer: TraceProfiler) -> list:
+    return [event for event in tracer.events() if event["ph"] == "X"]
+
+
+"""============================== TEST CASES =============================="""
+
+
+class TraceProfilerTestCase(unittest.TestCase):
+    """Test case for the Chrome trace of the phases recorded by the controllers"""
+
+    def setUp(self) -> None:
+        self._tracer = TraceProfiler()
+
+    def test_start(self):
+        controller = BaseController(
+            InputTest(A=1, B="B"), InitStageTest, profiler=self._tracer
+        )
+        _, run_id = controller.start()
+        events = spans(self._tracer)
+
+        self.assertEqual(
+            [event["name"] for event in events[:4]],
+            [
+                "InitStageTest.artifact",
+                "InitStageTest.set_input",
+                "InitStageTest.compute",
+                "InitStageTest.get_output",
+            ],
+        )
+        for event in events:
+            self.assertEqual(event["args"]["run_ids"], (run_id,))
+            self.assertEqual(event["pid"], os.getpid())
+            self.assertGreaterEqual(event["ts"], 0)
+
+        self.assertGreater(events[1]["args"]["bytes"], 0)
+        self.assertNotIn("bytes", events[2]["args"])
+
+    def test_batch(self):
+        controller = BaseController(None, InitStageTest, profiler=self._tracer)
+        results = controller.start_batch([InputTest(A=i, B="B") for i in range(3)])
+        run_ids = tuple(run_id for _, run_id in results)
+
+        computes = [e for e in spans(self._tracer) if e["cat"] == "compute"]
+        self.assertEqual(
+            [e["args"]["run_ids"] for e in computes[:3]],
+            [run_ids[:1], run_ids[1:2], run_ids[2:]],
+        )
+
+    def test_threaded(self):
+        controller = ThreadedController(None, InitStageTest, profiler=self._tracer)
+        results = controller.start_batch([InputTest(A=i, B="B") for i in range(4)])
+        events = self._tracer.events()
+
+        names = {e["args"]["name"] for e in events if e["name"] == "thread_name"}
+        self.assertGreaterEqual(len(names), 2)
+
+        traced = {
+            run_id for e in events if e["ph"] == "X" for run_id in e["args"]["run_ids"]
+        }
+        self.assertEqual(traced, {run_id for _, run_id in results})
+
+    def test_async_tasks(self):
+        controller = AsyncController(
+            None, AsyncInitStageTest, concurrency=4, profiler=self._tracer
+        )
+        asyncio.run(controller.map([InputTest(A=i, B="B") for i in range(4)]))
+
+        awaited = [
+            e
+            for e in spans(self._tracer)
+            if e["name"] == "AsyncForwardStageTest.compute"
+        ]
+        self.assertEqual(len({e["tid"] for e in awaited}), 4)
+
+        # The awaited computations of the runs overlap in time
+        first, second = sorted(awaited, key=lambda e: e["ts"])[:2]
+        self.assertLess(second["ts"], first["ts"] + first["dur"])
+
+    def test_write(self):
+        controller = BaseController(
+            InputTest(A=1, B="B"), InitStageTest, profiler=self._tracer
+        )
+        controller.start()
+
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "trace.json")
+            self._tracer.write(path)
+
+            with open(path) as file:
+                trace = json.load(file)
+
+        self.assertEqual(len(trace["traceEvents"]), len(self._tracer.events()))
+        self.assertEqual(trace["displayTimeUnit"], "ms")
+
+    def test_table_and_reset(self):
+        controller = BaseController(
+            InputTest(A=1, B="B"), InitStageTest, profiler=self._tracer
+        )
+        controller.start()
+
+        self.assertEqual(self._tracer.to_table().row_count, 1)
+
+        self._tracer.reset()
+        self.assertEqual(self._tracer.events(), [])
+
+    def test_max_spans(self):
+        tracer = TraceProfiler(max_spans=2)
+        BaseController(InputTest(A=1, B="B"), InitStageTest, profiler=tracer).start()
+
+        self.assertEqual(len(spans(tracer)), 2)
+
+        with self.assertRaises(ValueError):
+            TraceProfiler(max_spans=0)
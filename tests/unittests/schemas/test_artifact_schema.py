@@ -1,4 +1,5 @@
 # External imports
+import pickle
 import unittest
 from dataclasses import dataclass
 
@@ -65,3 +66,51 @@ class StandardFieldsTestCase(unittest.TestCase):
 
     def test_standard_fields(self):
         self.assertEqual(self._dataclass.get_standard_fields(), ["source_schema"])
+
+
+class ArtifactClassCacheTestCase(unittest.TestCase):
+    """Test case to ensure the artifact class is generated once per schema"""
+
+    @dataclass
+    class TestDataclass(BaseSchema):
+        A: str = field_perishable()
+        B: str = field_persistance()
+
+    @dataclass
+    class OtherDataclass(BaseSchema):
+        A: str = field_perishable()
+
+    def setUp(self) -> None:
+        self._data = {"A": "A", "B": "B"}
+
+    def test_same_class(self):
+        first = self.TestDataclass(**self._data).get_artifact()
+        second = self.TestDataclass(**self._data).get_artifact()
+
+        self.assertIs(type(first), type(second))
+        self.assertEqual(first, second)
+
+    def test_class_per_schema(self):
+        artifact = self.TestDataclass(**self._data).get_artifact()
+        other = self.OtherDataclass(A="A").get_artifact()
+
+        self.assertIsNot(type(artifact), type(other))
+
+
+class ArtifactPickleTestCase(unittest.TestCase):
+    """Test case to ensure artifacts can be pickled and unpickled"""
+
+    @dataclass
+    class TestDataclass(BaseSchema):
+        A: str = field_perishable()
+        B: str = field_persistance()
+
+    def setUp(self) -> None:
+        self._artifact = self.TestDataclass(A="A", B="B").get_artifact()
+
+    def test_pickle(self):
+        artifact = pickle.loads(pickle.dumps(self._artifact))
+
+        self.assertIs(type(artifact), type(self._artifact))
+        self.assertIs(artifact.source_schema, self.TestDataclass)
+        self.assertEqual(artifact.A, "A")
@@ -284,3 +284,51 @@ class PrivateDelFieldsTestCase(unittest.TestCase):
         self.assertTrue(len(set(_del_fields).intersection(set(_remainder))) == 0)
         self.assertSetEqual(set(_remainder.keys()), set(["B"]))
         self.assertEqual(_remainder["B"], self._data["B"])
+
+
+class CarryToTestCase(unittest.TestCase):
+    """Testcase for constructing the next schema from an instance"""
+
+    @dataclass
+    class SourceDataclass(BaseSchema):
+        A: str = field_persistance()
+        B: str = field_persistance()
+        C: str = field_perishable()
+
+    @dataclass
+    class TargetDataclass(BaseSchema):
+        A: str = field_persistance()
+        D: str = field_persistance()
+        E: str = field_persistance(default="E")
+
+    def setUp(self) -> None:
+        self._dataclass = self.SourceDataclass(A="A", B="B", C="C")
+
+    def test_carry_to(self):
+        _target = self._dataclass.carry_to(self.TargetDataclass, D="D")
+
+        self.assertIsInstance(_target, self.TargetDataclass)
+        self.assertEqual(_target, self.TargetDataclass(A="A", D="D", E="E"))
+
+    def test_carry_to_override(self):
+        _target = self._dataclass.carry_to(self.TargetDataclass, A="Z", D="D", E="Y")
+
+        self.assertEqual(_target, self.TargetDataclass(A="Z", D="D", E="Y"))
+        self.assertEqual(self._dataclass.A, "A")
+
+    def test_carry_to_same_schema(self):
+        _target = self._dataclass.carry_to(self.SourceDataclass, C="D")
+
+        self.assertEqual(_target, self.SourceDataclass(A="A", B="B", C="D"))
+
+    def test_carry_to_missing_field(self):
+        with self.assertRaises(TypeError):
+            self._dataclass.carry_to(self.TargetDataclass)
+
+    def test_carry_to_unknown_field(self):
+        with self.assertRaises(TypeError):
+            self._dataclass.carry_to(self.TargetDataclass, D="D", F="F")
+
+    def test_carry_to_not_schema(self):
+        with self.assertRaises(TypeError):
+            self._dataclass.carry_to(dict, D="D")
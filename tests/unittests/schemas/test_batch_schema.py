@@ -0,0 +1,122 @@
+# External imports
+import pickle
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.controlers import BaseController
+from ror.schemas import ArtifactSchema, BaseSchema, BatchSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IBatchStage, IInitStage, ITerminalStage
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+"""=============================== TEST DATA =============================="""
+
+
+# Column type of the array fields, lists when numpy is not installed
+ARRAY = list if np is None else np.ndarray
+
+
+@dataclass
+class RecordTest(BaseSchema):
+    A: int = field_persistance()
+    X: ARRAY = field_persistance()
+    B: str = field_perishable()
+
+
+@dataclass
+class OutputTest(BaseSchema):
+    A: int = field_persistance()
+    X: ARRAY = field_persistance()
+    Y: float = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def get_output(self) -> OutputTest:
+        return self.input
+
+
+class ColumnStageTest(
+    IInitStage[RecordTest, OutputTest, TerminalStageTest], IBatchStage
+):
+    def compute_batch(self) -> None:
+        self._batch = self.get_columns()
+        self._y = self._batch.X.sum(axis=1) * self._batch.A
+
+    def get_batch_output(self) -> Tuple[TerminalStageTest, BatchSchema]:
+        output = BatchSchema.of(OutputTest)
+        return TerminalStageTest(), self._batch.carry_to(output, Y=self._y)
+
+
+"""============================== TEST CASES =============================="""
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class BatchSchemaTestCase(unittest.TestCase):
+    """Test case for the columnar batches of a schema"""
+
+    def setUp(self) -> None:
+        self._records = [
+            RecordTest(A=i, X=np.full(3, float(i)), B=str(i)) for i in range(4)
+        ]
+        self._batch = BatchSchema.of(RecordTest).from_records(self._records)
+
+    def test_generated(self):
+        batch_class = BatchSchema.of(RecordTest)
+
+        self.assertIs(BatchSchema.of(RecordTest), batch_class)
+        self.assertTrue(issubclass(batch_class, BatchSchema))
+        self.assertIs(batch_class.record_schema, RecordTest)
+        self.assertEqual(batch_class._layout.persistent_order, ("A", "X"))
+        self.assertEqual(batch_class._layout.perishable_order, ("B",))
+
+    def test_columns(self):
+        self.assertEqual(len(self._batch), 4)
+        self.assertIsInstance(self._batch.A, np.ndarray)
+        self.assertEqual(self._batch.X.shape, (4, 3))
+        self.assertEqual(self._batch.B, ["0", "1", "2", "3"])
+
+    def test_carry_and_artifact(self):
+        carry = self._batch.get_carry()
+        artifact = self._batch.get_artifact()
+
+        self.assertIs(carry["X"], self._batch.X)
+        self.assertIsInstance(artifact, ArtifactSchema)
+        self.assertIs(artifact.B, self._batch.B)
+
+    def test_to_records(self):
+        records = self._batch.to_records()
+
+        self.assertEqual([r.A for r in records], [0, 1, 2, 3])
+        self.assertIs(type(records[0].A), int)
+        np.testing.assert_array_equal(records[2].X, self._records[2].X)
+
+    def test_ragged(self):
+        records = [RecordTest(A=i, X=np.zeros(i + 1), B="") for i in range(2)]
+        batch = BatchSchema.of(RecordTest).from_records(records)
+
+        self.assertIsInstance(batch.X, list)
+
+    def test_pickle(self):
+        batch = pickle.loads(pickle.dumps(self._batch))
+
+        self.assertIsInstance(batch, BatchSchema.of(RecordTest))
+        np.testing.assert_array_equal(batch.X, self._batch.X)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            BatchSchema.of(int)
+        with self.assertRaises(TypeError):
+            BatchSchema.of(BatchSchema.of(RecordTest))
+
+    def test_stage(self):
+        controller = BaseController(None, ColumnStageTest)
+        outputs = controller.map(self._records)
+
+        self.assertEqual([output.Y for output in outputs], [0.0, 3.0, 12.0, 27.0])
+        self.assertTrue(all(isinstance(output, OutputTest) for output in outputs))
@@ -0,0 +1,89 @@
+# External imports
+import unittest
+from dataclasses import dataclass
+
+# Local imports
+from ror.schemas import BaseSchema, SchemaLayout
+from ror.schemas.fields import field_perishable, field_persistance
+
+
+@dataclass
+class ParentTest(BaseSchema):
+    A: str = field_persistance()
+    B: int = field_perishable()
+
+
+@dataclass
+class ChildTest(ParentTest):
+    C: list = field_persistance()
+
+
+class StageTest:
+    pass
+
+
+@dataclass
+class PerishTest(BaseSchema):
+    A: str = field_persistance(perish_stage="StageTest")
+    B: int = field_perishable(perish_stage=StageTest)
+    C: int = field_persistance()
+
+
+class LayoutTestCase(unittest.TestCase):
+    """Test case for the precomputed layout of a schema class"""
+
+    def setUp(self) -> None:
+        self._layout = ParentTest._layout
+
+    def test_layout(self):
+        self.assertIsInstance(self._layout, SchemaLayout)
+        self.assertEqual(self._layout.names, ("A", "B"))
+        self.assertEqual(self._layout.persistent, frozenset(["A"]))
+        self.assertEqual(self._layout.perishable, frozenset(["B"]))
+        self.assertEqual(self._layout.types["B"], int)
+
+    def test_cached(self):
+        self.assertIs(ParentTest._layout, self._layout)
+        self.assertIs(ParentTest(A="A", B=1)._layout, self._layout)
+
+    def test_immutable(self):
+        with self.assertRaises(TypeError):
+            self._layout.types["A"] = int
+        with self.assertRaises(AttributeError):
+            ParentTest(A="A", B=1)._layout = None
+
+
+class PerishStageTestCase(unittest.TestCase):
+    """Test case for the perish stages declared by the fields"""
+
+    def test_perish_stages(self):
+        self.assertEqual(
+            dict(PerishTest._layout.perish_stages), {"A": "StageTest", "B": "StageTest"}
+        )
+        self.assertEqual(dict(ParentTest._layout.perish_stages), {})
+
+
+class InheritedLayoutTestCase(unittest.TestCase):
+    """Test case that subclasses get their own layout"""
+
+    def test_child_layout(self):
+        self.assertIsNot(ChildTest._layout, ParentTest._layout)
+        self.assertEqual(ChildTest._layout.names, ("A", "B", "C"))
+        self.assertEqual(ChildTest._layout.persistent_order, ("A", "C"))
+        self.assertIsNot(
+            ChildTest._layout.artifact_class, ParentTest._layout.artifact_class
+        )
+
+
+class ValidateRetireTestCase(unittest.TestCase):
+    """Test case for validating fields to retire against the layout"""
+
+    def setUp(self) -> None:
+        self._dataclass = ParentTest(A="A", B=1)
+
+    def test_valid(self):
+        self._dataclass._validate_retire({"A", "B"})
+
+    def test_invalid(self):
+        with self.assertRaises(Exception):
+            self._dataclass._validate_retire({"A", "D"})
@@ -0,0 +1,122 @@
+# External imports
+import copy
+import pickle
+import sys
+import unittest
+from dataclasses import dataclass
+from typing import Tuple
+
+# Local imports
+from ror.controlers import BaseController
+from ror.schemas import ArtifactSchema, BaseSchema, slotted_schema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stages import IInitStage, ITerminalStage
+
+"""=============================== TEST DATA =============================="""
+
+
+@slotted_schema
+@dataclass
+class SlottedTest(BaseSchema):
+    A: str = field_persistance()
+    B: int = field_perishable()
+    C: list = field_persistance(default_factory=list)
+
+
+@slotted_schema
+@dataclass
+class SlottedChildTest(SlottedTest):
+    D: int = field_persistance(default=0)
+
+
+@slotted_schema
+@dataclass
+class OutputTest(BaseSchema):
+    A: str = field_persistance()
+    C: list = field_persistance()
+    E: int = field_persistance()
+
+
+class TerminalStageTest(ITerminalStage[OutputTest, OutputTest]):
+    def get_output(self) -> OutputTest:
+        return self.input.carry_to(OutputTest, E=self.input.E + 1)
+
+
+class InitStageTest(IInitStage[SlottedTest, OutputTest, TerminalStageTest]):
+    def get_output(self) -> Tuple[TerminalStageTest, OutputTest]:
+        return TerminalStageTest(), self.input.carry_to(OutputTest, E=self.input.B)
+
+
+"""============================== TEST CASES =============================="""
+
+
+class SlottedSchemaTestCase(unittest.TestCase):
+    """Test case for schemas storing their fields in slots"""
+
+    def setUp(self) -> None:
+        self._dataclass = SlottedTest(A="A", B=1)
+
+    def test_no_dict(self):
+        self.assertFalse(hasattr(self._dataclass, "__dict__"))
+        self.assertTrue(SlottedTest._layout.slotted)
+        self.assertEqual(SlottedTest.__slots__, ("A", "B", "C"))
+        self.assertEqual(self._dataclass, SlottedTest(A="A", B=1, C=[]))
+
+    def test_inherited(self):
+        child = SlottedChildTest(A="A", B=1)
+
+        self.assertFalse(hasattr(child, "__dict__"))
+        self.assertEqual(SlottedChildTest.__slots__, ("D",))
+        self.assertEqual(child.get_carry(), {"A": "A", "C": [], "D": 0})
+
+    def test_carry_and_artifact(self):
+        artifact = self._dataclass.get_artifact()
+
+        self.assertEqual(self._dataclass.get_carry(), {"A": "A", "C": []})
+        self.assertIsInstance(artifact, ArtifactSchema)
+        self.assertEqual(artifact.B, 1)
+        self.assertEqual(self._dataclass._del_fields(["B", "C"]), {"A": "A"})
+
+    def test_validate_retire(self):
+        self._dataclass._validate_retire({"A", "B"})
+
+        with self.assertRaises(Exception):
+            self._dataclass._validate_retire({"Z"})
+
+    def test_copy_and_pickle(self):
+        self.assertEqual(copy.copy(self._dataclass), self._dataclass)
+        self.assertEqual(pickle.loads(pickle.dumps(self._dataclass)), self._dataclass)
+
+    def test_dict_backed_unchanged(self):
+        @dataclass
+        class DictTest(BaseSchema):
+            A: str = field_persistance()
+
+        self.assertFalse(DictTest._layout.slotted)
+        self.assertEqual(DictTest(A="A").__dict__, {"A": "A"})
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            slotted_schema(int)
+        with self.assertRaises(TypeError):
+            slotted_schema(SlottedTest)
+
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10")
+    def test_dataclass_slots(self):
+        @dataclass(slots=True)
+        class NativeTest(BaseSchema):
+            A: str = field_persistance()
+            B: int = field_perishable()
+
+        native = NativeTest(A="A", B=1)
+
+        self.assertFalse(hasattr(native, "__dict__"))
+        self.assertEqual(native.get_carry(), {"A": "A"})
+        self.assertEqual(native.get_artifact().B, 1)
+
+    def test_pipeline(self):
+        controller = BaseController(SlottedTest(A="A", B=1), InitStageTest)
+        output, run_id = controller.start()
+
+        self.assertEqual(output, OutputTest(A="A", C=[], E=2))
+        self.assertEqual(controller.get_artifacts(run_id)["InitStageTest"].B, 1)
@@ -0,0 +1,199 @@
+# External imports
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+from dataclasses import dataclass
+from unittest import mock
+
+# Local imports
+from ror.schemas import ArtifactSchema, BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stores import DiskArtifactStore, LazyArtifact
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: str = field_persistance()
+    B: object = field_perishable()
+    C: object = field_perishable()
+
+
+class DiskStoreTestCase(unittest.TestCase):
+    """Test case for writing and lazily reading artifacts from disk"""
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self._store = DiskArtifactStore(self._dir.name)
+        self._store.put("run", "Stage", InputTest(A="A", B="B", C=[1]).get_artifact())
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_lazy_get(self):
+        artifact = self._store.get("run")["Stage"]
+
+        self.assertIsInstance(artifact, LazyArtifact)
+        self.assertIsInstance(artifact, ArtifactSchema)
+        self.assertNotIn("B", artifact.__dict__)
+        self.assertEqual(artifact.B, "B")
+        self.assertEqual(artifact.C, [1])
+        self.assertIs(artifact.source_schema, InputTest)
+        self.assertListEqual(artifact.field_names(), ["B", "C"])
+
+    def test_load(self):
+        artifact = self._store.get("run")["Stage"].load()
+
+        self.assertEqual(artifact, InputTest(A="A", B="B", C=[1]).get_artifact())
+
+    def test_missing_field(self):
+        with self.assertRaises(AttributeError):
+            self._store.get("run")["Stage"].A
+
+    def test_pickle(self):
+        artifact = pickle.loads(pickle.dumps(self._store.get("run")["Stage"]))
+
+        self.assertEqual(artifact.B, "B")
+
+    def test_reopen(self):
+        store = DiskArtifactStore(self._dir.name)
+
+        self.assertListEqual(store.run_ids(), ["run"])
+        self.assertEqual(store.get("run")["Stage"].B, "B")
+
+    def test_evict(self):
+        self._store.evict("run")
+
+        self.assertEqual(self._store.get("run"), {})
+        self.assertFalse(os.path.exists(os.path.join(self._dir.name, "run")))
+
+    def test_unsafe_run_id(self):
+        artifact = InputTest(A="A", B="B", C=None).get_artifact()
+
+        for run_id in ["../x", "a/b", ".hidden", "", None]:
+            with self.assertRaises(ValueError):
+                self._store.put(run_id, "Stage", artifact)
+
+        self.assertListEqual(os.listdir(self._dir.name), ["run"])
+
+    def test_overwrite(self):
+        self._store.put("run", "Stage", InputTest(A="A", B="D", C=[2]).get_artifact())
+
+        self.assertEqual(self._store.get("run")["Stage"].B, "D")
+        self.assertEqual(len(os.listdir(os.path.join(self._dir.name, "run"))), 1)
+        self.assertEqual(DiskArtifactStore(self._dir.name).get("run")["Stage"].B, "D")
+
+    def test_concurrent_puts(self):
+        def put(i: int) -> None:
+            for stage in range(4):
+                artifact = InputTest(A="A", B=i, C=[stage]).get_artifact()
+                self._store.put(f"run-{i}", f"Stage{stage}", artifact)
+
+        threads = [threading.Thread(target=put, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        store = DiskArtifactStore(self._dir.name)
+        for i in range(8):
+            artifacts = store.get(f"run-{i}")
+            self.assertListEqual(list(artifacts), [f"Stage{s}" for s in range(4)])
+            self.assertEqual([a.C for a in artifacts.values()], [[0], [1], [2], [3]])
+
+
+class DiskStoreMaxRunsTestCase(unittest.TestCase):
+    """Test case for deleting the oldest runs over the max number of runs"""
+
+    def test_max_runs(self):
+        with tempfile.TemporaryDirectory() as root:
+            store = DiskArtifactStore(root, max_runs=1)
+            artifact = InputTest(A="A", B="B", C=None).get_artifact()
+            store.put("a", "Stage", artifact)
+            store.put("b", "Stage", artifact)
+
+            self.assertListEqual(store.run_ids(), ["b"])
+            self.assertListEqual(os.listdir(root), ["b"])
+
+    def test_evicted_while_written(self):
+        with tempfile.TemporaryDirectory() as root:
+            store = DiskArtifactStore(root, max_runs=1)
+            artifact = InputTest(A="A", B="B", C=None).get_artifact()
+            write = store._write
+
+            def evicting_write(path: str, artifact: ArtifactSchema) -> None:
+                # A concurrent put of another run evicts this one
+                if "b" not in store.run_ids():
+                    store.put("b", "Stage", artifact)
+                write(path, artifact)
+
+            with mock.patch.object(store, "_write", side_effect=evicting_write):
+                store.put("a", "Stage", artifact)
+
+            self.assertListEqual(store.run_ids(), ["b"])
+            self.assertListEqual(os.listdir(root), ["b"])
+
+    def test_concurrent_evictions(self):
+        with tempfile.TemporaryDirectory() as root:
+            store = DiskArtifactStore(root, max_runs=2)
+            artifact = InputTest(A="A", B="B", C=None).get_artifact()
+            errors = []
+
+            def put(i: int) -> None:
+                try:
+                    for j in range(10):
+                        store.put(f"run-{i}-{j}", "Stage", artifact)
+                except Exception as exception:
+                    errors.append(exception)
+
+            threads = [threading.Thread(target=put, args=(i,)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(errors, [])
+            self.assertEqual(len(store.run_ids()), 2)
+            self.assertListEqual(sorted(os.listdir(root)), sorted(store.run_ids()))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class DiskStoreArrayTestCase(unittest.TestCase):
+    """Test case for arrays being written raw and memory-mapped when read"""
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self._store = DiskArtifactStore(self._dir.name)
+        self._array = numpy.arange(12, dtype=numpy.float32).reshape(3, 4)
+        self._store.put(
+            "run",
+            "Stage",
+            InputTest(
+                A="A", B=self._array.T, C=numpy.array(["a"], dtype=object)
+            ).get_artifact(),
+        )
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_memmap(self):
+        artifact = self._store.get("run")["Stage"]
+
+        self.assertIsInstance(artifact.B, numpy.memmap)
+        numpy.testing.assert_array_equal(artifact.B, self._array.T)
+        self.assertFalse(artifact.B.flags.writeable)
+
+    def test_object_array(self):
+        artifact = self._store.get("run")["Stage"]
+
+        self.assertNotIsInstance(artifact.C, numpy.memmap)
+        self.assertListEqual(list(artifact.C), ["a"])
+
+    def test_nbytes(self):
+        self.assertGreaterEqual(self._store.nbytes(), self._array.nbytes)
@@ -0,0 +1,119 @@
+# External imports
+import unittest
+from dataclasses import dataclass
+from unittest import mock
+
+# Local imports
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stores import MemoryArtifactStore
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: str = field_persistance()
+    B: str = field_perishable()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class PutGetTestCase(unittest.TestCase):
+    """Test case for storing and retrieving artifacts"""
+
+    def setUp(self) -> None:
+        self._store = MemoryArtifactStore()
+        self._artifact = InputTest(A="A", B="B").get_artifact()
+        self._store.put("run", "Stage", self._artifact)
+
+    def test_get(self):
+        self.assertEqual(self._store.get("run"), {"Stage": self._artifact})
+        self.assertEqual(self._store.get("missing"), {})
+
+    def test_size(self):
+        self.assertEqual(len(self._store), 1)
+        self.assertIn("run", self._store)
+        self.assertGreater(self._store.nbytes(), 0)
+
+    def test_unbounded_not_sized(self):
+        sizer = "ror.stores.memory_artifact_store.deep_sizeof"
+
+        with mock.patch(sizer, return_value=1) as deep_sizeof:
+            for i in range(3):
+                self._store.put(f"run{i}", "InitStage", self._artifact)
+
+            deep_sizeof.assert_not_called()
+            self.assertEqual(self._store.nbytes(), 4)
+
+    def test_evict(self):
+        self._store.evict("run")
+
+        self.assertEqual(self._store.get("run"), {})
+        self.assertEqual(self._store.nbytes(), 0)
+
+
+class MaxRunsTestCase(unittest.TestCase):
+    """Test case for evicting runs over the max number of runs"""
+
+    def setUp(self) -> None:
+        self._artifact = InputTest(A="A", B="B").get_artifact()
+
+    def test_lru(self):
+        store = MemoryArtifactStore(max_runs=2)
+        store.put("a", "Stage", self._artifact)
+        store.put("b", "Stage", self._artifact)
+        store.get("a")
+        store.put("c", "Stage", self._artifact)
+
+        self.assertListEqual(store.run_ids(), ["a", "c"])
+
+    def test_fifo(self):
+        store = MemoryArtifactStore(max_runs=2, lru=False)
+        store.put("a", "Stage", self._artifact)
+        store.put("b", "Stage", self._artifact)
+        store.get("a")
+        store.put("c", "Stage", self._artifact)
+
+        self.assertListEqual(store.run_ids(), ["b", "c"])
+
+
+class MaxBytesTestCase(unittest.TestCase):
+    """Test case for evicting runs over the max number of bytes"""
+
+    def test_max_bytes(self):
+        big = InputTest(A="A", B="B" * 10_000).get_artifact()
+        store = MemoryArtifactStore(max_bytes=15_000)
+        store.put("a", "Stage", big)
+        store.put("b", "Stage", big)
+
+        self.assertListEqual(store.run_ids(), ["b"])
+        self.assertLessEqual(store.nbytes(), 15_000)
+
+    def test_keeps_latest_run(self):
+        big = InputTest(A="A", B="B" * 10_000).get_artifact()
+        store = MemoryArtifactStore(max_bytes=10)
+        store.put("a", "Stage", big)
+
+        self.assertListEqual(store.run_ids(), ["a"])
+
+
+class TTLTestCase(unittest.TestCase):
+    """Test case for expiring runs older than the ttl"""
+
+    def test_ttl(self):
+        clock = FakeClock()
+        store = MemoryArtifactStore(ttl=10, clock=clock)
+        artifact = InputTest(A="A", B="B").get_artifact()
+
+        store.put("a", "Stage", artifact)
+        clock.now = 5
+        store.put("b", "Stage", artifact)
+        clock.now = 12
+
+        self.assertListEqual(store.run_ids(), ["b"])
+        self.assertEqual(store.get("a"), {})
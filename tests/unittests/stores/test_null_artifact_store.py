@@ -0,0 +1,28 @@
+# External imports
+import unittest
+from dataclasses import dataclass
+
+# Local imports
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.stores import NullArtifactStore
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: str = field_persistance()
+    B: str = field_perishable()
+
+
+class NullStoreTestCase(unittest.TestCase):
+    """Test case that the null store retains nothing"""
+
+    def setUp(self) -> None:
+        self._store = NullArtifactStore()
+        self._store.put("run", "Stage", InputTest(A="A", B="B").get_artifact())
+
+    def test_empty(self):
+        self.assertFalse(self._store.enabled)
+        self.assertEqual(self._store.get("run"), {})
+        self.assertEqual(len(self._store), 0)
+        self.assertEqual(self._store.nbytes(), 0)
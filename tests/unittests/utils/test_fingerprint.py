@@ -0,0 +1,63 @@
+# External imports
+import unittest
+from dataclasses import dataclass
+
+# Local imports
+from ror.schemas import BaseSchema
+from ror.schemas.fields import field_perishable, field_persistance
+from ror.utils.fingerprint import fingerprint, stage_fingerprint
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@dataclass
+class InputTest(BaseSchema):
+    A: object = field_persistance()
+    B: object = field_perishable()
+
+
+class VersionedStage:
+    version = "1"
+
+
+class FingerprintTestCase(unittest.TestCase):
+    """Test case for the stable hashes of values"""
+
+    def test_equal_values(self):
+        self.assertEqual(fingerprint({"a": 1, "b": 2}), fingerprint({"b": 2, "a": 1}))
+        self.assertEqual(
+            fingerprint(InputTest(A=[1, 2], B="B")),
+            fingerprint(InputTest(A=[1, 2], B="B")),
+        )
+
+    def test_different_values(self):
+        self.assertNotEqual(fingerprint(1), fingerprint(True))
+        self.assertNotEqual(fingerprint(1), fingerprint("1"))
+        self.assertNotEqual(fingerprint([1, 2]), fingerprint((1, 2)))
+        self.assertNotEqual(
+            fingerprint(InputTest(A=1, B="B")), fingerprint(InputTest(A=1, B="C"))
+        )
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_arrays(self):
+        array = numpy.arange(6)
+
+        self.assertEqual(fingerprint(array[::2]), fingerprint(numpy.array([0, 2, 4])))
+        self.assertNotEqual(fingerprint(array), fingerprint(array.astype(float)))
+        self.assertNotEqual(fingerprint(array), fingerprint(array.reshape(2, 3)))
+
+
+class StageFingerprintTestCase(unittest.TestCase):
+    """Test case for the hashes of stage versions"""
+
+    def test_version(self):
+        class Other:
+            version = "1"
+
+        self.assertNotEqual(stage_fingerprint(VersionedStage), stage_fingerprint(Other))
+        self.assertEqual(
+            stage_fingerprint(VersionedStage), stage_fingerprint(VersionedStage)
+        )
@@ -0,0 +1,52 @@
+# External imports
+import pickle
+import unittest
+from multiprocessing import shared_memory
+
+# Local imports
+from ror.utils import shm_pickle
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class InBandTestCase(unittest.TestCase):
+    """Test case for objects without shareable arrays"""
+
+    def test_roundtrip(self):
+        data, segments = shm_pickle.dumps({"a": [1, 2, "3"]})
+
+        self.assertListEqual(segments, [])
+        self.assertEqual(shm_pickle.loads(data), {"a": [1, 2, "3"]})
+        self.assertEqual(pickle.loads(data), {"a": [1, 2, "3"]})
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class SharedArrayTestCase(unittest.TestCase):
+    """Test case for arrays handed over through shared memory"""
+
+    def setUp(self) -> None:
+        self._array = numpy.arange(10_000, dtype=numpy.float64)
+
+    def test_roundtrip(self):
+        data, segments = shm_pickle.dumps({"x": self._array}, threshold=1024)
+        loaded = shm_pickle.loads(data)["x"]
+        shm_pickle.unlink(segments)
+
+        self.assertEqual(len(segments), 1)
+        self.assertLess(len(data), self._array.nbytes)
+        numpy.testing.assert_array_equal(loaded, self._array)
+
+    def test_small_arrays_in_band(self):
+        _, segments = shm_pickle.dumps(self._array[:10], threshold=1024)
+
+        self.assertListEqual(segments, [])
+
+    def test_unlink(self):
+        _, segments = shm_pickle.dumps(self._array, threshold=1024)
+        shm_pickle.unlink(segments)
+
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=segments[0])
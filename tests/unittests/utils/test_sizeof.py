@@ -0,0 +1,24 @@
+# External imports
+import sys
+import unittest
+
+# Local imports
+from ror.utils.sizeof import deep_sizeof
+
+
+class DeepSizeofTestCase(unittest.TestCase):
+    """Test case for the deep size estimate of objects"""
+
+    def test_containers(self):
+        payload = "x" * 1000
+
+        self.assertGreater(deep_sizeof([payload]), sys.getsizeof(payload))
+        self.assertGreater(deep_sizeof({"a": payload}), sys.getsizeof(payload))
+
+    def test_shared_references(self):
+        payload = "x" * 1000
+
+        self.assertLess(deep_sizeof([payload, payload]), 2 * sys.getsizeof(payload))
+
+    def test_skips_classes(self):
+        self.assertEqual(deep_sizeof([int]), sys.getsizeof([int], 0))